@@ -0,0 +1,12 @@
+"""
+Benchmark suite for Collection and CollectionMap.
+
+Run from the repository root:
+
+    python -m benchmarks                      # 1e3 and 1e5 items, all datasets
+    python -m benchmarks --sizes 1e3 1e5 1e6  # full run
+    python -m benchmarks --save-baseline      # record benchmarks/baseline.json
+    python -m benchmarks --baseline benchmarks/baseline.json --threshold 0.25
+
+See `python -m benchmarks --help` for all options.
+"""
@@ -0,0 +1,655 @@
+"""
+One benchmark case per public method of Collection and CollectionMap, plus
+the operations SortedCollection and CollectionView add or speed up.
+
+Every case has a setup step, which is not timed, and a run step, which is.
+Read-only cases share one collection per dataset; cases that mutate their
+collection get a fresh copy from setup on every run.
+"""
+
+import asyncio
+import io
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from py_collections import Collection, CollectionMap, SortedCollection
+from py_collections.mixins import math_operations
+
+from .datasets import Dataset
+
+
+@dataclass(frozen=True)
+class Case:
+    """
+    A benchmarked call.
+
+    Attributes:
+        name: "<Class>.<method>", e.g. "Collection.sum".
+        run: Timed step, called with the setup result and the dataset.
+        setup: Untimed step producing the object the run step works on.
+        kinds: Dataset kinds the case applies to, or None for all of them.
+    """
+
+    name: str
+    run: Callable[[Any, Dataset], Any]
+    setup: Callable[[Dataset], Any]
+    kinds: tuple[str, ...] | None = None
+
+    def applies_to(self, dataset: Dataset) -> bool:
+        """Check whether the case can run on the dataset."""
+        return self.kinds is None or dataset.kind in self.kinds
+
+
+CASES: dict[str, Case] = {}
+
+
+def _shared(dataset: Dataset) -> Collection[Any]:
+    return dataset.collection
+
+
+def _fresh(dataset: Dataset) -> Collection[Any]:
+    # A real copy: a copy-on-write clone would copy inside the timed step
+    return Collection(dataset.items)
+
+
+def _shared_map(dataset: Dataset) -> CollectionMap[Any]:
+    return dataset.collection_map
+
+
+def _fresh_map(dataset: Dataset) -> CollectionMap[Any]:
+    return CollectionMap._from_dict(
+        {key: Collection(group.all()) for key, group in dataset.collection_map.items()}
+    )
+
+
+def _indexed(dataset: Dataset) -> Collection[Any]:
+    return dataset.cached(
+        "indexed", lambda: dataset.collection.clone().index_by(dataset.group_key)
+    )
+
+
+def _fresh_indexed(dataset: Dataset) -> Collection[Any]:
+    return Collection(dataset.items).index_by(dataset.group_key)
+
+
+def _jsonl_source(dataset: Dataset) -> io.StringIO:
+    return io.StringIO(dataset.cached("jsonl", dataset.collection.to_jsonl))
+
+
+def _csv_source(dataset: Dataset) -> io.StringIO:
+    def build() -> str:
+        buffer = io.StringIO()
+        if dataset.kind == "ints":
+            buffer.write("value\n")
+            buffer.writelines(f"{item}\n" for item in dataset.items)
+        else:
+            rows = dataset.collection.to_dict(mode="json")
+            buffer.write(",".join(rows[0]) + "\n")
+            buffer.writelines(",".join(map(str, row.values())) + "\n" for row in rows)
+        return buffer.getvalue()
+
+    return io.StringIO(dataset.cached("csv", build), newline="")
+
+
+def case(
+    name: str,
+    setup: Callable[[Dataset], Any] = _shared,
+    kinds: tuple[str, ...] | None = None,
+) -> Callable[[Callable[[Any, Dataset], Any]], Callable[[Any, Dataset], Any]]:
+    """Register the decorated function as the run step of a case."""
+
+    def register(run: Callable[[Any, Dataset], Any]) -> Callable[[Any, Dataset], Any]:
+        CASES[name] = Case(name, run, setup, kinds)
+        return run
+
+    return register
+
+
+class NullWriter:
+    """Text sink used for methods that write or print their output."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+async def _echo(item: Any) -> Any:
+    return item
+
+
+# Collection: basic operations
+
+
+@case("Collection.append", setup=_fresh)
+def _append(c: Collection[Any], ds: Dataset) -> None:
+    c.append(ds.probe)
+
+
+@case("Collection.extend", setup=_fresh)
+def _extend(c: Collection[Any], ds: Dataset) -> None:
+    c.extend(ds.items[:1000])
+
+
+@case("Collection.all")
+def _all(c: Collection[Any], ds: Dataset) -> Any:
+    return c.all()
+
+
+@case("Collection.all(copy=False)")
+def _all_no_copy(c: Collection[Any], ds: Dataset) -> Any:
+    return c.all(copy=False)
+
+
+# Collection: element access
+
+
+@case("Collection.first")
+def _first(c: Collection[Any], ds: Dataset) -> Any:
+    return c.first(ds.is_large)
+
+
+@case("Collection.first_or_raise")
+def _first_or_raise(c: Collection[Any], ds: Dataset) -> Any:
+    return c.first_or_raise(ds.is_large)
+
+
+@case("Collection.last")
+def _last(c: Collection[Any], ds: Dataset) -> Any:
+    return c.last()
+
+
+@case("Collection.exists")
+def _exists(c: Collection[Any], ds: Dataset) -> Any:
+    return c.exists(ds.is_large)
+
+
+@case("Collection.not_exists")
+def _not_exists(c: Collection[Any], ds: Dataset) -> Any:
+    return c.not_exists(lambda item: False)
+
+
+@case("Collection.find_duplicates")
+def _find_duplicates(c: Collection[Any], ds: Dataset) -> Any:
+    return c.find_duplicates(ds.group_key)
+
+
+@case("Collection.find_uniques")
+def _find_uniques(c: Collection[Any], ds: Dataset) -> Any:
+    return c.find_uniques(ds.group_key)
+
+
+@case("Collection.partition_by_multiplicity")
+def _partition_by_multiplicity(c: Collection[Any], ds: Dataset) -> Any:
+    return c.partition_by_multiplicity(ds.group_key)
+
+
+@case("Collection.value_counts")
+def _value_counts(c: Collection[Any], ds: Dataset) -> Any:
+    return c.value_counts(ds.group_key)
+
+
+# Collection: navigation
+
+
+@case("Collection.after")
+def _after(c: Collection[Any], ds: Dataset) -> Any:
+    return c.after(ds.probe)
+
+
+@case("Collection.before")
+def _before(c: Collection[Any], ds: Dataset) -> Any:
+    return c.before(ds.probe)
+
+
+# Collection: transformation
+
+
+@case("Collection.map")
+def _map(c: Collection[Any], ds: Dataset) -> Any:
+    return c.map(ds.value)
+
+
+@case("Collection.pluck")
+def _pluck(c: Collection[Any], ds: Dataset) -> Any:
+    return c.pluck(ds.pluck_key)
+
+
+@case("Collection.filter")
+def _filter(c: Collection[Any], ds: Dataset) -> Any:
+    return c.filter(ds.is_large)
+
+
+@case("Collection.distinct")
+def _distinct(c: Collection[Any], ds: Dataset) -> Any:
+    return c.distinct(ds.group_key)
+
+
+@case("Collection.distinct(approximate)")
+def _distinct_approximate(c: Collection[Any], ds: Dataset) -> Any:
+    return c.distinct(ds.group_key, approximate=True)
+
+
+@case("Collection.unique_by")
+def _unique_by(c: Collection[Any], ds: Dataset) -> Any:
+    return c.unique_by(ds.group_key)
+
+
+@case("Collection.reverse")
+def _reverse(c: Collection[Any], ds: Dataset) -> Any:
+    return c.reverse()
+
+
+@case("Collection.view")
+def _view(c: Collection[Any], ds: Dataset) -> Any:
+    return c.view(len(c) // 2, len(c) // 2 + 100)
+
+
+@case("CollectionView.reverse")
+def _view_reverse(c: Collection[Any], ds: Dataset) -> Any:
+    return c.view().reverse()
+
+
+@case("CollectionView.sum")
+def _view_sum(c: Collection[Any], ds: Dataset) -> Any:
+    return c.view(step=-1).sum(ds.value)
+
+
+@case("Collection.clone")
+def _clone(c: Collection[Any], ds: Dataset) -> Any:
+    return c.clone()
+
+
+@case("Collection.lazy")
+def _lazy(c: Collection[Any], ds: Dataset) -> Any:
+    return c.lazy().filter(ds.is_large).map(ds.value).take(10).all()
+
+
+@case("Collection.to_columnar", kinds=("dicts",))
+def _to_columnar(c: Collection[Any], ds: Dataset) -> Any:
+    return c.to_columnar()
+
+
+# Collection: grouping
+
+
+@case("Collection.group_by")
+def _group_by(c: Collection[Any], ds: Dataset) -> Any:
+    return c.group_by(ds.group_key)
+
+
+@case("Collection.aggregate_by")
+def _aggregate_by(c: Collection[Any], ds: Dataset) -> Any:
+    return c.aggregate_by(ds.group_key, n="count", total=("sum", ds.value))
+
+
+@case("Collection.chunk")
+def _chunk(c: Collection[Any], ds: Dataset) -> Any:
+    return c.chunk(1000)
+
+
+# Collection: indexing
+
+
+@case("Collection.index_by", setup=_fresh)
+def _index_by(c: Collection[Any], ds: Dataset) -> Any:
+    return c.index_by(ds.group_key)
+
+
+@case("Collection.lookup", setup=_indexed)
+def _lookup(c: Collection[Any], ds: Dataset) -> Any:
+    return c.lookup(ds.probe_group)
+
+
+@case("Collection.drop_index", setup=_fresh_indexed)
+def _drop_index(c: Collection[Any], ds: Dataset) -> None:
+    c.drop_index()
+
+
+@case("Collection.has_index", setup=_indexed)
+def _has_index(c: Collection[Any], ds: Dataset) -> bool:
+    return c.has_index()
+
+
+# Collection: sorting
+
+
+@case("Collection.sort_by")
+def _sort_by(c: Collection[Any], ds: Dataset) -> Any:
+    return c.sort_by(ds.group_key, ds.value, descending=[False, True])
+
+
+@case("Collection.sort_inplace", setup=_fresh)
+def _sort_inplace(c: Collection[Any], ds: Dataset) -> None:
+    c.sort_inplace(ds.group_key, ds.value, descending=[False, True])
+
+
+@case("Collection.top_k")
+def _top_k(c: Collection[Any], ds: Dataset) -> Any:
+    return c.top_k(100, ds.value)
+
+
+@case("Collection.bottom_k")
+def _bottom_k(c: Collection[Any], ds: Dataset) -> Any:
+    return c.bottom_k(100, ds.value)
+
+
+# Collection: removal
+
+
+@case("Collection.remove", setup=_fresh)
+def _remove(c: Collection[Any], ds: Dataset) -> None:
+    c.remove(ds.is_large)
+
+
+@case("Collection.remove_one", setup=_fresh)
+def _remove_one(c: Collection[Any], ds: Dataset) -> None:
+    c.remove_one(ds.probe)
+
+
+# Collection: utility and serialization
+
+
+@case("Collection.take")
+def _take(c: Collection[Any], ds: Dataset) -> Any:
+    return c.take(len(c) // 2)
+
+
+@case("Collection.dump_me")
+def _dump_me(c: Collection[Any], ds: Dataset) -> None:
+    c.dump_me()
+
+
+@case("Collection.dump_me_and_die")
+def _dump_me_and_die(c: Collection[Any], ds: Dataset) -> None:
+    try:
+        c.dump_me_and_die()
+    except SystemExit:
+        pass
+
+
+@case("Collection.to_dict")
+def _to_dict(c: Collection[Any], ds: Dataset) -> Any:
+    return c.to_dict()
+
+
+@case("Collection.to_json")
+def _to_json(c: Collection[Any], ds: Dataset) -> Any:
+    return c.to_json()
+
+
+@case("Collection.iter_json")
+def _iter_json(c: Collection[Any], ds: Dataset) -> None:
+    for _ in c.iter_json():
+        pass
+
+
+@case("Collection.write_json")
+def _write_json(c: Collection[Any], ds: Dataset) -> None:
+    c.write_json(NullWriter())
+
+
+@case("Collection.iter_jsonl")
+def _iter_jsonl(c: Collection[Any], ds: Dataset) -> None:
+    for _ in c.iter_jsonl():
+        pass
+
+
+@case("Collection.to_jsonl")
+def _to_jsonl(c: Collection[Any], ds: Dataset) -> Any:
+    return c.to_jsonl()
+
+
+# Collection: ingestion
+
+
+@case("Collection.from_iterable")
+def _from_iterable(c: Collection[Any], ds: Dataset) -> Any:
+    return Collection.from_iterable(iter(ds.items))
+
+
+@case("Collection.from_jsonl", setup=_jsonl_source)
+def _from_jsonl(source: io.StringIO, ds: Dataset) -> Any:
+    return Collection.from_jsonl(source)
+
+
+@case("Collection.from_csv", setup=_csv_source)
+def _from_csv(source: io.StringIO, ds: Dataset) -> Any:
+    return Collection.from_csv(source)
+
+
+# Collection: math operations
+
+
+@case("Collection.sum")
+def _sum(c: Collection[Any], ds: Dataset) -> Any:
+    return c.sum(ds.key)
+
+
+@case("Collection.average")
+def _average(c: Collection[Any], ds: Dataset) -> Any:
+    return c.average(ds.key)
+
+
+@case("Collection.min")
+def _min(c: Collection[Any], ds: Dataset) -> Any:
+    return c.min(ds.key)
+
+
+@case("Collection.max")
+def _max(c: Collection[Any], ds: Dataset) -> Any:
+    return c.max(ds.key)
+
+
+@case("Collection.std")
+def _std(c: Collection[Any], ds: Dataset) -> Any:
+    return c.std(ds.key)
+
+
+@case("Collection.std (pure Python)", kinds=("dicts", "dataclasses", "pydantic"))
+def _std_pure_python(c: Collection[Any], ds: Dataset) -> Any:
+    # std() with NumPy disabled: compared with "Collection.std" on the float
+    # values, this shows what the vectorized path saves above its threshold
+    numpy, math_operations._np = math_operations._np, None
+    try:
+        return c.std(ds.key)
+    finally:
+        math_operations._np = numpy
+
+
+@case("Collection.stats")
+def _stats(c: Collection[Any], ds: Dataset) -> Any:
+    return c.stats(ds.key)
+
+
+# Collection: concurrency
+
+
+@case("Collection.pmap")
+def _pmap(c: Collection[Any], ds: Dataset) -> Any:
+    return c.pmap(ds.value, workers=4)
+
+
+@case("Collection.pfilter")
+def _pfilter(c: Collection[Any], ds: Dataset) -> Any:
+    return c.pfilter(ds.is_large, workers=4)
+
+
+@case("Collection.amap")
+def _amap(c: Collection[Any], ds: Dataset) -> Any:
+    return asyncio.run(c.amap(_echo, concurrency=100))
+
+
+@case("Collection.afilter")
+def _afilter(c: Collection[Any], ds: Dataset) -> Any:
+    async def is_large(item: Any) -> bool:
+        return ds.is_large(item)
+
+    return asyncio.run(c.afilter(is_large, concurrency=100))
+
+
+@case("Collection.afirst")
+def _afirst(c: Collection[Any], ds: Dataset) -> Any:
+    async def is_large(item: Any) -> bool:
+        return ds.is_large(item)
+
+    return asyncio.run(c.afirst(is_large, concurrency=100))
+
+
+# SortedCollection
+
+
+def _sorted(dataset: Dataset) -> SortedCollection[Any]:
+    return dataset.cached(
+        "sorted", lambda: SortedCollection(dataset.items, key=dataset.value)
+    )
+
+
+def _fresh_sorted(dataset: Dataset) -> SortedCollection[Any]:
+    return SortedCollection(dataset.items, key=dataset.value)
+
+
+@case("SortedCollection.__init__")
+def _sorted_init(c: Collection[Any], ds: Dataset) -> Any:
+    return SortedCollection(ds.items, key=ds.value)
+
+
+@case("SortedCollection.insert", setup=_fresh_sorted)
+def _sorted_insert(c: SortedCollection[Any], ds: Dataset) -> None:
+    c.insert(ds.probe)
+
+
+@case("SortedCollection.extend", setup=_fresh_sorted)
+def _sorted_extend(c: SortedCollection[Any], ds: Dataset) -> None:
+    c.extend(ds.items[::100])
+
+
+@case("SortedCollection.after", setup=_sorted)
+def _sorted_after(c: SortedCollection[Any], ds: Dataset) -> Any:
+    return c.after(ds.probe)
+
+
+@case("SortedCollection.first_ge", setup=_sorted)
+def _sorted_first_ge(c: SortedCollection[Any], ds: Dataset) -> Any:
+    return c.first_ge(ds.value(ds.probe))
+
+
+@case("SortedCollection.irange", setup=_sorted)
+def _sorted_irange(c: SortedCollection[Any], ds: Dataset) -> Any:
+    value = ds.value(ds.probe)
+    return list(c.irange(value, value))
+
+
+@case("SortedCollection.remove_one", setup=_fresh_sorted)
+def _sorted_remove_one(c: SortedCollection[Any], ds: Dataset) -> None:
+    c.remove_one(ds.probe)
+
+
+# CollectionMap
+
+
+@case("CollectionMap.group")
+def _map_group(c: Collection[Any], ds: Dataset) -> Any:
+    return CollectionMap.group(ds.items, ds.group_key)
+
+
+@case("CollectionMap.add", setup=_fresh_map)
+def _map_add(m: CollectionMap[Any], ds: Dataset) -> None:
+    m.add(ds.probe_group, ds.items[:1000])
+
+
+@case("CollectionMap.setdefault", setup=_fresh_map)
+def _map_setdefault(m: CollectionMap[Any], ds: Dataset) -> Any:
+    return m.setdefault("missing", ds.items[:1000])
+
+
+@case("CollectionMap.update", setup=_fresh_map)
+def _map_update(m: CollectionMap[Any], ds: Dataset) -> None:
+    m.update({"missing": ds.items[:1000]})
+
+
+@case("CollectionMap.pop", setup=_fresh_map)
+def _map_pop(m: CollectionMap[Any], ds: Dataset) -> Any:
+    return m.pop(ds.probe_group)
+
+
+@case("CollectionMap.popitem", setup=_fresh_map)
+def _map_popitem(m: CollectionMap[Any], ds: Dataset) -> Any:
+    return m.popitem()
+
+
+@case("CollectionMap.clear", setup=_fresh_map)
+def _map_clear(m: CollectionMap[Any], ds: Dataset) -> None:
+    m.clear()
+
+
+@case("CollectionMap.get", setup=_shared_map)
+def _map_get(m: CollectionMap[Any], ds: Dataset) -> Any:
+    return m.get(ds.probe_group)
+
+
+@case("CollectionMap.keys", setup=_shared_map)
+def _map_keys(m: CollectionMap[Any], ds: Dataset) -> Any:
+    return m.keys()
+
+
+@case("CollectionMap.values", setup=_shared_map)
+def _map_values(m: CollectionMap[Any], ds: Dataset) -> Any:
+    return m.values()
+
+
+@case("CollectionMap.items", setup=_shared_map)
+def _map_items(m: CollectionMap[Any], ds: Dataset) -> Any:
+    return m.items()
+
+
+@case("CollectionMap.copy", setup=_shared_map)
+def _map_copy(m: CollectionMap[Any], ds: Dataset) -> Any:
+    return m.copy()
+
+
+@case("CollectionMap.flatten", setup=_shared_map)
+def _map_flatten(m: CollectionMap[Any], ds: Dataset) -> Any:
+    return m.flatten()
+
+
+@case("CollectionMap.map", setup=_shared_map)
+def _map_map(m: CollectionMap[Any], ds: Dataset) -> Any:
+    return m.map(len)
+
+
+@case("CollectionMap.agg", setup=_shared_map)
+def _map_agg(m: CollectionMap[Any], ds: Dataset) -> Any:
+    return m.agg(n="count", total=("sum", ds.value))
+
+
+@case("CollectionMap.filter", setup=_shared_map)
+def _map_filter(m: CollectionMap[Any], ds: Dataset) -> Any:
+    return m.filter(lambda key, group: len(group) > 1)
+
+
+@case("CollectionMap.filter_by_size", setup=_shared_map)
+def _map_filter_by_size(m: CollectionMap[Any], ds: Dataset) -> Any:
+    return m.filter_by_size(min_size=2)
+
+
+@case("CollectionMap.total_items", setup=_shared_map)
+def _map_total_items(m: CollectionMap[Any], ds: Dataset) -> Any:
+    return m.total_items()
+
+
+@case("CollectionMap.largest_group", setup=_shared_map)
+def _map_largest_group(m: CollectionMap[Any], ds: Dataset) -> Any:
+    return m.largest_group()
+
+
+@case("CollectionMap.smallest_group", setup=_shared_map)
+def _map_smallest_group(m: CollectionMap[Any], ds: Dataset) -> Any:
+    return m.smallest_group()
+
+
+@case("CollectionMap.group_sizes", setup=_shared_map)
+def _map_group_sizes(m: CollectionMap[Any], ds: Dataset) -> Any:
+    return m.group_sizes()
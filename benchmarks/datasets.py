@@ -0,0 +1,148 @@
+"""Datasets the benchmark cases run against."""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any
+
+from py_collections import Collection, CollectionMap
+from py_collections.key_access import resolve_key
+
+try:
+    from pydantic import BaseModel
+except ImportError:  # pragma: no cover - pydantic is optional
+    BaseModel = None
+
+# Number of distinct group keys in every dataset
+GROUPS = 100
+
+
+@dataclass
+class Record:
+    """Dataclass record used by the "dataclasses" dataset."""
+
+    id: int
+    group: int
+    value: float
+    name: str
+
+
+if BaseModel is not None:
+
+    class RecordModel(BaseModel):
+        """Pydantic record used by the "pydantic" dataset."""
+
+        id: int
+        group: int
+        value: float
+        name: str
+
+
+def _int_group(item: int) -> int:
+    return item % GROUPS
+
+
+@dataclass
+class Dataset:
+    """
+    Items of one kind plus the arguments cases need to work on them.
+
+    Attributes:
+        kind: Dataset name ("ints", "dicts", "dataclasses" or "pydantic").
+        items: The generated items.
+        key: Key selecting the numeric value of an item (None for ints).
+        group_key: Key or callback selecting the group of an item.
+        pluck_key: Key or attribute plucked from every item.
+        probe: An item from the middle of the dataset, for lookups.
+        is_large: Predicate selecting about half of the items.
+    """
+
+    kind: str
+    items: list[Any]
+    key: str | None
+    group_key: str | Callable[[Any], Any]
+    pluck_key: str
+    probe: Any
+    is_large: Callable[[Any], bool] = field(init=False)
+    cache: dict[str, Any] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        value = self.value
+        middle = value(self.probe)
+        self.is_large = lambda item: value(item) >= middle
+
+    @cached_property
+    def value(self) -> Callable[[Any], Any]:
+        """Callable returning the numeric value of an item."""
+        return resolve_key(self.key, strict=True)
+
+    @cached_property
+    def probe_group(self) -> Any:
+        """Group key of the probe item."""
+        return resolve_key(self.group_key)(self.probe)
+
+    @cached_property
+    def collection(self) -> Collection[Any]:
+        """Collection of the items, shared by read-only cases."""
+        return Collection(self.items)
+
+    @cached_property
+    def collection_map(self) -> CollectionMap[Any]:
+        """The items grouped into a CollectionMap, shared by read-only cases."""
+        return self.collection.group_by(self.group_key, as_map=True)
+
+    def cached(self, name: str, build: Callable[[], Any]) -> Any:
+        """Build a value once per dataset and reuse it afterwards."""
+        if name not in self.cache:
+            self.cache[name] = build()
+        return self.cache[name]
+
+
+def _ints(size: int) -> list[int]:
+    return list(range(size))
+
+
+def _dicts(size: int) -> list[dict[str, Any]]:
+    return [
+        {"id": i, "group": i % GROUPS, "value": float(i), "name": f"item-{i}"}
+        for i in range(size)
+    ]
+
+
+def _dataclasses(size: int) -> list[Record]:
+    return [Record(i, i % GROUPS, float(i), f"item-{i}") for i in range(size)]
+
+
+def _pydantic(size: int) -> list[Any]:
+    return [
+        RecordModel(id=i, group=i % GROUPS, value=float(i), name=f"item-{i}")
+        for i in range(size)
+    ]
+
+
+GENERATORS: dict[str, Callable[[int], list[Any]]] = {
+    "ints": _ints,
+    "dicts": _dicts,
+    "dataclasses": _dataclasses,
+}
+if BaseModel is not None:
+    GENERATORS["pydantic"] = _pydantic
+
+
+def make_dataset(kind: str, size: int) -> Dataset:
+    """
+    Generate a dataset.
+
+    Raises:
+        ValueError: If the kind is unknown or its dependency is not installed.
+    """
+    if kind not in GENERATORS:
+        raise ValueError(
+            f"Unknown or unavailable dataset '{kind}'; "
+            f"expected one of {', '.join(GENERATORS)}"
+        )
+    items = GENERATORS[kind](size)
+    probe = items[size // 2]
+    if kind == "ints":
+        return Dataset(kind, items, None, _int_group, "real", probe)
+    return Dataset(kind, items, "value", "group", "name", probe)
@@ -0,0 +1,296 @@
+"""Run the benchmark cases, report the results and compare them to a baseline."""
+
+import argparse
+import contextlib
+import gc
+import json
+import platform
+import re
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+from .cases import CASES, Case, NullWriter
+from .datasets import GENERATORS, Dataset, make_dataset
+
+DEFAULT_SIZES = (1_000, 100_000)
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+# Allocation peaks below this are too small to compare meaningfully
+_MIN_COMPARED_BYTES = 64 * 1024
+
+
+@dataclass
+class Result:
+    """
+    Measurements of one case on one dataset.
+
+    Attributes:
+        ops_per_sec: Timed runs per second (setup excluded).
+        alloc_peak_bytes: Peak memory traced by tracemalloc during one run.
+        alloc_net_bytes: Memory still allocated after that run (its result).
+        peak_rss_bytes: Peak resident set size of the process so far, or None
+                        where the resource module is unavailable.
+    """
+
+    ops_per_sec: float
+    alloc_peak_bytes: int
+    alloc_net_bytes: int
+    peak_rss_bytes: int | None
+
+
+def peak_rss_bytes() -> int | None:
+    """Peak resident set size of this process, in bytes."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def measure(case: Case, dataset: Dataset, min_time: float, max_runs: int) -> Result:
+    """Time a case until min_time has been spent in it, then trace one run."""
+    elapsed = 0.0
+    runs = 0
+    while runs < max_runs and (runs == 0 or elapsed < min_time):
+        state = case.setup(dataset)
+        start = time.perf_counter()
+        case.run(state, dataset)
+        elapsed += time.perf_counter() - start
+        runs += 1
+
+    state = case.setup(dataset)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = case.run(state, dataset)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+
+    return Result(
+        ops_per_sec=runs / elapsed if elapsed else float("inf"),
+        alloc_peak_bytes=peak - before,
+        alloc_net_bytes=current - before,
+        peak_rss_bytes=peak_rss_bytes(),
+    )
+
+
+def result_key(case_name: str, kind: str, size: int) -> str:
+    """Identify a measurement in reports and baselines."""
+    return f"{case_name}[{kind}-{size}]"
+
+
+def run_all(
+    sizes: list[int],
+    kinds: list[str],
+    pattern: str | None,
+    min_time: float,
+    max_runs: int,
+) -> dict[str, Result]:
+    """Run every selected case on every selected dataset, printing as it goes."""
+    selected = [
+        case
+        for name, case in sorted(CASES.items())
+        if pattern is None or re.search(pattern, name)
+    ]
+    results: dict[str, Result] = {}
+
+    print(
+        f"{'case':58}{'ops/sec':>12}{'alloc peak':>14}{'alloc net':>14}{'peak RSS':>12}"
+    )
+    for size in sizes:
+        for kind in kinds:
+            dataset = make_dataset(kind, size)
+            for case in selected:
+                if not case.applies_to(dataset):
+                    continue
+                # Methods that print (dump_me) write to a sink instead
+                with contextlib.redirect_stdout(NullWriter()):
+                    result = measure(case, dataset, min_time, max_runs)
+                key = result_key(case.name, kind, size)
+                results[key] = result
+                print(
+                    f"{key:58}{result.ops_per_sec:>12,.1f}"
+                    f"{_format_bytes(result.alloc_peak_bytes):>14}"
+                    f"{_format_bytes(result.alloc_net_bytes):>14}"
+                    f"{_format_bytes(result.peak_rss_bytes):>12}"
+                )
+            del dataset
+            gc.collect()
+    return results
+
+
+def compare(
+    results: dict[str, Result], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """
+    Find measurements that regressed against a baseline.
+
+    A result regresses when its ops/sec drops by more than `threshold`
+    (a fraction), or when its allocation peak grows by more than `threshold`
+    and by at least 64 KiB.
+
+    Returns:
+        One message per regression.
+    """
+    regressions = []
+    for key, result in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+
+        floor = previous["ops_per_sec"] * (1 - threshold)
+        if result.ops_per_sec < floor:
+            regressions.append(
+                f"{key}: {result.ops_per_sec:,.1f} ops/sec, "
+                f"baseline {previous['ops_per_sec']:,.1f}"
+            )
+
+        peak = result.alloc_peak_bytes
+        previous_peak = previous["alloc_peak_bytes"]
+        if (
+            peak > previous_peak * (1 + threshold)
+            and peak - previous_peak >= _MIN_COMPARED_BYTES
+        ):
+            regressions.append(
+                f"{key}: allocation peak {_format_bytes(peak)}, "
+                f"baseline {_format_bytes(previous_peak)}"
+            )
+    return regressions
+
+
+def _format_bytes(size: int | None) -> str:
+    if size is None:
+        return "n/a"
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def _size(text: str) -> int:
+    """Parse a size such as 1000, 1e5 or 1_000_000."""
+    size = int(float(text))
+    if size <= 0:
+        raise argparse.ArgumentTypeError("sizes must be positive")
+    return size
+
+
+def parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark every public Collection and CollectionMap method.",
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=_size,
+        default=list(DEFAULT_SIZES),
+        help="Numbers of items (default: 1e3 1e5; add 1e6 for a full run).",
+    )
+    parser.add_argument(
+        "--datasets",
+        nargs="+",
+        choices=list(GENERATORS),
+        default=list(GENERATORS),
+        help="Kinds of items to benchmark (default: all available).",
+    )
+    parser.add_argument(
+        "--cases",
+        metavar="REGEX",
+        help="Only run cases whose name matches, e.g. 'Collection\\.(sum|map)$'.",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="Seconds to spend timing each case (default: 0.2).",
+    )
+    parser.add_argument(
+        "--max-runs",
+        type=int,
+        default=1000,
+        help="Maximum timed runs per case (default: 1000).",
+    )
+    parser.add_argument(
+        "--output", type=Path, help="Write the results to this JSON file."
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help="Baseline JSON file to compare against or save to.",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store the results as the baseline instead of comparing.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed relative slowdown or allocation growth (default: 0.25).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the benchmarks.
+
+    Returns:
+        The process exit code: 1 if a regression was found, 0 otherwise.
+    """
+    args = parse_args(argv)
+    results = run_all(
+        args.sizes, args.datasets, args.cases, args.min_time, args.max_runs
+    )
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "threshold": args.threshold,
+        },
+        "results": {key: asdict(result) for key, result in results.items()},
+    }
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.save_baseline:
+        baseline = {}
+        if args.baseline.exists():
+            baseline = json.loads(args.baseline.read_text())["results"]
+        report["results"] = baseline | report["results"]
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nSaved {len(results)} results to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline first")
+        return 0
+
+    regressions = compare(
+        results, json.loads(args.baseline.read_text())["results"], args.threshold
+    )
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+    print(f"\nNo regressions over {args.threshold:.0%} against {args.baseline}")
+    return 0
@@ -0,0 +1,122 @@
+"""
+Measure the per-instance cost of Collection objects.
+
+Compares Collection (which uses __slots__) with an otherwise identical
+class that has a per-instance __dict__, on:
+
+- memory: bytes allocated per instance while creating many small collections
+- attribute access: time of len() calls, which read _items
+- group_by on a high-cardinality key, which creates one collection per item
+
+Run with:
+    python benchmarks/slots.py
+"""
+
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from py_collections import Collection
+
+INSTANCES = 100_000
+ACCESSES = 1_000_000
+
+
+# The same class without __slots__: every instance stores its attributes in
+# a per-instance __dict__, as Collection did before. The slot descriptors are
+# left out so the attributes land in that __dict__.
+DictCollection = type(
+    "DictCollection",
+    Collection.__bases__,
+    {
+        name: value
+        for name, value in vars(Collection).items()
+        if name != "__slots__" and name not in Collection.__slots__
+    },
+)
+
+
+def allocated_per_instance(cls: type[Collection], count: int) -> float:
+    """Bytes allocated per instance when creating `count` empty collections."""
+    lists = [[] for _ in range(count)]
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls._from_list(items) for items in lists]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    # Subtract the list that holds the instances
+    return (after - before) / count - 8
+
+
+def best_time(func: Callable[[], Any], repeat: int = 5) -> float:
+    """Best wall-clock time of several runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def access_time(cls: type[Collection]) -> float:
+    """Seconds taken by ACCESSES len() calls."""
+    collection = cls([1, 2, 3])
+    size = cls.__len__
+
+    def run() -> None:
+        for _ in range(ACCESSES):
+            size(collection)
+
+    return best_time(run)
+
+
+def group_by_peak(cls: type[Collection]) -> tuple[float, int]:
+    """Time and peak traced memory of group_by with one group per item."""
+    rows = cls([{"id": i} for i in range(INSTANCES)])
+    original = Collection._from_list.__func__
+
+    # Make group_by build groups of the measured class
+    Collection._from_list = classmethod(lambda _, items: original(cls, items))
+    try:
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        groups = rows.group_by("id")
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    finally:
+        Collection._from_list = classmethod(original)
+    assert len(groups) == INSTANCES
+    return elapsed, peak
+
+
+def main() -> None:
+    print(f"{'':28}{'__slots__':>14}{'__dict__':>14}")
+
+    slots_bytes = allocated_per_instance(Collection, INSTANCES)
+    dict_bytes = allocated_per_instance(DictCollection, INSTANCES)
+    print(f"{'bytes per instance':28}{slots_bytes:>14.0f}{dict_bytes:>14.0f}")
+
+    slots_access = access_time(Collection)
+    dict_access = access_time(DictCollection)
+    print(
+        f"{'len() x 1M (ms)':28}{slots_access * 1e3:>14.1f}{dict_access * 1e3:>14.1f}"
+    )
+
+    slots_time, slots_peak = group_by_peak(Collection)
+    dict_time, dict_peak = group_by_peak(DictCollection)
+    print(
+        f"{'group_by 100k groups (ms)':28}{slots_time * 1e3:>14.1f}{dict_time * 1e3:>14.1f}"
+    )
+    print(
+        f"{'group_by peak memory (MB)':28}{slots_peak / 1e6:>14.1f}{dict_peak / 1e6:>14.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,46 @@
 from .collection import Collection, T
 from .collection_map import CollectionMap
+from .collection_view import CollectionView
+from .columnar import ColumnarCollection
+from .lazy_collection import LazyCollection
 from .mixins import (
     BasicOperationsMixin,
+    ConcurrencyMixin,
     ElementAccessMixin,
     GroupingMixin,
+    IndexingMixin,
+    IngestionMixin,
     NavigationMixin,
     RemovalMixin,
+    SortingMixin,
+    StorageMixin,
     TransformationMixin,
     UtilityMixin,
 )
-from .mixins.element_access import ItemNotFoundException
+from .mixins.element_access import ItemNotFoundException, MultiplicityPartition
+from .mixins.math_operations import Stats
+from .sorted_collection import SortedCollection
 
 __all__ = [
     "BasicOperationsMixin",
     "Collection",
     "CollectionMap",
+    "CollectionView",
+    "ColumnarCollection",
+    "ConcurrencyMixin",
     "ElementAccessMixin",
     "GroupingMixin",
+    "IndexingMixin",
+    "IngestionMixin",
     "ItemNotFoundException",
+    "LazyCollection",
+    "MultiplicityPartition",
     "NavigationMixin",
     "RemovalMixin",
+    "SortedCollection",
+    "SortingMixin",
+    "Stats",
+    "StorageMixin",
     "T",
     "TransformationMixin",
     "UtilityMixin",
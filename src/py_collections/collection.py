@@ -1,14 +1,18 @@
 """Main Collection class that combines all mixins."""
 
-from typing import TypeVar
+from typing import Any, Self, TypeVar
 
 from .mixins import (
     BasicOperationsMixin,
+    ConcurrencyMixin,
     ElementAccessMixin,
     GroupingMixin,
+    IndexingMixin,
+    IngestionMixin,
     MathOperationsMixin,
     NavigationMixin,
     RemovalMixin,
+    SortingMixin,
     TransformationMixin,
     UtilityMixin,
 )
@@ -22,9 +26,13 @@ class Collection[T](
     NavigationMixin[T],
     TransformationMixin[T],
     GroupingMixin[T],
+    IndexingMixin[T],
     RemovalMixin[T],
     UtilityMixin[T],
     MathOperationsMixin[T],
+    ConcurrencyMixin[T],
+    IngestionMixin[T],
+    SortingMixin[T],
 ):
     """
     A collection class that wraps a list and provides methods to manipulate it.
@@ -33,26 +41,75 @@ class Collection[T](
     - BasicOperationsMixin: append, extend, all, len, iteration
     - ElementAccessMixin: first, last, exists, first_or_raise
     - NavigationMixin: after, before
-    - TransformationMixin: map, pluck, filter, reverse, clone
+    - TransformationMixin: map, pluck, filter, reverse, view, clone, lazy,
+      to_columnar
     - GroupingMixin: group_by, chunk
+    - IndexingMixin: index_by, lookup, drop_index, has_index
     - RemovalMixin: remove, remove_one
-    - UtilityMixin: take, dump_me, dump_me_and_die
-    - MathOperationsMixin: sum
+    - UtilityMixin: take, dump_me, dump_me_and_die, to_dict, to_json, iter_json,
+      write_json, iter_jsonl, to_jsonl
+    - MathOperationsMixin: sum, average, min, max, std, stats
+    - ConcurrencyMixin: pmap, pfilter, amap, afilter, afirst
+    - IngestionMixin: from_iterable, from_jsonl, from_csv
+    - SortingMixin: sort_by, sort_inplace, top_k, bottom_k
 
     Args:
         items: Optional list of items to initialize the collection with.
                If not provided, an empty list will be used.
+        copy: Whether to copy the given list. Pass False to hand ownership of
+              the list to the collection without copying it.
     """
 
-    def __init__(self, items: list[T] | None = None):
+    # No per-instance __dict__: group_by() and chunk() can create very many
+    # small collections, and slot access to _items is faster than a dict lookup.
+    __slots__ = ("__weakref__", "_index", "_items", "_shared", "_version")
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:  # noqa: ARG004
+        """
+        Create the instance with its bookkeeping slots initialized.
+
+        Every construction path (__init__, _from_list, subclasses, pickling)
+        goes through here, so an __init__ only has to set _items.
+        """
+        collection = object.__new__(cls)
+        collection._index = None
+        collection._shared = False
+        collection._version = 0
+        return collection
+
+    def __init__(self, items: list[T] | None = None, copy: bool = True):
         """
         Initialize the collection with items.
 
         Args:
             items: Optional list of items to initialize the collection with.
                    If not provided, an empty list will be used.
+            copy: Whether to copy the given list. When False, the collection
+                  uses the list as its backing storage, so later changes made
+                  through either reference are visible in both.
+        """
+        if items is None:
+            self._items = []
+        else:
+            self._items = items.copy() if copy else items
+
+    @classmethod
+    def _from_list(cls, items: list[T]) -> "Collection[T]":
+        """
+        Wrap a freshly built list without copying it.
+
+        Used internally by methods that build a new list and hand it over,
+        so results are not copied a second time by __init__.
+
+        Args:
+            items: A list that is not referenced anywhere else.
+
+        Returns:
+            A new collection that owns the given list.
         """
-        self._items = items.copy() if items is not None else []
+        collection = cls.__new__(cls)
+        collection._items = items
+        return collection
 
     def __str__(self) -> str:
         """Return a string representation of the collection."""
@@ -117,5 +174,4 @@ class Collection[T](
         if not isinstance(other, Collection):
             raise TypeError(f"Can only add Collection to Collection, not {type(other)}")
 
-        new_items = self._items + other._items
-        return Collection(new_items)
+        return Collection._from_list(self._items + other._items)
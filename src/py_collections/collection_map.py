@@ -1,7 +1,8 @@
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any, TypeVar
 
 from .collection import Collection
+from .mixins.grouping import aggregate_group, group_items
 
 T = TypeVar("T")
 
@@ -20,6 +21,8 @@ class CollectionMap[T]:
               that will be converted to Collection instances.
     """
 
+    __slots__ = ("__weakref__", "_data")
+
     def __init__(self, data: dict[str, Collection[T] | list[T] | Any] | None = None):
         self._data: dict[str, Collection[T]] = {}
 
@@ -27,6 +30,51 @@ class CollectionMap[T]:
             for key, value in data.items():
                 self[key] = value
 
+    @classmethod
+    def _from_dict(cls, data: dict[Any, Collection[T]]) -> "CollectionMap[T]":
+        """
+        Wrap a dictionary of Collections without converting or copying it.
+
+        Args:
+            data: A dictionary whose values are already Collection instances and
+                  which is not referenced anywhere else.
+
+        Returns:
+            A new CollectionMap that owns the given dictionary.
+        """
+        result = cls.__new__(cls)
+        result._data = data
+        return result
+
+    @classmethod
+    def group(
+        cls, items: Iterable[T], key: str | Callable[[T], Any] | None = None
+    ) -> "CollectionMap[T]":
+        """
+        Group any iterable into a CollectionMap in a single streaming pass.
+
+        Unlike Collection.group_by, the items do not need to be in a Collection
+        first: generators and other iterables are consumed directly.
+
+        Args:
+            items: Any iterable of items, consumed once.
+            key: A key/attribute name (dot notation supported), a callable, or
+                 None to group by the item itself.
+
+        Returns:
+            A CollectionMap from group key to the Collection of items in that group.
+
+        Examples:
+            rows = (json.loads(line) for line in log_file)
+            by_level = CollectionMap.group(rows, "level")
+        """
+        return cls._from_dict(
+            {
+                group_key: Collection._from_list(bucket)
+                for group_key, bucket in group_items(items, key).items()
+            }
+        )
+
     def __setitem__(self, key: str, value: Collection[T] | list[T] | Any) -> None:
         """
         Set a key-value pair, converting the value to a Collection if needed.
@@ -38,10 +86,10 @@ class CollectionMap[T]:
         if isinstance(value, Collection):
             self._data[key] = value
         elif isinstance(value, list | tuple):
-            self._data[key] = Collection(list(value))
+            self._data[key] = Collection._from_list(list(value))
         else:
             # Convert single item to a collection
-            self._data[key] = Collection([value])
+            self._data[key] = Collection._from_list([value])
 
     def __getitem__(self, key: str) -> Collection[T]:
         """
@@ -125,14 +173,12 @@ class CollectionMap[T]:
             if isinstance(items, Collection):
                 self._data[key] = items
             elif isinstance(items, list | tuple):
-                self._data[key] = Collection(list(items))
+                self._data[key] = Collection._from_list(list(items))
             else:
-                self._data[key] = Collection([items])
+                self._data[key] = Collection._from_list([items])
         # Extend existing collection
-        elif isinstance(items, Collection):
-            self._data[key]._items.extend(items.all())
-        elif isinstance(items, list | tuple):
-            self._data[key]._items.extend(items)
+        elif isinstance(items, Collection | list | tuple):
+            self._data[key].extend(items)
         else:
             self._data[key].append(items)
 
@@ -212,10 +258,10 @@ class CollectionMap[T]:
         Returns:
             A single Collection containing all items from all groups
         """
-        result = Collection()
+        items: list[T] = []
         for collection in self._data.values():
-            result._items.extend(collection.all())
-        return result
+            items.extend(collection._items)
+        return Collection._from_list(items)
 
     def map(self, func: Callable[[Collection[T]], Any]) -> dict[str, Any]:
         """
@@ -229,6 +275,24 @@ class CollectionMap[T]:
         """
         return {key: func(collection) for key, collection in self._data.items()}
 
+    def agg(self, **aggs: Any) -> dict[str, dict[str, Any]]:
+        """
+        Aggregate every Collection in the map.
+
+        Takes the same aggregation specs as Collection.aggregate_by, for example
+        total=("sum", "amount") or n="count".
+
+        Args:
+            **aggs: Result names mapped to aggregation specs.
+
+        Returns:
+            Dictionary mapping keys to dictionaries of aggregated values.
+        """
+        return {
+            key: aggregate_group(collection._items, aggs)
+            for key, collection in self._data.items()
+        }
+
     def filter(
         self, predicate: Callable[[str, Collection[T]], bool]
     ) -> "CollectionMap[T]":
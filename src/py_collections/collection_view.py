@@ -0,0 +1,249 @@
+"""Read-only, zero-copy windows over a Collection's items."""
+
+from collections.abc import Callable, Iterator, Sequence
+from itertools import islice
+from typing import Any, Never, TypeVar
+
+from .collection import Collection
+from .mixins.sorting import SortKey
+
+T = TypeVar("T")
+
+
+class _Window(Sequence[Any]):
+    """
+    The positions range(start, stop, step) of a collection's items.
+
+    Stands in for the list in a CollectionView's _items, so the mixins read
+    through it unchanged. Positions are kept as a range object, which slices
+    and reverses in O(1). Slicing a window returns a list, like slicing the
+    list it replaces.
+    """
+
+    __slots__ = ("_parent", "_positions", "_version")
+
+    def __init__(self, parent: Collection[Any], positions: range):
+        self._parent = parent
+        self._positions = positions
+        self._version = parent._version
+
+    def _checked_items(self) -> list[Any]:
+        """
+        Return the parent's items, checking they have not changed since.
+
+        Raises:
+            RuntimeError: If the parent was modified after the view was created.
+        """
+        parent = self._parent
+        if parent._version != self._version:
+            raise RuntimeError(
+                "Collection was modified after the view was created; "
+                "create a new view or materialize() before modifying it"
+            )
+        return parent._items
+
+    def __len__(self) -> int:
+        self._checked_items()
+        return len(self._positions)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return list(self._iterate(self._positions[index]))
+        return self._checked_items()[self._positions[index]]
+
+    def _iterate(self, positions: range) -> Iterator[Any]:
+        """Iterate over the items at the given positions."""
+        items = self._checked_items()
+        if not positions:
+            return iter(())
+        # Seek a list iterator straight to the first position (the state that
+        # pickling list iterators uses), then let islice step through it
+        step = abs(positions.step)
+        iterator = iter(items) if positions.step > 0 else reversed(items)
+        iterator.__setstate__(positions.start)
+        return islice(iterator, 0, (len(positions) - 1) * step + 1, step)
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._iterate(self._positions)
+
+    def __reversed__(self) -> Iterator[Any]:
+        return self._iterate(self._positions[::-1])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _Window):
+            return self.copy() == other.copy()
+        if isinstance(other, list):
+            return self.copy() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __add__(self, other: Any) -> list[Any]:
+        return [*self, *other]
+
+    def __radd__(self, other: Any) -> list[Any]:
+        return [*other, *self]
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+    def index(self, value: Any, start: int = 0, stop: int | None = None) -> int:
+        """Return the first position of value, like list.index."""
+        items = self._checked_items()
+        positions = self._positions
+        for i in range(len(positions))[start:stop]:
+            item = items[positions[i]]
+            if item is value or item == value:
+                return i
+        raise ValueError(f"{value!r} is not in view")
+
+    def copy(self) -> list[Any]:
+        """Return the items in the window as a new list."""
+        return list(self)
+
+
+class CollectionView[T](Collection[T]):
+    """
+    A read-only window onto part of a collection, without copying its items.
+
+    A view refers to its parent's items through a start/stop/step range, so
+    creating, slicing, reversing and taking from a view are O(1) however
+    large the parent is. Every read-only Collection method works on a view,
+    reading the items through the window; methods that build a new collection
+    return a plain Collection. Slicing a view returns another view.
+
+    A view is only valid while its parent is unchanged: after append(),
+    extend(), remove() or another mutation of the parent, using the view
+    raises RuntimeError. Call materialize() to keep an independent copy.
+
+    Args:
+        parent: The collection (or view) to look into.
+        start: First position, as in a slice.
+        stop: Position to stop before, as in a slice.
+        step: Step between positions, as in a slice; negative steps walk
+              backwards.
+
+    Examples:
+        page = events.view(2_000, 2_100)
+        newest_first = events.view()[::-1]
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        parent: Collection[T],
+        start: int | None = None,
+        stop: int | None = None,
+        step: int | None = None,
+    ):
+        if isinstance(parent, CollectionView):
+            window = parent._items
+            root, positions = window._parent, window._positions
+            window._checked_items()
+        else:
+            root, positions = parent, range(len(parent._items))
+        self._items = _Window(root, positions[start:stop:step])
+
+    @classmethod
+    def _from_list(cls, items: list[T]) -> Collection[T]:
+        """Wrap a freshly built list in a plain Collection; views own no list."""
+        return Collection._from_list(items)
+
+    def __getitem__(self, index: Any) -> Any:
+        """
+        Get an item by position, or a sub-view for a slice.
+
+        Raises:
+            IndexError: If the position is out of range.
+            RuntimeError: If the parent was modified after the view was created.
+        """
+        if isinstance(index, slice):
+            return CollectionView(self, index.start, index.stop, index.step)
+        return self._items[index]
+
+    def materialize(self) -> Collection[T]:
+        """
+        Copy the items in the view into a new, independent Collection.
+
+        Returns:
+            A new Collection with the view's items.
+
+        Raises:
+            RuntimeError: If the parent was modified after the view was created.
+        """
+        return Collection._from_list(self._items.copy())
+
+    def clone(self) -> Collection[T]:
+        """
+        Return a new, independent Collection with the view's items.
+
+        The same as materialize(): a view has no list of its own to share.
+        """
+        return self.materialize()
+
+    def all(self, copy: bool = True) -> list[T] | Sequence[T]:
+        """
+        Get the items in the view as a list, or as a read-only sequence.
+
+        Args:
+            copy: Whether to copy the items into a new list. When False, the
+                  view's own window is returned, as for Collection.all().
+        """
+        return self._items.copy() if copy else self._items
+
+    def reverse(self) -> "CollectionView[T]":
+        """
+        Return a view of the same items in reverse order, without copying.
+
+        Returns:
+            A new CollectionView.
+        """
+        return CollectionView(self, step=-1)
+
+    def take(self, count: int) -> "CollectionView[T]":
+        """
+        Return a view of the first count items, or the last -count items.
+
+        Returns:
+            A new CollectionView.
+        """
+        if count >= 0:
+            return CollectionView(self, stop=count)
+        return CollectionView(self, start=count)
+
+    def _read_only(self, method: str) -> Never:
+        """
+        Reject a mutation.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise TypeError(
+            f"CollectionView is read-only and does not support {method}(); "
+            "call materialize() for a modifiable copy"
+        )
+
+    def append(self, item: T) -> None:  # noqa: ARG002
+        """Not supported: views are read-only. Raises TypeError."""
+        self._read_only("append")
+
+    def extend(self, items: list[T] | Collection[T]) -> None:  # noqa: ARG002
+        """Not supported: views are read-only. Raises TypeError."""
+        self._read_only("extend")
+
+    def remove(self, target: T | Callable[[T], bool]) -> None:  # noqa: ARG002
+        """Not supported: views are read-only. Raises TypeError."""
+        self._read_only("remove")
+
+    def remove_one(self, target: T | Callable[[T], bool]) -> None:  # noqa: ARG002
+        """Not supported: views are read-only. Raises TypeError."""
+        self._read_only("remove_one")
+
+    def sort_inplace(
+        self,
+        *keys: SortKey,  # noqa: ARG002
+        descending: bool | Sequence[bool] = False,  # noqa: ARG002
+    ) -> None:
+        """Not supported: views are read-only. Raises TypeError."""
+        self._read_only("sort_inplace")
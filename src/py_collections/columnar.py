@@ -0,0 +1,384 @@
+"""Column-oriented storage for collections of records with identical keys."""
+
+import json
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+from .key_access import resolve_key
+from .mixins.grouping import group_items
+from .mixins.math_operations import _NUMERIC_TYPES, _VECTORIZE_MIN_SIZE, _np
+from .mixins.transformation import make_plucker
+from .serialization import to_plain
+
+if TYPE_CHECKING:
+    from .collection import Collection
+
+type Column = list[Any] | array[Any]
+
+# Marks the end of the input rows, which may themselves be None
+_END = object()
+
+
+def _compact(values: list[Any]) -> Column:
+    """
+    Store a column of exact ints or exact floats as a typed array.
+
+    Columns of other types (including bool, None and mixed types), and int
+    columns that do not fit in 64 bits, stay plain lists.
+    """
+    types = set(map(type, values))
+    if types == {float}:
+        return array("d", values)
+    if types == {int}:
+        try:
+            return array("q", values)
+        except OverflowError:
+            return values
+    return values
+
+
+def _float_view(column: Column) -> Any:
+    """
+    Return a zero-copy NumPy view of a large float column.
+
+    Returns:
+        A NumPy array sharing the column's buffer, or None when NumPy is not
+        installed, the column is small, or it is not a float array.
+    """
+    if _np is None or len(column) < _VECTORIZE_MIN_SIZE:
+        return None
+    if not isinstance(column, array) or column.typecode != "d":
+        return None
+    return _np.frombuffer(column, dtype=_np.float64)
+
+
+def _take(column: Column, positions: Sequence[int]) -> Column:
+    """Gather the values at the given positions into a column of the same kind."""
+    picked = map(column.__getitem__, positions)
+    if isinstance(column, array):
+        return array(column.typecode, picked)
+    return list(picked)
+
+
+class ColumnarCollection:
+    """
+    A collection of records stored as one sequence per field.
+
+    Each field is kept in its own column: a typed array for fields holding
+    only ints or only floats, and a list otherwise. Row dictionaries are only
+    built on demand (iteration, all(), to_dict(), ...), while pluck(), sum(),
+    average(), where() and group_by() on a field work on its column directly.
+
+    Key and callback arguments that do not name a column (dot notation,
+    callables) are supported through the materialized rows, with the same
+    behavior as Collection.
+
+    Args:
+        rows: Optional iterable of dictionaries that all have the same keys.
+
+    Raises:
+        TypeError: If the rows are not dictionaries.
+        ValueError: If the rows do not all have the same keys.
+    """
+
+    __slots__ = ("_columns", "_length")
+
+    def __init__(self, rows: Iterable[Mapping[str, Any]] | None = None):
+        iterator = iter(rows if rows is not None else ())
+        first = next(iterator, _END)
+        if first is _END:
+            self._columns: dict[str, Column] = {}
+            self._length = 0
+            return
+        if not isinstance(first, Mapping):
+            raise TypeError("ColumnarCollection rows must be dictionaries")
+
+        names = tuple(first)
+        lists: list[list[Any]] = [[value] for value in first.values()]
+        length = 1
+        for row in iterator:
+            if len(row) != len(names):
+                raise ValueError("All rows must have the same keys")
+            try:
+                for values, name in zip(lists, names, strict=True):
+                    values.append(row[name])
+            except KeyError:
+                raise ValueError("All rows must have the same keys") from None
+            length += 1
+
+        self._columns = {
+            name: _compact(values) for name, values in zip(names, lists, strict=True)
+        }
+        self._length = length
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Iterable[Any]]) -> "ColumnarCollection":
+        """
+        Build a columnar collection from per-field sequences.
+
+        Args:
+            columns: A mapping from field name to the values of that field.
+
+        Returns:
+            A new ColumnarCollection.
+
+        Raises:
+            ValueError: If the columns do not all have the same length.
+        """
+        compacted = {name: _compact(list(values)) for name, values in columns.items()}
+        lengths = {len(values) for values in compacted.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        return cls._from_columns(compacted, lengths.pop() if lengths else 0)
+
+    @classmethod
+    def _from_columns(
+        cls, columns: dict[str, Column], length: int
+    ) -> "ColumnarCollection":
+        """Wrap already built columns without copying or checking them."""
+        collection = cls.__new__(cls)
+        collection._columns = columns
+        collection._length = length
+        return collection
+
+    @property
+    def columns(self) -> list[str]:
+        """The field names, in order."""
+        return list(self._columns)
+
+    def column(self, name: str) -> list[Any]:
+        """
+        Get a copy of the values of one field.
+
+        Raises:
+            KeyError: If there is no such column.
+        """
+        if name not in self._columns:
+            raise KeyError(f"Column '{name}' not found")
+        return list(self._columns[name])
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self._length
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Iterate over the rows, building each dictionary as it is reached."""
+        if not self._columns:
+            # Rows without fields: there is no column to count them by
+            for _ in range(self._length):
+                yield {}
+            return
+        names = tuple(self._columns)
+        for values in zip(*self._columns.values(), strict=True):
+            yield dict(zip(names, values, strict=True))
+
+    def __getitem__(self, index: int) -> dict[str, Any]:
+        """
+        Build the row at the given position.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if not -self._length <= index < self._length:
+            raise IndexError("ColumnarCollection index out of range")
+        return {name: values[index] for name, values in self._columns.items()}
+
+    def __eq__(self, other: object) -> bool:
+        """Check whether two columnar collections hold the same rows."""
+        if not isinstance(other, ColumnarCollection):
+            return False
+        if self.columns != other.columns or self._length != other._length:
+            return False
+        return all(
+            list(values) == list(other._columns[name])
+            for name, values in self._columns.items()
+        )
+
+    def all(self) -> list[dict[str, Any]]:
+        """Return all rows as a list of dictionaries."""
+        return list(self)
+
+    def first(self) -> dict[str, Any] | None:
+        """Return the first row, or None if the collection is empty."""
+        return self[0] if self._length else None
+
+    def to_collection(self) -> "Collection[dict[str, Any]]":
+        """Materialize the rows into a regular Collection."""
+        from .collection import Collection
+
+        return Collection._from_list(self.all())
+
+    def pluck(self, key: str, value_key: str | None = None) -> "Collection[Any]":
+        """
+        Extract the values of a field, like Collection.pluck.
+
+        Plucking a column returns a copy of it without building any rows.
+
+        Args:
+            key: The field to extract. Dot notation falls back to the rows.
+            value_key: Optional field to use as the value of a single-entry dictionary.
+
+        Returns:
+            A new Collection with the extracted values.
+        """
+        from .collection import Collection
+
+        column = self._columns.get(key)
+        if column is None or (value_key is not None and value_key not in self._columns):
+            return Collection._from_list(list(map(make_plucker(key, value_key), self)))
+        if value_key is None:
+            return Collection._from_list(list(column))
+        values = self._columns[value_key]
+        return Collection._from_list(
+            [{k: v} for k, v in zip(column, values, strict=True)]
+        )
+
+    def sum(
+        self, key_or_callback: str | Callable[[dict[str, Any]], int | float]
+    ) -> int | float:
+        """
+        Sum the values of a field or callback, like Collection.sum.
+
+        Typed (int or float) columns are summed without any per-value checks,
+        and large float columns are reduced by NumPy (when installed) directly
+        over the column's buffer.
+
+        Raises:
+            TypeError: If a value is not numeric.
+            KeyError: If a key names neither a column nor a key of the rows.
+        """
+        values = self._numeric_column(key_or_callback)
+        if values is None:
+            return self.to_collection().sum(key_or_callback)
+        view = _float_view(values)
+        if view is not None:
+            return float(view.sum())
+        return sum(values)
+
+    def average(
+        self, key_or_callback: str | Callable[[dict[str, Any]], int | float]
+    ) -> float:
+        """
+        Average the values of a field or callback, like Collection.average.
+
+        Raises:
+            ValueError: If the collection is empty.
+            TypeError: If a value is not numeric.
+            KeyError: If a key names neither a column nor a key of the rows.
+        """
+        values = self._numeric_column(key_or_callback)
+        if values is None or not values:
+            return self.to_collection().average(key_or_callback)
+        view = _float_view(values)
+        if view is not None:
+            return float(view.mean())
+        return sum(values) / len(values)
+
+    def _numeric_column(self, key: Any) -> Column | None:
+        """
+        Return a column that is safe to aggregate, or None to use the rows.
+
+        Raises:
+            TypeError: If the column holds a non-numeric value.
+        """
+        if not isinstance(key, str):
+            return None
+        column = self._columns.get(key)
+        if column is None or isinstance(column, array):
+            return column
+        if not _NUMERIC_TYPES.issuperset(map(type, column)):
+            for value in column:
+                if not isinstance(value, int | float):
+                    raise TypeError(
+                        f"Value for key '{key}' must be numeric, "
+                        f"got {type(value).__name__}"
+                    )
+        return column
+
+    def filter(
+        self, predicate: Callable[[dict[str, Any]], bool]
+    ) -> "ColumnarCollection":
+        """
+        Keep the rows satisfying a predicate that receives each row dictionary.
+
+        Use where() when the condition only involves one field, to avoid
+        building the rows.
+
+        Returns:
+            A new ColumnarCollection with the matching rows.
+        """
+        return self._select([i for i, row in enumerate(self) if predicate(row)])
+
+    def where(self, key: str, predicate: Callable[[Any], bool]) -> "ColumnarCollection":
+        """
+        Keep the rows whose value for one field satisfies a predicate.
+
+        Args:
+            key: The column to test.
+            predicate: A callable that takes a single value and returns a boolean.
+
+        Returns:
+            A new ColumnarCollection with the matching rows.
+
+        Raises:
+            KeyError: If there is no such column.
+
+        Examples:
+            orders.where("price", lambda price: price > 100)
+        """
+        if key not in self._columns:
+            raise KeyError(f"Column '{key}' not found")
+        column = self._columns[key]
+        return self._select([i for i, value in enumerate(column) if predicate(value)])
+
+    def group_by(
+        self, key: str | Callable[[dict[str, Any]], Any] | None = None
+    ) -> dict[Any, "ColumnarCollection"]:
+        """
+        Group the rows by a field or callback, like Collection.group_by.
+
+        Grouping by a column reads only that column; the other columns are
+        then gathered per group.
+
+        Returns:
+            A dictionary from group key to a ColumnarCollection of that group.
+        """
+        column = self._columns.get(key) if isinstance(key, str) else None
+        if column is None:
+            get_key = resolve_key(key)
+            column = [get_key(row) for row in self]
+
+        groups = group_items(range(self._length), column.__getitem__)
+        return {group_key: self._select(rows) for group_key, rows in groups.items()}
+
+    def to_dict(self, mode: str | None = None) -> list[dict[str, Any]]:
+        """
+        Return the rows converted like Collection.to_dict.
+
+        Args:
+            mode: When set to "json", ensures the returned structure is JSON-serializable.
+
+        Returns:
+            A list of dictionaries.
+        """
+        return to_plain(self, json_mode=mode == "json")
+
+    def to_json(self) -> str:
+        """Return a JSON string representing the rows."""
+        return json.dumps(self.to_dict(mode="json"), ensure_ascii=False)
+
+    def _select(self, positions: Sequence[int]) -> "ColumnarCollection":
+        """Build a new columnar collection from the rows at the given positions."""
+        columns = {
+            name: _take(values, positions) for name, values in self._columns.items()
+        }
+        return ColumnarCollection._from_columns(columns, len(positions))
+
+    def __str__(self) -> str:
+        """Return a string representation of the collection."""
+        return f"{self.__class__.__name__}(columns={self.columns}, rows={self._length})"
+
+    def __repr__(self) -> str:
+        """Return a detailed string representation of the collection."""
+        return self.__str__()
@@ -0,0 +1,249 @@
+"""Canonical hashable keys for comparing unhashable values by structure."""
+
+import math
+import random
+from array import array
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import fields, is_dataclass
+from typing import Any
+
+type Freezer = Callable[[Any], Hashable]
+
+# Dictionaries and lists, the common shapes of JSON data, freeze to a bare
+# frozenset and tuple. Every other container is tagged, so [1, 2], (1, 2) and
+# {1, 2} never share a key
+_TUPLE = object()
+_SET = object()
+_OBJECT = object()
+_TEXT = object()
+
+_MAX_CACHED_TYPES = 1024
+
+# Bloom filter layout: every key sets all its bits in a single 64-bit word,
+# chosen by the key's hash, using one of 2**16 precomputed bit masks
+_WORD_BITS = 64
+_MASK_TABLE_BITS = 16
+_mask_tables: dict[int, array[int]] = {}
+
+_freezers: dict[type, Freezer | None] = {}
+
+
+def canonical_key(value: Any) -> Hashable:
+    """
+    Return a hashable key that is equal for structurally equal values.
+
+    Hashable values are returned unchanged, so they compare exactly as they do
+    in a set or dict. Unhashable values are frozen recursively: lists become
+    tagged tuples, dictionaries become tagged frozensets of their items (so key
+    order does not matter), and tuples, sets and unhashable dataclasses and
+    objects are tagged and keyed by their (frozen) contents. Values with no
+    structure to inspect fall back to their type and str(). Containers are
+    frozen even when hashable, so equal tuples and sets of any type still
+    share a key.
+
+    The freezing strategy is resolved once per type and cached.
+
+    Args:
+        value: Any value.
+
+    Returns:
+        A hashable key.
+
+    Examples:
+        >>> canonical_key({"a": 1, "b": [2]}) == canonical_key({"b": [2], "a": 1})
+        True
+    """
+    cls = type(value)
+    try:
+        freeze = _freezers[cls]
+    except KeyError:
+        freeze = _resolve(cls)
+        if len(_freezers) < _MAX_CACHED_TYPES:
+            _freezers[cls] = freeze
+    return value if freeze is None else freeze(value)
+
+
+def canonical_keys(values: Iterable[Any]) -> list[Hashable]:
+    """
+    Return the canonical key of every value, in order.
+
+    The cyclic garbage collector is left alone: it is process-wide state, and
+    pausing it here would also pause it for every other thread.
+    """
+    return list(map(canonical_key, values))
+
+
+def _resolve(cls: type) -> Freezer | None:
+    """Pick the freezing strategy for a type; None means the value is its own key."""
+    if issubclass(cls, tuple):
+        return _freeze_tuple
+    if issubclass(cls, list):
+        return _freeze_list
+    if issubclass(cls, dict):
+        return _freeze_dict
+    if issubclass(cls, set | frozenset):
+        return _freeze_set
+    if cls.__hash__ is not None:
+        return None
+    if is_dataclass(cls):
+        return _freeze_dataclass
+    return _freeze_object
+
+
+def _freeze_tuple(value: tuple[Any, ...]) -> Hashable:
+    return (_TUPLE, tuple(map(canonical_key, value)))
+
+
+def _freeze_set(value: set[Any] | frozenset[Any]) -> Hashable:
+    return (_SET, frozenset(map(canonical_key, value)))
+
+
+def _freeze_list(value: list[Any]) -> Hashable:
+    return tuple(map(canonical_key, value))
+
+
+def _freeze_dict(value: dict[Any, Any]) -> Hashable:
+    return frozenset(zip(value.keys(), map(canonical_key, value.values()), strict=True))
+
+
+def _freeze_dataclass(value: Any) -> Hashable:
+    return (
+        _OBJECT,
+        type(value),
+        tuple(canonical_key(getattr(value, field.name)) for field in fields(value)),
+    )
+
+
+def _freeze_object(value: Any) -> Hashable:
+    attributes = getattr(value, "__dict__", None)
+    if attributes is None:
+        return (_TEXT, type(value), str(value))
+    return (_OBJECT, type(value), _freeze_dict(attributes))
+
+
+def _mask_table(bits_per_key: int) -> array[int]:
+    """Return the shared table of word masks with bits_per_key bits set."""
+    table = _mask_tables.get(bits_per_key)
+    if table is None:
+        rng = random.Random(bits_per_key)
+        table = array("Q")
+        for _ in range(1 << _MASK_TABLE_BITS):
+            mask = 0
+            while mask.bit_count() < bits_per_key:
+                mask |= 1 << rng.getrandbits(6)
+            table.append(mask)
+        _mask_tables[bits_per_key] = table
+    return table
+
+
+def _blocked_false_positive_rate(load: float, bits_per_key: int) -> float:
+    """
+    False positive rate of a filter whose words hold `load` keys on average.
+
+    The number of keys per word follows a Poisson distribution; a word holding
+    j keys has each of its bits set with probability 1 - (1 - 1/64)**(k*j).
+    """
+    rate = 0.0
+    probability = math.exp(-load)
+    for keys in range(int(load + 10 * math.sqrt(load) + 20)):
+        if keys:
+            probability *= load / keys
+        filled = 1 - (1 - 1 / _WORD_BITS) ** (bits_per_key * keys)
+        rate += probability * filled**bits_per_key
+    return rate
+
+
+def _bloom_layout(capacity: int, error_rate: float) -> tuple[int, int]:
+    """
+    Pick the number of words and bits per key meeting the error rate.
+
+    Starts from the size of a classic Bloom filter and grows it by 5% until
+    the best number of bits per key reaches the target.
+    """
+    words = max(1, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2 / 64))
+    while True:
+        load = capacity / words
+        rate, bits_per_key = min(
+            (_blocked_false_positive_rate(load, k), k) for k in range(1, 33)
+        )
+        if rate <= error_rate:
+            return words, bits_per_key
+        words = math.ceil(words * 1.05)
+
+
+def check_bloom_parameters(capacity: Any, error_rate: Any) -> None:
+    """
+    Validate the arguments of BloomFilter without allocating one.
+
+    Raises:
+        ValueError: If capacity is not a positive integer or error_rate is not
+                    between 0 and 1.
+    """
+    if not isinstance(capacity, int) or capacity <= 0:
+        raise ValueError("Capacity must be a positive integer")
+    if not 0 < error_rate < 1:
+        raise ValueError("Error rate must be between 0 and 1")
+
+
+class BloomFilter:
+    """
+    A fixed-size set of hashable keys that may report false positives.
+
+    Memory depends only on the capacity and error rate (about 1.5 bytes per
+    expected key at a 1% error rate, 3 bytes at 0.1%), never on the keys
+    themselves. A key that was added is always reported as present; a key that
+    was not added is wrongly reported as present with a probability of about
+    error_rate, as long as no more than capacity keys were added. Rates below
+    about 1e-4 are not reached exactly.
+
+    The filter is blocked: each key sets all its bits in one 64-bit word, so
+    adding or testing a key is a single mask comparison instead of one probe
+    per bit. Keys are hashed with Python's hash(), so a filter is only
+    meaningful within one process.
+
+    Args:
+        capacity: Expected number of distinct keys.
+        error_rate: Target false positive probability, between 0 and 1.
+
+    Raises:
+        ValueError: If capacity or error_rate is out of range.
+    """
+
+    __slots__ = ("_masks", "_words")
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        check_bloom_parameters(capacity, error_rate)
+        words, bits_per_key = _bloom_layout(capacity, error_rate)
+        self._words = array("Q", [0]) * words
+        self._masks = _mask_table(bits_per_key)
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the filter's words."""
+        return len(self._words) * self._words.itemsize
+
+    def add(self, key: Hashable) -> bool:
+        """
+        Add a key.
+
+        Returns:
+            True if the key was (probably) present already, False if it is new.
+        """
+        # Hashing a 1-tuple mixes the bits of hash(key), which is the identity
+        # for small ints
+        mixed = hash((key,)) & 0xFFFFFFFFFFFFFFFF
+        words = self._words
+        index = (mixed >> _MASK_TABLE_BITS) % len(words)
+        mask = self._masks[mixed & 0xFFFF]
+        word = words[index]
+        if word & mask == mask:
+            return True
+        words[index] = word | mask
+        return False
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check whether a key was (probably) added."""
+        mixed = hash((key,)) & 0xFFFFFFFFFFFFFFFF
+        words = self._words
+        mask = self._masks[mixed & 0xFFFF]
+        return words[(mixed >> _MASK_TABLE_BITS) % len(words)] & mask == mask
@@ -0,0 +1,130 @@
+"""Compiled key accessors shared by the Collection mixins."""
+
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+_MISSING = object()
+
+
+def _identity(item: Any) -> Any:
+    return item
+
+
+def _lenient_getter(name: str) -> Callable[[Any], Any]:
+    """Build a getter for one path segment that returns None when missing."""
+
+    def get(obj: Any) -> Any:
+        if isinstance(obj, dict):
+            return obj.get(name)
+        return getattr(obj, name, None)
+
+    return get
+
+
+def _strict_getter(name: str) -> Callable[[Any], Any]:
+    """Build a getter for one path segment that raises when missing."""
+
+    def get(obj: Any) -> Any:
+        if isinstance(obj, dict):
+            if name not in obj:
+                raise KeyError(f"Key '{name}' not found in item: {obj}")
+            return obj[name]
+        try:
+            return getattr(obj, name)
+        except AttributeError:
+            raise AttributeError(f"Item {obj} has no attribute '{name}'") from None
+
+    return get
+
+
+def _literal(obj: Any, key: str) -> Any:
+    """Look up a whole dotted key as one dict key or attribute name."""
+    if isinstance(obj, dict):
+        return obj.get(key, _MISSING)
+    return getattr(obj, key, _MISSING)
+
+
+@lru_cache(maxsize=256)
+def compile_key(key: str, strict: bool = False) -> Callable[[Any], Any]:
+    """
+    Compile a key string into a reusable accessor.
+
+    The key is split on dots once, and each segment gets a getter that reads
+    dictionary keys for dict items and attributes for any other object. A
+    dotted key is first looked up literally, so flat keys that contain a dot
+    (such as "a.b" in {"a.b": 1}) keep working; the path is only followed
+    when that lookup misses. Accessors are memoized per key string, so
+    repeated calls with the same key reuse the same callable.
+
+    Args:
+        key: The key or attribute name, with dots separating nested levels.
+        strict: If False, a missing key or attribute (or a None value along the
+                path) makes the accessor return None. If True, a missing dict key
+                raises KeyError and a missing attribute raises AttributeError.
+
+    Returns:
+        A callable that takes an item and returns the value at the key path.
+
+    Examples:
+        >>> city = compile_key("address.city")
+        >>> city({"address": {"city": "NYC"}})
+        'NYC'
+        >>> city({"address": None}) is None
+        True
+    """
+    make_getter = _strict_getter if strict else _lenient_getter
+    getters = tuple(make_getter(name) for name in key.split("."))
+
+    if len(getters) == 1:
+        return getters[0]
+
+    if strict:
+
+        def get_path(item: Any) -> Any:
+            value = _literal(item, key)
+            if value is not _MISSING:
+                return value
+            for get in getters:
+                item = get(item)
+            return item
+
+    else:
+
+        def get_path(item: Any) -> Any:
+            value = _literal(item, key)
+            if value is not _MISSING:
+                return value
+            for get in getters:
+                item = get(item)
+                if item is None:
+                    return None
+            return item
+
+    return get_path
+
+
+def resolve_key(
+    key_or_callback: str | Callable[[Any], Any] | None, strict: bool = False
+) -> Callable[[Any], Any]:
+    """
+    Turn a None / key string / callable argument into a single callable.
+
+    Args:
+        key_or_callback: None to use the item itself, a key string (see
+                         compile_key), or a callable applied to each item.
+        strict: Passed to compile_key for key strings.
+
+    Returns:
+        A callable that takes an item and returns the value to work with.
+
+    Raises:
+        TypeError: If the argument is not None, a string or a callable.
+    """
+    if key_or_callback is None:
+        return _identity
+    if isinstance(key_or_callback, str):
+        return compile_key(key_or_callback, strict)
+    if callable(key_or_callback):
+        return key_or_callback
+    raise TypeError("Argument must be None, a string key, or a callable")
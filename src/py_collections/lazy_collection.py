@@ -0,0 +1,320 @@
+"""Lazy, single-pass pipeline over a Collection's items."""
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .mixins.math_operations import numeric_total
+from .mixins.sorting import select_k
+from .mixins.transformation import (
+    check_distinct_parameters,
+    iter_distinct,
+    make_plucker,
+)
+from .mixins.utility import _DEFAULT_JSON_CHUNK_SIZE, json_chunks
+from .serialization import to_plain
+
+if TYPE_CHECKING:
+    from .collection import Collection
+
+T = TypeVar("T")
+
+
+class LazyCollection[T]:
+    """
+    A deferred chain of map, filter, pluck, distinct and take operations.
+
+    A LazyCollection records the operations applied to it and only runs them
+    when a terminal operation is reached. Every item flows through the whole
+    chain before the next one is read, so no intermediate lists are built and
+    take() stops consuming the source once it has produced enough items.
+
+    Chaining methods never modify the LazyCollection they are called on; each
+    returns a new pipeline, so a partially built pipeline can be reused.
+
+    Args:
+        source: The iterable the pipeline reads from. It is not consumed until
+                a terminal operation runs.
+    """
+
+    __slots__ = ("_source", "_steps")
+
+    def __init__(
+        self,
+        source: Iterable[Any],
+        steps: tuple[tuple[str, Any], ...] = (),
+    ):
+        self._source = source
+        self._steps = steps
+
+    def _chain(self, op: str, arg: Any) -> "LazyCollection[Any]":
+        """Return a new pipeline with one more step appended."""
+        return LazyCollection(self._source, (*self._steps, (op, arg)))
+
+    def map(self, func: Callable[[T], Any]) -> "LazyCollection[Any]":
+        """
+        Record a map step.
+
+        Args:
+            func: A callable that takes an item and returns a transformed value.
+
+        Returns:
+            A new LazyCollection with the step appended.
+        """
+        return self._chain("map", func)
+
+    def filter(self, predicate: Callable[[T], bool]) -> "LazyCollection[T]":
+        """
+        Record a filter step.
+
+        Args:
+            predicate: A callable that takes an item and returns a boolean.
+                      Items that return True are kept.
+
+        Returns:
+            A new LazyCollection with the step appended.
+        """
+        return self._chain("filter", predicate)
+
+    def pluck(self, key: str, value_key: str | None = None) -> "LazyCollection[Any]":
+        """
+        Record a pluck step.
+
+        Uses the same extraction rules as Collection.pluck, including dot
+        notation for nested access.
+
+        Args:
+            key: The key or attribute to extract values from.
+            value_key: Optional key to use as the value of a single-entry dictionary.
+
+        Returns:
+            A new LazyCollection with the step appended.
+        """
+        return self._chain("pluck", (key, value_key))
+
+    def distinct(
+        self,
+        key_or_callback: str | Callable[[Any], Any] | None = None,
+        approximate: bool = False,
+        capacity: int | None = None,
+        error_rate: float = 0.01,
+    ) -> "LazyCollection[T]":
+        """
+        Record a distinct step, keeping the first item for each value.
+
+        Uses the same comparison rules as Collection.distinct. With
+        approximate=True the values seen are remembered in a fixed-size Bloom
+        filter, so memory stays bounded however long the source is.
+
+        Args:
+            key_or_callback: Optional key or callback whose values are compared.
+            approximate: Use a Bloom filter instead of an exact set.
+            capacity: Expected number of distinct values; required when approximate.
+            error_rate: Probability of wrongly dropping a new value (approximate only).
+
+        Returns:
+            A new LazyCollection with the step appended.
+
+        Raises:
+            ValueError: If approximate is set without a valid capacity and error rate.
+
+        Examples:
+            LazyCollection(read_events()).distinct(
+                "event_id", approximate=True, capacity=500_000_000
+            )
+        """
+        check_distinct_parameters(approximate, capacity, error_rate)
+        return self._chain(
+            "distinct", (key_or_callback, approximate, capacity, error_rate)
+        )
+
+    def take(self, count: int) -> "LazyCollection[T]":
+        """
+        Record a take step.
+
+        Args:
+            count: The number of items to take. If positive, takes from the beginning
+                   and stops reading the source once enough items were produced.
+                   If negative, takes from the end, which requires reading the
+                   whole source but only keeps the last items in memory.
+
+        Returns:
+            A new LazyCollection with the step appended.
+        """
+        return self._chain("take", count)
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Run the pipeline and iterate over its results.
+
+        Returns:
+            An iterator that produces each result as it is computed.
+        """
+        iterator: Iterator[Any] = iter(self._source)
+
+        for op, arg in self._steps:
+            if op == "map":
+                iterator = map(arg, iterator)
+            elif op == "filter":
+                iterator = filter(arg, iterator)
+            elif op == "pluck":
+                iterator = map(make_plucker(*arg), iterator)
+            elif op == "distinct":
+                iterator = iter_distinct(iterator, *arg)
+            elif arg >= 0:
+                iterator = islice(iterator, arg)
+            else:
+                iterator = iter(deque(iterator, maxlen=-arg))
+
+        return iterator
+
+    def collect(self) -> "Collection[Any]":
+        """
+        Run the pipeline and return its results as a Collection.
+
+        Returns:
+            A new Collection containing the results.
+        """
+        from .collection import Collection
+
+        return Collection._from_list(list(self))
+
+    def all(self) -> list[Any]:
+        """
+        Run the pipeline and return its results as a list.
+
+        Returns:
+            A list containing the results.
+        """
+        return list(self)
+
+    def first(self, predicate: Callable[[Any], bool] | None = None) -> Any | None:
+        """
+        Run the pipeline until the first (matching) result is found.
+
+        Args:
+            predicate: Optional callable that takes an item and returns a boolean.
+                      If provided, returns the first result that satisfies it.
+
+        Returns:
+            The first matching result, or None if there is none.
+        """
+        iterator = iter(self) if predicate is None else filter(predicate, self)
+        return next(iterator, None)
+
+    def exists(self, predicate: Callable[[Any], bool] | None = None) -> bool:
+        """
+        Run the pipeline until a (matching) result is found.
+
+        Args:
+            predicate: Optional callable that takes an item and returns a boolean.
+
+        Returns:
+            True if a matching result exists, False otherwise.
+        """
+        sentinel = object()
+        iterator = iter(self) if predicate is None else filter(predicate, self)
+        return next(iterator, sentinel) is not sentinel
+
+    def sum(
+        self, key_or_callback: str | Callable[[Any], int | float] | None = None
+    ) -> int | float:
+        """
+        Run the pipeline and sum its results.
+
+        Accepts the same arguments and raises the same errors as Collection.sum.
+        Results are summed as they are produced, without being collected.
+
+        Returns:
+            The sum of the values.
+        """
+        total, _ = numeric_total(self, key_or_callback, "sum")
+        return total
+
+    def average(
+        self, key_or_callback: str | Callable[[Any], int | float] | None = None
+    ) -> float:
+        """
+        Run the pipeline and average its results.
+
+        Accepts the same arguments and raises the same errors as Collection.average.
+        Results are summed and counted as they are produced, without being
+        collected.
+
+        Returns:
+            The average of the values.
+        """
+        total, count = numeric_total(
+            self, key_or_callback, "average", allow_empty=False
+        )
+        return total / count
+
+    def top_k(
+        self, k: int, key_or_callback: str | Callable[[Any], Any] | None = None
+    ) -> "Collection[Any]":
+        """
+        Run the pipeline and keep only the k largest results, largest first.
+
+        Accepts the same arguments and raises the same errors as
+        Collection.top_k, but never holds more than k results, so it can rank
+        a generator of any length.
+
+        Returns:
+            A new Collection with at most k results.
+        """
+        from .collection import Collection
+
+        return Collection._from_list(select_k(self, k, key_or_callback, True))
+
+    def bottom_k(
+        self, k: int, key_or_callback: str | Callable[[Any], Any] | None = None
+    ) -> "Collection[Any]":
+        """
+        Run the pipeline and keep only the k smallest results, smallest first.
+
+        Accepts the same arguments and raises the same errors as
+        Collection.bottom_k, holding at most k results.
+
+        Returns:
+            A new Collection with at most k results.
+        """
+        from .collection import Collection
+
+        return Collection._from_list(select_k(self, k, key_or_callback, False))
+
+    def to_dict(self, mode: str | None = None) -> list[Any]:
+        """
+        Run the pipeline and convert its results like Collection.to_dict.
+
+        Each result is converted as it is produced, without collecting the
+        unconverted results first.
+
+        Args:
+            mode: When set to "json", ensures the returned structure is JSON-serializable.
+
+        Returns:
+            A list containing the converted results.
+        """
+        return to_plain(self, json_mode=mode == "json")
+
+    def to_json(self) -> str:
+        """
+        Run the pipeline and return its results as a JSON string.
+
+        Results are converted and encoded in chunks as they are produced (as
+        by Collection.iter_json), so only the text is built in full.
+
+        Returns:
+            A JSON-formatted string, the same as collect().to_json().
+        """
+        return "".join(json_chunks(self, _DEFAULT_JSON_CHUNK_SIZE))
+
+    def __str__(self) -> str:
+        """Return a string representation of the pipeline."""
+        steps = ", ".join(op for op, _ in self._steps)
+        return f"{self.__class__.__name__}(steps=[{steps}])"
+
+    def __repr__(self) -> str:
+        """Return a detailed string representation of the pipeline."""
+        return self.__str__()
@@ -1,21 +1,31 @@
 """Mixin classes for Collection functionality."""
 
 from .basic_operations import BasicOperationsMixin
+from .concurrency import ConcurrencyMixin
 from .element_access import ElementAccessMixin
 from .grouping import GroupingMixin
+from .indexing import IndexingMixin
+from .ingestion import IngestionMixin
 from .math_operations import MathOperationsMixin
 from .navigation import NavigationMixin
 from .removal import RemovalMixin
+from .sorting import SortingMixin
+from .storage import StorageMixin
 from .transformation import TransformationMixin
 from .utility import UtilityMixin
 
 __all__ = [
     "BasicOperationsMixin",
+    "ConcurrencyMixin",
     "ElementAccessMixin",
     "GroupingMixin",
+    "IndexingMixin",
+    "IngestionMixin",
     "MathOperationsMixin",
     "NavigationMixin",
     "RemovalMixin",
+    "SortingMixin",
+    "StorageMixin",
     "TransformationMixin",
     "UtilityMixin",
 ]
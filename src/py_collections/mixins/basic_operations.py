@@ -1,16 +1,21 @@
 """Basic operations mixin for Collection class."""
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, TypeVar, Union
 
+from .storage import StorageMixin
+
 if TYPE_CHECKING:
     from ..collection import Collection
 
 T = TypeVar("T")
 
 
-class BasicOperationsMixin[T]:
+class BasicOperationsMixin[T](StorageMixin[T]):
     """Mixin providing basic collection operations."""
 
+    __slots__ = ()
+
     def append(self, item: T) -> None:
         """
         Append an item to the collection.
@@ -18,7 +23,9 @@ class BasicOperationsMixin[T]:
         Args:
             item: The item to append to the collection.
         """
-        self._items.append(item)
+        self._own_items().append(item)
+        if self._index is not None:
+            self._index_appended(len(self._items) - 1)
 
     def extend(self, items: Union[list[T], "Collection[T]"]) -> None:
         """
@@ -28,15 +35,35 @@ class BasicOperationsMixin[T]:
             items: A list or Collection containing items to add to the current collection.
         """
         if hasattr(items, "_items"):  # Check if it's a Collection-like object
-            self._items.extend(items._items)
-        else:
-            self._items.extend(items)
+            items = items._items
+        if not isinstance(items, list | tuple):
+            # Read views and other iterables before _own_items() counts the
+            # change: a view of this collection would otherwise see it as
+            # modified, and a failing iterable would leave it half-extended
+            items = list(items)
+        own_items = self._own_items()
+        start = len(own_items)
+        own_items.extend(items)
+        if self._index is not None:
+            self._index_appended(start)
 
-    def all(self) -> list[T]:
+    def all(self, copy: bool = True) -> list[T] | Sequence[T]:
         """
         Get all items in the collection as a list.
 
+        Args:
+            copy: Whether to copy the items into a new list. Pass False to get
+                  a read-only sequence over the collection's own list instead,
+                  without copying. It supports len(), indexing, slicing (to a
+                  list), iteration, ``in`` and comparison with lists, and
+                  raises RuntimeError once the collection is modified.
+
         Returns:
-            A list containing all items in the collection.
+            A list containing all items in the collection, or a read-only
+            sequence of them when copy is False.
         """
-        return self._items.copy()
+        if copy:
+            return self._items.copy()
+        from ..collection_view import _Window
+
+        return _Window(self, range(len(self._items)))
@@ -0,0 +1,270 @@
+"""Concurrency mixin for Collection class."""
+
+import asyncio
+import math
+import os
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from ..collection import Collection
+
+T = TypeVar("T")
+
+# Aim for a few chunks per worker so uneven chunks still balance out
+_CHUNKS_PER_WORKER = 4
+
+# Default number of coroutines amap/afilter/afirst keep in flight
+_DEFAULT_CONCURRENCY = 10
+
+
+def _map_chunk(func: Callable[[Any], Any], items: list[Any]) -> list[Any]:
+    """Apply func to one chunk (module level so process pools can pickle it)."""
+    return [func(item) for item in items]
+
+
+def _filter_chunk(predicate: Callable[[Any], bool], items: list[Any]) -> list[Any]:
+    """Filter one chunk (module level so process pools can pickle it)."""
+    return [item for item in items if predicate(item)]
+
+
+def _concat(chunks: Any) -> list[Any]:
+    """Join chunk results into a single list."""
+    items: list[Any] = []
+    for chunk in chunks:
+        items.extend(chunk)
+    return items
+
+
+def _check_concurrency(concurrency: int) -> None:
+    """Validate the concurrency argument of the async methods."""
+    if not isinstance(concurrency, int) or concurrency <= 0:
+        raise ValueError("Concurrency must be a positive integer")
+
+
+async def _run_workers(worker: Callable[[], Awaitable[None]], count: int) -> None:
+    """
+    Run `count` copies of a worker coroutine until all of them finish.
+
+    Workers share one iterator of positions, so each position is handled
+    once. If a worker fails, the others are cancelled and the error is
+    re-raised unchanged.
+    """
+    tasks = [asyncio.create_task(worker()) for _ in range(count)]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+class ConcurrencyMixin[T]:
+    """Mixin providing parallel and asynchronous transformation methods."""
+
+    __slots__ = ()
+
+    def pmap(
+        self,
+        func: Callable[[T], Any],
+        workers: int | None = None,
+        chunksize: int | None = None,
+        executor: str | Executor = "thread",
+    ) -> "Collection[Any]":
+        """
+        Apply a function to every item in parallel, keeping the original order.
+
+        The items are split into chunks (as chunk() does), each chunk is mapped
+        by a worker, and the results are reassembled in order.
+
+        Args:
+            func: A callable that takes an item and returns a transformed value.
+                  With executor="process", it must be picklable (a module-level
+                  function, not a lambda or closure).
+            workers: Maximum number of workers. Defaults to the CPU count.
+            chunksize: Number of items sent to a worker at a time. Defaults to
+                       splitting the items into about four chunks per worker.
+            executor: "thread" for a thread pool (best for I/O-bound functions),
+                      "process" for a process pool (best for CPU-bound functions),
+                      or an existing concurrent.futures.Executor to reuse. A pool
+                      created here is shut down before returning; a passed-in
+                      executor is left running.
+
+        Returns:
+            A new Collection containing the transformed items.
+
+        Raises:
+            ValueError: If workers or chunksize is not a positive integer, or
+                        executor is not a supported name.
+
+        Examples:
+            collection.pmap(enrich, workers=32, executor="process")
+        """
+        return self._run_chunked(_map_chunk, func, workers, chunksize, executor)
+
+    def pfilter(
+        self,
+        predicate: Callable[[T], bool],
+        workers: int | None = None,
+        chunksize: int | None = None,
+        executor: str | Executor = "thread",
+    ) -> "Collection[T]":
+        """
+        Filter the collection in parallel, keeping the original order.
+
+        Takes the same workers, chunksize and executor arguments as pmap().
+
+        Args:
+            predicate: A callable that takes an item and returns a boolean.
+                       Items that return True are kept.
+
+        Returns:
+            A new Collection containing only the items that satisfy the predicate.
+        """
+        return self._run_chunked(_filter_chunk, predicate, workers, chunksize, executor)
+
+    def _run_chunked(
+        self,
+        chunk_func: Callable[[Callable[[Any], Any], list[Any]], list[Any]],
+        func: Callable[[Any], Any],
+        workers: int | None,
+        chunksize: int | None,
+        executor: str | Executor,
+    ) -> "Collection[Any]":
+        """Split the items, run chunk_func on each chunk in a pool and join the results."""
+        from ..collection import Collection
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        elif not isinstance(workers, int) or workers <= 0:
+            raise ValueError("Workers must be a positive integer")
+
+        if isinstance(executor, str) and executor not in ("thread", "process"):
+            raise ValueError("Executor must be 'thread', 'process' or an Executor")
+
+        if not self._items:
+            return Collection()
+
+        if chunksize is None:
+            chunksize = math.ceil(len(self._items) / (workers * _CHUNKS_PER_WORKER))
+        chunks = self._chunk_lists(chunksize)
+
+        if isinstance(executor, Executor):
+            results = executor.map(chunk_func, repeat(func), chunks)
+            return Collection._from_list(_concat(results))
+
+        pool_class = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+        with pool_class(max_workers=min(workers, len(chunks))) as pool:
+            results = pool.map(chunk_func, repeat(func), chunks)
+            return Collection._from_list(_concat(results))
+
+    async def amap(
+        self,
+        func: Callable[[T], Awaitable[Any]],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+    ) -> "Collection[Any]":
+        """
+        Await an async function for every item with bounded concurrency.
+
+        At most `concurrency` calls are in flight at any time. Results keep the
+        order of the items, regardless of which call finishes first.
+
+        Args:
+            func: An async callable that takes an item and returns a value.
+            concurrency: Maximum number of calls awaited at the same time.
+
+        Returns:
+            A new Collection containing the results.
+
+        Raises:
+            ValueError: If concurrency is not a positive integer.
+
+        Examples:
+            profiles = await user_ids.amap(fetch_profile, concurrency=50)
+        """
+        from ..collection import Collection
+
+        return Collection._from_list(await self._gather_bounded(func, concurrency))
+
+    async def afilter(
+        self,
+        predicate: Callable[[T], Awaitable[bool]],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+    ) -> "Collection[T]":
+        """
+        Filter the collection with an async predicate and bounded concurrency.
+
+        Args:
+            predicate: An async callable that takes an item and returns a boolean.
+                       Items that return True are kept, in their original order.
+            concurrency: Maximum number of calls awaited at the same time.
+
+        Returns:
+            A new Collection containing only the items that satisfy the predicate.
+
+        Raises:
+            ValueError: If concurrency is not a positive integer.
+        """
+        from ..collection import Collection
+
+        keep = await self._gather_bounded(predicate, concurrency)
+        return Collection._from_list(
+            [item for item, kept in zip(self._items, keep, strict=False) if kept]
+        )
+
+    async def afirst(
+        self,
+        predicate: Callable[[T], Awaitable[bool]],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+    ) -> T | None:
+        """
+        Find the first item satisfying an async predicate, with bounded concurrency.
+
+        Items are checked in order with up to `concurrency` calls in flight. Once
+        a match is found, no later items are started; calls already running for
+        earlier items are awaited, so the earliest match is always returned.
+
+        Args:
+            predicate: An async callable that takes an item and returns a boolean.
+            concurrency: Maximum number of calls awaited at the same time.
+
+        Returns:
+            The first item that satisfies the predicate, or None if there is none.
+
+        Raises:
+            ValueError: If concurrency is not a positive integer.
+        """
+        _check_concurrency(concurrency)
+        items = self._items
+        positions = iter(range(len(items)))
+        found = len(items)
+
+        async def worker() -> None:
+            nonlocal found
+            for i in positions:
+                if i > found:
+                    return
+                if await predicate(items[i]) and i < found:
+                    found = i
+
+        await _run_workers(worker, min(concurrency, len(items)))
+        return items[found] if found < len(items) else None
+
+    async def _gather_bounded(
+        self, func: Callable[[Any], Awaitable[Any]], concurrency: int
+    ) -> list[Any]:
+        """Await func for every item with at most `concurrency` calls in flight."""
+        _check_concurrency(concurrency)
+        items = self._items
+        results: list[Any] = [None] * len(items)
+        positions = iter(range(len(items)))
+
+        async def worker() -> None:
+            for i in positions:
+                results[i] = await func(items[i])
+
+        await _run_workers(worker, min(concurrency, len(items)))
+        return results
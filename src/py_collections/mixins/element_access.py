@@ -1,8 +1,12 @@
 """Element access mixin for Collection class."""
 
 from collections import Counter
-from collections.abc import Callable
-from typing import TYPE_CHECKING, TypeVar, Union
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar, Union
+
+from ..hashing import canonical_keys
+from ..key_access import resolve_key
 
 if TYPE_CHECKING:
     from ..collection import Collection
@@ -10,13 +14,61 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 
 
+def _count_table(
+    values: list[Any], keys: list[Hashable], counts: Counter[Hashable]
+) -> dict[Any, int]:
+    """
+    Turn the counts of comparison keys into counts of values.
+
+    Frozen keys are replaced by the first value that produced them, using
+    the string form of unhashable values.
+    """
+    if keys is values:
+        return dict(counts)
+
+    first_values: dict[Hashable, Any] = {}
+    for value, key in zip(values, keys, strict=True):
+        first_values.setdefault(key, value)
+
+    table: dict[Any, int] = {}
+    for key, count in counts.items():
+        value = first_values[key]
+        try:
+            hash(value)
+        except TypeError:
+            value = str(value)
+        table[value] = table.get(value, 0) + count
+    return table
+
+
 class ItemNotFoundException(Exception):
     """Exception raised when an item is not found in the collection."""
 
 
+@dataclass(frozen=True, slots=True)
+class MultiplicityPartition[T]:
+    """
+    Result of Collection.partition_by_multiplicity().
+
+    Attributes:
+        duplicates: One instance of each item whose value appears more than once,
+                    as returned by find_duplicates().
+        uniques: The items whose value appears exactly once, as returned by
+                 find_uniques().
+        counts: The number of occurrences of each value, as returned by
+                value_counts().
+    """
+
+    duplicates: "Collection[T]"
+    uniques: "Collection[T]"
+    counts: dict[Any, int]
+
+
 class ElementAccessMixin[T]:
     """Mixin providing element access methods."""
 
+    __slots__ = ()
+
     def first(self, predicate: Callable[[T], bool] | None = None) -> T | None:
         """
         Get the first element in the collection.
@@ -63,7 +115,7 @@ class ElementAccessMixin[T]:
         """
         return not self.exists(predicate)
 
-    def find_duplicates(  # noqa: PLR0912
+    def find_duplicates(
         self, key_or_callback: str | Callable[[T], any] | None = None
     ) -> "Collection[T]":
         """
@@ -96,68 +148,22 @@ class ElementAccessMixin[T]:
 
             return Collection([])
 
-        # Determine what to compare for duplicates
-        if key_or_callback is None:
-            # Compare objects directly
-            values_to_compare = self._items
-        elif isinstance(key_or_callback, str):
-            # Extract values from the specified key/attribute
-            values_to_compare = []
-            for item in self._items:
-                if isinstance(item, dict):
-                    if key_or_callback not in item:
-                        raise KeyError(
-                            f"Key '{key_or_callback}' not found in item: {item}"
-                        )
-                    values_to_compare.append(item[key_or_callback])
-                elif hasattr(item, key_or_callback):
-                    values_to_compare.append(getattr(item, key_or_callback))
-                else:
-                    raise AttributeError(
-                        f"Item {item} has no attribute '{key_or_callback}'"
-                    )
-        elif callable(key_or_callback):
-            # Apply callback to each item
-            values_to_compare = [key_or_callback(item) for item in self._items]
-        else:
-            raise TypeError("Argument must be None, a string key, or a callable")
-
-        # Count occurrences of each value
-        # Handle unhashable types by converting to tuples for counting
-        try:
-            value_counts = Counter(values_to_compare)
-        except TypeError:
-            # If values are unhashable, use a different approach
-            value_counts = {}
-            for value in values_to_compare:
-                # Convert to string representation for unhashable types
-                key = (
-                    str(value)
-                    if not isinstance(value, int | float | str | bool | type(None))
-                    else value
-                )
-                value_counts[key] = value_counts.get(key, 0) + 1
+        _, keys, counts = self._count_keys(key_or_callback)
 
-        # Find items that appear more than once (only one instance of each duplicate)
+        # Keep the first instance of each key that appears more than once
         duplicate_items = []
         seen_duplicates = set()
-        for i, value in enumerate(values_to_compare):
-            # Use the same key strategy for checking counts
-            key = (
-                str(value)
-                if not isinstance(value, int | float | str | bool | type(None))
-                else value
-            )
-            if value_counts[key] > 1 and key not in seen_duplicates:
-                duplicate_items.append(self._items[i])
+        for item, key in zip(self._items, keys, strict=True):
+            if counts[key] > 1 and key not in seen_duplicates:
+                duplicate_items.append(item)
                 seen_duplicates.add(key)
 
         # Create Collection instance dynamically to avoid circular import
         from ..collection import Collection
 
-        return Collection(duplicate_items)
+        return Collection._from_list(duplicate_items)
 
-    def find_uniques(  # noqa: PLR0912
+    def find_uniques(
         self, key_or_callback: str | Callable[[T], any] | None = None
     ) -> "Collection[T]":
         """
@@ -190,64 +196,93 @@ class ElementAccessMixin[T]:
 
             return Collection([])
 
-        # Determine what to compare for uniqueness
-        if key_or_callback is None:
-            # Compare objects directly
-            values_to_compare = self._items
-        elif isinstance(key_or_callback, str):
-            # Extract values from the specified key/attribute
-            values_to_compare = []
-            for item in self._items:
-                if isinstance(item, dict):
-                    if key_or_callback not in item:
-                        raise KeyError(
-                            f"Key '{key_or_callback}' not found in item: {item}"
-                        )
-                    values_to_compare.append(item[key_or_callback])
-                elif hasattr(item, key_or_callback):
-                    values_to_compare.append(getattr(item, key_or_callback))
-                else:
-                    raise AttributeError(
-                        f"Item {item} has no attribute '{key_or_callback}'"
-                    )
-        elif callable(key_or_callback):
-            # Apply callback to each item
-            values_to_compare = [key_or_callback(item) for item in self._items]
-        else:
-            raise TypeError("Argument must be None, a string key, or a callable")
-
-        # Count occurrences of each value
-        # Handle unhashable types by converting to tuples for counting
-        try:
-            value_counts = Counter(values_to_compare)
-        except TypeError:
-            # If values are unhashable, use a different approach
-            value_counts = {}
-            for value in values_to_compare:
-                # Convert to string representation for unhashable types
-                key = (
-                    str(value)
-                    if not isinstance(value, int | float | str | bool | type(None))
-                    else value
-                )
-                value_counts[key] = value_counts.get(key, 0) + 1
+        _, keys, counts = self._count_keys(key_or_callback)
+        unique_items = [
+            item
+            for item, key in zip(self._items, keys, strict=True)
+            if counts[key] == 1
+        ]
 
-        # Find items that appear exactly once
-        unique_items = []
-        for i, value in enumerate(values_to_compare):
-            # Use the same key strategy for checking counts
-            key = (
-                str(value)
-                if not isinstance(value, int | float | str | bool | type(None))
-                else value
-            )
-            if value_counts[key] == 1:
-                unique_items.append(self._items[i])
+        # Create Collection instance dynamically to avoid circular import
+        from ..collection import Collection
+
+        return Collection._from_list(unique_items)
+
+    def partition_by_multiplicity(
+        self, key_or_callback: str | Callable[[T], Any] | None = None
+    ) -> MultiplicityPartition[T]:
+        """
+        Split the collection by how often each value occurs, in a single pass.
 
+        Equivalent to calling find_duplicates(), find_uniques() and
+        value_counts() with the same argument, but the values are extracted
+        and counted only once.
+
+        Args:
+            key_or_callback: Optional key or callback function, as for
+                             find_duplicates().
+
+        Returns:
+            A MultiplicityPartition with the duplicates, uniques and counts.
+
+        Examples:
+            >>> result = Collection([1, 2, 2, 3]).partition_by_multiplicity()
+            >>> result.duplicates, result.uniques, result.counts
+            (Collection([2]), Collection([1, 3]), {1: 1, 2: 2, 3: 1})
+        """
         # Create Collection instance dynamically to avoid circular import
         from ..collection import Collection
 
-        return Collection(unique_items)
+        values, keys, counts = self._count_keys(key_or_callback)
+
+        duplicate_items = []
+        unique_items = []
+        seen_duplicates = set()
+        for item, key in zip(self._items, keys, strict=True):
+            count = counts[key]
+            if count == 1:
+                unique_items.append(item)
+            elif key not in seen_duplicates:
+                duplicate_items.append(item)
+                seen_duplicates.add(key)
+
+        return MultiplicityPartition(
+            duplicates=Collection._from_list(duplicate_items),
+            uniques=Collection._from_list(unique_items),
+            counts=_count_table(values, keys, counts),
+        )
+
+    def value_counts(
+        self, key_or_callback: str | Callable[[T], Any] | None = None
+    ) -> dict[Any, int]:
+        """
+        Count the occurrences of each value.
+
+        Values are compared like in find_duplicates(): unhashable values by
+        structure. In the result, an unhashable value is represented by the
+        string form of its first occurrence, as in group_by().
+
+        Args:
+            key_or_callback: Optional key or callback function.
+                - If None: counts the items themselves
+                - If str: counts the values of the specified key/attribute
+                - If callable: counts the results of the callback
+
+        Returns:
+            A dictionary from value to number of occurrences, in order of first
+            occurrence.
+
+        Raises:
+            KeyError: If a dict item is missing the key.
+            AttributeError: If an object item is missing the attribute.
+
+        Examples:
+            >>> orders = Collection([{"status": "paid"}, {"status": "open"}, {"status": "paid"}])
+            >>> orders.value_counts("status")
+            {'paid': 2, 'open': 1}
+        """
+        values, keys, counts = self._count_keys(key_or_callback)
+        return _count_table(values, keys, counts)
 
     def first_or_raise(self, predicate: Callable[[T], bool] | None = None) -> T:
         """
@@ -288,6 +323,51 @@ class ElementAccessMixin[T]:
             raise IndexError("Cannot get last element from empty collection")
         return self._items[-1]
 
+    def _values_to_compare(
+        self, key_or_callback: str | Callable[[T], Any] | None
+    ) -> list[Any]:
+        """
+        Resolve the values used by find_duplicates and find_uniques.
+
+        Args:
+            key_or_callback: None to compare items directly, a key/attribute name
+                             (dot notation supported), or a callable.
+
+        Returns:
+            A list with one comparison value per item, in item order.
+
+        Raises:
+            KeyError: If a dict item is missing the key.
+            AttributeError: If an object item is missing the attribute.
+            TypeError: If the argument is not None, a string or a callable.
+        """
+        if key_or_callback is None:
+            return self._items
+        get_value = resolve_key(key_or_callback, strict=True)
+        return [get_value(item) for item in self._items]
+
+    def _count_keys(
+        self, key_or_callback: str | Callable[[T], Any] | None
+    ) -> tuple[list[Any], list[Hashable], Counter[Hashable]]:
+        """
+        Compute one comparison key per item and count the occurrences of each.
+
+        Hashable values are counted as they are. If any value is unhashable,
+        every value is replaced by its canonical structural key, so dictionaries
+        with the same items in a different order, or equal nested lists, count
+        as the same value. Each value is frozen only once.
+
+        Returns:
+            The values, the keys (the values list itself when every value is
+            hashable), both in item order, and the counts of the keys.
+        """
+        values = self._values_to_compare(key_or_callback)
+        try:
+            return values, values, Counter(values)
+        except TypeError:
+            keys = canonical_keys(values)
+            return values, keys, Counter(keys)
+
     def _find_first_index(
         self, predicate: Callable[[T], bool] | None = None
     ) -> int | None:
@@ -1,31 +1,259 @@
 """Grouping mixin for Collection class."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING, Any, TypeVar
 
+from ..key_access import resolve_key
+
 if TYPE_CHECKING:
     from ..collection import Collection
+    from ..collection_map import CollectionMap
 
 T = TypeVar("T")
 
 
+AGGREGATIONS = ("count", "sum", "avg", "min", "max")
+
+# Marks a min/max accumulator that has not seen a value yet
+_NO_VALUE = object()
+
+
+def _hashable_group_key(group_key: Any) -> str:
+    """
+    Convert an unhashable list, dict or set group key to its string form.
+
+    Raises:
+        TypeError: If the key is unhashable but not a list, dict or set.
+    """
+    if not isinstance(group_key, list | dict | set):
+        raise TypeError(f"unhashable group key: {type(group_key).__name__!r}")
+    return str(group_key)
+
+
+def _compile_aggregations(
+    aggs: dict[str, Any],
+) -> list[tuple[str, Callable[[Any], Any] | None, str]]:
+    """
+    Resolve aggregation specs into (operation, value getter, error prefix).
+
+    Raises:
+        ValueError: If no aggregations are given or an operation is unknown.
+    """
+    if not aggs:
+        raise ValueError("At least one aggregation is required")
+
+    compiled = []
+    for name, spec in aggs.items():
+        if isinstance(spec, str):
+            op, key_or_callback = spec, None
+        else:
+            op, key_or_callback = spec
+
+        if op not in AGGREGATIONS:
+            raise ValueError(
+                f"Unknown aggregation '{op}' for '{name}'; "
+                f"expected one of {', '.join(AGGREGATIONS)}"
+            )
+        if op == "count":
+            compiled.append((op, None, ""))
+            continue
+        if key_or_callback is None:
+            raise ValueError(f"Aggregation '{name}' needs a key or callback")
+
+        if isinstance(key_or_callback, str):
+            error = f"Value for key '{key_or_callback}' must be numeric"
+        else:
+            error = "Callback must return a numeric value"
+        compiled.append((op, resolve_key(key_or_callback, strict=True), error))
+    return compiled
+
+
+def _initial_state(specs: list[tuple[str, Any, str]]) -> list[Any]:
+    """Build the accumulators for a new group."""
+    state: list[Any] = []
+    for op, _, _ in specs:
+        if op == "avg":
+            state.append([0, 0])
+        elif op in ("min", "max"):
+            state.append(_NO_VALUE)
+        else:
+            state.append(0)
+    return state
+
+
+def _finalize(state: list[Any], names: list[str], specs: list[Any]) -> dict[str, Any]:
+    """Turn a group's accumulators into the reported values."""
+    result = {}
+    for name, (op, _, _), accumulated in zip(names, specs, state, strict=True):
+        if op == "avg":
+            total, count = accumulated
+            result[name] = total / count if count else None
+        elif accumulated is _NO_VALUE:
+            result[name] = None
+        else:
+            result[name] = accumulated
+    return result
+
+
+def aggregate_items[T](  # noqa: PLR0912
+    items: Iterable[T],
+    key: str | Callable[[T], Any] | None = None,
+    aggs: dict[str, Any] | None = None,
+) -> dict[Any, dict[str, Any]]:
+    """
+    Group and aggregate any iterable in a single pass, keeping only accumulators.
+
+    Args:
+        items: Any iterable, including generators. It is consumed once.
+        key: Grouping key, with the same forms as group_items().
+        aggs: Mapping from result name to an aggregation spec: "count", or an
+              (operation, key_or_callback) tuple where operation is one of
+              "count", "sum", "avg", "min" or "max".
+
+    Returns:
+        A dictionary from group key to a dictionary of aggregated values.
+        avg, min and max are None for groups without values.
+
+    Raises:
+        ValueError: If the key or an aggregation spec is invalid.
+        TypeError: If a sum or avg value is not numeric.
+    """
+    if key is not None and not isinstance(key, str) and not callable(key):
+        raise ValueError("Key must be a string, callable, or None")
+
+    aggs = aggs or {}
+    specs = _compile_aggregations(aggs)
+    get_key = resolve_key(key)
+    states: dict[Any, list[Any]] = {}
+
+    for item in items:
+        group_key = get_key(item)
+        try:
+            state = states.get(group_key)
+        except TypeError:
+            group_key = _hashable_group_key(group_key)
+            state = states.get(group_key)
+        if state is None:
+            state = states[group_key] = _initial_state(specs)
+
+        for i, (op, get_value, error) in enumerate(specs):
+            if op == "count":
+                state[i] += 1
+                continue
+
+            value = get_value(item)
+            if op == "min":
+                current = state[i]
+                if current is _NO_VALUE or value < current:
+                    state[i] = value
+            elif op == "max":
+                current = state[i]
+                if current is _NO_VALUE or value > current:
+                    state[i] = value
+            else:
+                if not isinstance(value, int | float):
+                    raise TypeError(f"{error}, got {type(value).__name__}")
+                if op == "sum":
+                    state[i] += value
+                else:
+                    accumulator = state[i]
+                    accumulator[0] += value
+                    accumulator[1] += 1
+
+    names = list(aggs)
+    return {
+        group_key: _finalize(state, names, specs) for group_key, state in states.items()
+    }
+
+
+def _single_group(item: Any) -> None:
+    return None
+
+
+def aggregate_group(items: Iterable[Any], aggs: dict[str, Any]) -> dict[str, Any]:
+    """
+    Aggregate all items as a single group.
+
+    Args:
+        items: Any iterable, consumed once.
+        aggs: Aggregation specs, as in aggregate_items().
+
+    Returns:
+        A dictionary of aggregated values. For no items, counts and sums are 0
+        and avg, min and max are None.
+    """
+    results = aggregate_items(items, _single_group, aggs)
+    if results:
+        return results[None]
+    specs = _compile_aggregations(aggs)
+    return _finalize(_initial_state(specs), list(aggs), specs)
+
+
+def group_items[T](
+    items: Iterable[T], key: str | Callable[[T], Any] | None = None
+) -> dict[Any, list[T]]:
+    """
+    Group any iterable into plain lists in a single streaming pass.
+
+    The key is resolved once before the loop, and items are appended to raw
+    lists, so callers can wrap the groups without copying them.
+
+    Args:
+        items: Any iterable, including generators. It is consumed once.
+        key: A key/attribute name (dot notation supported), a callable, or None
+             to group by the item itself. Unhashable list, dict and set keys are
+             converted to their string representation.
+
+    Returns:
+        A dictionary from group key to the list of items in that group, in
+        order of first appearance.
+
+    Raises:
+        ValueError: If key is not a string, callable or None.
+    """
+    if key is not None and not isinstance(key, str) and not callable(key):
+        raise ValueError("Key must be a string, callable, or None")
+
+    get_key = resolve_key(key)
+    groups: dict[Any, list[T]] = {}
+
+    for item in items:
+        group_key = get_key(item)
+        try:
+            bucket = groups.get(group_key)
+        except TypeError:
+            group_key = _hashable_group_key(group_key)
+            bucket = groups.get(group_key)
+
+        if bucket is None:
+            groups[group_key] = [item]
+        else:
+            bucket.append(item)
+
+    return groups
+
+
 class GroupingMixin[T]:
     """Mixin providing grouping methods."""
 
+    __slots__ = ()
+
     def group_by(
-        self, key: str | Callable[[T], Any] | None = None
-    ) -> dict[Any, "Collection[T]"]:
+        self, key: str | Callable[[T], Any] | None = None, as_map: bool = False
+    ) -> "dict[Any, Collection[T]] | CollectionMap[T]":
         """
         Group the collection's items by a given key or callback function.
 
         Args:
-            key: Either a string representing an attribute/key to group by,
-                 or a callable that takes an item and returns the grouping key.
+            key: Either a string representing an attribute/key to group by
+                 (dot notation is supported for nested values), or a callable
+                 that takes an item and returns the grouping key.
                  If None, groups by the item itself.
+            as_map: If True, return a CollectionMap instead of a plain dictionary.
 
         Returns:
-            A dictionary where keys are the grouping values and values are Collection
-            instances containing the grouped items.
+            A dictionary (or CollectionMap) where keys are the grouping values and
+            values are Collection instances containing the grouped items.
 
         Examples:
             # Group by attribute
@@ -36,40 +264,66 @@ class GroupingMixin[T]:
 
             # Group by item itself
             numbers.group_by()  # Groups identical numbers together
+
+            # Get a CollectionMap directly
+            users.group_by('department', as_map=True).group_sizes()
         """
         from ..collection import Collection
 
         if not self._items:
-            return {}
-
-        grouped = {}
-
-        for item in self._items:
-            if key is None:
-                # Group by the item itself
-                group_key = item
-            elif isinstance(key, str):
-                # Group by attribute/key (for dictionaries or objects)
-                if isinstance(item, dict):
-                    group_key = item.get(key)
-                else:
-                    group_key = getattr(item, key, None)
-            elif callable(key):
-                # Group by callback function
-                group_key = key(item)
-            else:
-                raise ValueError("Key must be a string, callable, or None")
+            grouped = {}
+        else:
+            grouped = {
+                group_key: Collection._from_list(bucket)
+                for group_key, bucket in group_items(self._items, key).items()
+            }
 
-            # Convert key to hashable type for dictionary keys
-            if isinstance(group_key, list | dict | set):
-                group_key = str(group_key)
+        if as_map:
+            from ..collection_map import CollectionMap
 
-            if group_key not in grouped:
-                grouped[group_key] = Collection()
+            return CollectionMap._from_dict(grouped)
+        return grouped
+
+    def aggregate_by(
+        self, key: str | Callable[[T], Any] | None = None, **aggs: Any
+    ) -> dict[Any, dict[str, Any]]:
+        """
+        Group the collection's items and aggregate each group in a single pass.
 
-            grouped[group_key].append(item)
+        Unlike group_by() followed by per-group reductions, no group Collections
+        are built: only one set of running accumulators is kept per group, so
+        memory grows with the number of groups rather than the number of items.
 
-        return grouped
+        Args:
+            key: Either a string representing an attribute/key to group by,
+                 a callable returning the grouping key, or None to group by
+                 the item itself.
+            **aggs: Result names mapped to aggregation specs. A spec is either
+                    "count", or an (operation, key_or_callback) tuple where
+                    operation is "count", "sum", "avg", "min" or "max" and
+                    key_or_callback selects the value, as in sum().
+
+        Returns:
+            A dictionary from group key to a dictionary of aggregated values,
+            with groups in order of first appearance.
+
+        Raises:
+            ValueError: If the key or an aggregation spec is invalid.
+            TypeError: If a sum or avg value is not numeric.
+            KeyError: If a value key is missing from a dict item.
+            AttributeError: If a value attribute is missing from an object item.
+
+        Examples:
+            orders.aggregate_by(
+                "customer",
+                orders="count",
+                total=("sum", "amount"),
+                average=("avg", "amount"),
+                largest=("max", "amount"),
+            )
+            # {"alice": {"orders": 2, "total": 30, "average": 15.0, "largest": 20}, ...}
+        """
+        return aggregate_items(self._items, key, aggs)
 
     def chunk(self, size: int) -> list["Collection[T]"]:
         """
@@ -88,15 +342,17 @@ class GroupingMixin[T]:
         """
         from ..collection import Collection
 
-        if not isinstance(size, int) or size <= 0:
-            raise ValueError("Chunk size must be a positive integer")
+        return [Collection._from_list(items) for items in self._chunk_lists(size)]
 
-        if not self._items:
-            return []
+    def _chunk_lists(self, size: int) -> list[list[T]]:
+        """
+        Split the items into plain lists of up to size items each.
 
-        chunks = []
-        for i in range(0, len(self._items), size):
-            chunk_items = self._items[i : i + size]
-            chunks.append(Collection(chunk_items))
+        Raises:
+            ValueError: If size is not a positive integer.
+        """
+        if not isinstance(size, int) or size <= 0:
+            raise ValueError("Chunk size must be a positive integer")
 
-        return chunks
+        items = self._items
+        return [items[i : i + size] for i in range(0, len(items), size)]
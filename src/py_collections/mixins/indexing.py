@@ -0,0 +1,279 @@
+"""Indexing mixin for Collection class."""
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Self, TypeVar
+
+from ..key_access import resolve_key
+from .storage import StorageMixin
+
+if TYPE_CHECKING:
+    from ..collection import Collection
+
+T = TypeVar("T")
+
+# remove_one() leaves the stored positions in place and records the removed
+# ones; they are folded back into the positions once there are more than
+# this many and they make up over 1/_COMPACT_RATIO of the index.
+_COMPACT_MIN = 64
+_COMPACT_RATIO = 8
+
+
+class HashIndex:
+    """
+    Map from index keys to the positions of the items that produce them.
+
+    Removing a single item (remove_one) updates the index in place: its
+    position is dropped from its bucket and added to a sorted list of removed
+    positions, and the stored positions are corrected by a binary search in
+    that list when read. Other operations that shift positions (remove,
+    sorting) mark the index stale, and it is rebuilt the next time it is
+    consulted.
+
+    Only the key given to index_by() is pickled: the compiled accessor is a
+    closure, so it is resolved again on unpickling, and the positions are
+    rebuilt on first use.
+
+    Args:
+        key: The key given to index_by(): None, a key string or a callable.
+    """
+
+    __slots__ = ("identity", "key", "key_fn", "positions", "removed", "stale")
+
+    def __init__(self, key: str | Callable[[Any], Any] | None):
+        self.key = key
+        self.key_fn = resolve_key(key)
+        self.identity = key is None
+        self.positions: dict[Any, list[int]] = {}
+        self.removed: list[int] = []
+        self.stale = True
+
+    def __reduce__(self) -> tuple[type["HashIndex"], tuple[Any]]:
+        return HashIndex, (self.key,)
+
+    def rebuild(self, items: list[Any]) -> None:
+        """
+        Recompute the positions of every item.
+
+        Raises:
+            TypeError: If an item produces an unhashable key.
+        """
+        positions: dict[Any, list[int]] = {}
+        key_fn = self.key_fn
+        for i, item in enumerate(items):
+            key = key_fn(item)
+            bucket = positions.get(key)
+            if bucket is None:
+                positions[key] = [i]
+            else:
+                bucket.append(i)
+        self.positions = positions
+        self.removed = []
+        self.stale = False
+
+    def find(self, key: Any) -> list[int]:
+        """Return the current positions of the items with the given key, in order."""
+        stored = self.positions.get(key, [])
+        removed = self.removed
+        if not removed:
+            return stored
+        return [position - bisect_left(removed, position) for position in stored]
+
+    def add(self, item: Any, position: int) -> None:
+        """
+        Record an item appended at the given position.
+
+        Raises:
+            TypeError: If the item produces an unhashable key.
+        """
+        key = self.key_fn(item)
+        # Every removed position lies before an appended item
+        position += len(self.removed)
+        bucket = self.positions.get(key)
+        if bucket is None:
+            self.positions[key] = [position]
+        else:
+            bucket.append(position)
+
+    def discard(self, item: Any, position: int, size: int) -> None:
+        """
+        Forget an item removed from the given position.
+
+        Args:
+            item: The removed item.
+            position: Its position before removal.
+            size: The number of items left in the collection.
+
+        Raises:
+            TypeError: If the item produces an unhashable key.
+            KeyError: If the item is not in the index under its key.
+        """
+        removed = self.removed
+        # Find the stored position that maps to this one: the smallest stored
+        # position p + k with k removed positions at or below it
+        stored = position
+        while True:
+            shift = bisect_right(removed, stored)
+            if position + shift == stored:
+                break
+            stored = position + shift
+
+        key = self.key_fn(item)
+        bucket = self.positions[key]
+        i = bisect_left(bucket, stored)
+        if i == len(bucket) or bucket[i] != stored:
+            raise KeyError(key)
+        del bucket[i]
+        if not bucket:
+            del self.positions[key]
+        insort(removed, stored)
+        if len(removed) > _COMPACT_MIN and len(removed) * _COMPACT_RATIO > size:
+            self.compact()
+
+    def compact(self) -> None:
+        """Fold the removed positions into the stored ones."""
+        removed = self.removed
+        for bucket in self.positions.values():
+            bucket[:] = [
+                position - bisect_left(removed, position) for position in bucket
+            ]
+        self.removed = []
+
+
+class IndexingMixin[T](StorageMixin[T]):
+    """Mixin providing an opt-in hash index for lookups."""
+
+    __slots__ = ()
+
+    def index_by(self, key: str | Callable[[T], Any] | None = None) -> Self:
+        """
+        Build a hash index so element lookups no longer scan the collection.
+
+        Once built, the index is consulted automatically by element-based
+        after(), before() and remove_one() calls, by the `in` operator, and by
+        lookup(). It is updated incrementally by append() and extend(), and
+        rebuilt on next use after remove() or remove_one(). Predicate-based
+        calls still scan, since a predicate cannot be hashed.
+
+        Args:
+            key: What to index by. None indexes the items themselves, a string
+                 indexes a key/attribute (dot notation supported) and a callable
+                 indexes its result. Items that are equal must produce equal keys.
+
+        Returns:
+            The collection itself, so the call can be chained.
+
+        Raises:
+            TypeError: If an item produces an unhashable key.
+
+        Examples:
+            users = Collection(rows).index_by("id")
+            users.lookup(42)  # Collection of the rows whose id is 42
+        """
+        index = HashIndex(key)
+        try:
+            index.rebuild(self._items)
+        except TypeError as error:
+            raise TypeError(f"index_by requires hashable keys: {error}") from None
+        self._index = index
+        return self
+
+    def drop_index(self) -> None:
+        """Remove the index built by index_by(), if any."""
+        self._index = None
+
+    def has_index(self) -> bool:
+        """
+        Check whether the collection currently has an index.
+
+        Returns:
+            True if index_by() was called and the index has not been dropped.
+        """
+        return self._index is not None
+
+    def lookup(self, value: Any) -> "Collection[T]":
+        """
+        Get all items whose index key equals the given value.
+
+        Args:
+            value: The index key to look up.
+
+        Returns:
+            A new Collection with the matching items, in collection order.
+
+        Raises:
+            ValueError: If the collection has no index.
+        """
+        from ..collection import Collection
+
+        index = self._current_index()
+        if index is None:
+            raise ValueError("Collection has no index; call index_by() first")
+        items = self._items
+        return Collection._from_list([items[i] for i in index.find(value)])
+
+    def __contains__(self, item: Any) -> bool:
+        """Check whether an item is in the collection, using the index if any."""
+        return self._position_of(item) is not None
+
+    def _current_index(self) -> HashIndex | None:
+        """Return the index, rebuilding it first if it is stale."""
+        index = self._index
+        if index is not None and index.stale:
+            try:
+                index.rebuild(self._items)
+            except TypeError:
+                # An unhashable item was added after indexing; fall back to scans
+                self._index = index = None
+        return index
+
+    def _position_of(self, target: Any) -> int | None:
+        """
+        Find the position of the first item equal to target.
+
+        Returns:
+            The index of the first matching item, or None if there is none.
+        """
+        index = self._current_index()
+        if index is not None:
+            try:
+                candidates = index.find(index.key_fn(target))
+            except Exception:
+                # Unhashable or incompatible target: the index cannot answer it
+                pass
+            else:
+                if index.identity:
+                    return candidates[0] if candidates else None
+                items = self._items
+                for i in candidates:
+                    if items[i] == target:
+                        return i
+                return None
+        return super()._position_of(target)
+
+    def _index_appended(self, start: int) -> None:
+        """Record items appended from position start onwards in the index."""
+        index = self._index
+        if index is None or index.stale:
+            return
+        items = self._items
+        try:
+            for position in range(start, len(items)):
+                index.add(items[position], position)
+        except TypeError:
+            index.stale = True
+
+    def _index_removed(self, item: Any, position: int) -> None:
+        """Record that the item at the given position was removed."""
+        index = self._index
+        if index is None or index.stale:
+            return
+        try:
+            index.discard(item, position, len(self._items))
+        except (TypeError, KeyError):
+            index.stale = True
+
+    def _invalidate_index(self) -> None:
+        """Mark the index stale after positions have shifted."""
+        if self._index is not None:
+            self._index.stale = True
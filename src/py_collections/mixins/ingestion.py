@@ -0,0 +1,148 @@
+"""Ingestion mixin for Collection class."""
+
+import csv
+import json
+import mmap as _mmap
+import os
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import IO, Any, Self, TypeVar
+
+T = TypeVar("T")
+
+type Source = str | os.PathLike[str] | IO[str]
+
+
+@contextmanager
+def _open_lines(
+    source: Source, encoding: str, memory_map: bool, newline: str | None = None
+) -> Iterator[Iterable[str]]:
+    """
+    Open a path or file-like object and provide its lines lazily.
+
+    With memory_map=True the file is mapped into memory and read line by line
+    from the mapping, so the operating system pages it in on demand.
+
+    Raises:
+        ValueError: If memory_map is requested for a file-like object.
+    """
+    if not isinstance(source, str | os.PathLike):
+        if memory_map:
+            raise ValueError("memory_map requires a file path")
+        yield source
+        return
+
+    if not memory_map:
+        with open(source, encoding=encoding, newline=newline) as fp:
+            yield fp
+        return
+
+    with open(source, "rb") as fp:
+        if os.fstat(fp.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            yield ()
+            return
+        with _mmap.mmap(fp.fileno(), 0, access=_mmap.ACCESS_READ) as mapped:
+            yield (line.decode(encoding) for line in iter(mapped.readline, b""))
+
+
+class IngestionMixin[T]:
+    """Mixin providing constructors that load items incrementally."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T]) -> Self:
+        """
+        Build a collection by consuming an iterable.
+
+        The items are appended to the collection's own list as they are
+        produced, so a generator is never materialized twice.
+
+        Args:
+            iterable: Any iterable, including generators.
+
+        Returns:
+            A new collection containing the produced items.
+
+        Examples:
+            Collection.from_iterable(row for row in cursor if row["active"])
+        """
+        return cls._from_list(list(iterable))
+
+    @classmethod
+    def from_jsonl(
+        cls,
+        source: Source,
+        encoding: str = "utf-8",
+        memory_map: bool = False,
+    ) -> Self:
+        """
+        Build a collection from a JSON Lines file, one item per line.
+
+        Lines are decoded as they are read; blank lines are skipped.
+
+        Args:
+            source: A file path, or a text file-like object.
+            encoding: Encoding used when source is a path.
+            memory_map: Memory-map the file instead of reading it through a
+                        buffered file object. Requires a path.
+
+        Returns:
+            A new collection containing the decoded documents.
+
+        Raises:
+            ValueError: If a line is not valid JSON, or memory_map is used
+                        with a file-like object.
+
+        Examples:
+            events = Collection.from_jsonl("events.jsonl", memory_map=True)
+        """
+        loads = json.loads
+        items: list[Any] = []
+        append = items.append
+        with _open_lines(source, encoding, memory_map) as lines:
+            for line_number, line in enumerate(lines, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    append(loads(line))
+                except json.JSONDecodeError as error:
+                    raise ValueError(
+                        f"Invalid JSON on line {line_number}: {error}"
+                    ) from None
+        return cls._from_list(items)
+
+    @classmethod
+    def from_csv(
+        cls,
+        source: Source,
+        encoding: str = "utf-8",
+        memory_map: bool = False,
+        **fmtparams: Any,
+    ) -> Self:
+        """
+        Build a collection of dictionaries from a CSV file with a header row.
+
+        Rows are parsed by csv.DictReader as they are read, so values are
+        strings and missing trailing fields are None.
+
+        Args:
+            source: A file path, or a text file-like object (opened with
+                    newline="" as the csv module recommends).
+            encoding: Encoding used when source is a path.
+            memory_map: Memory-map the file instead of reading it through a
+                        buffered file object. Requires a path.
+            **fmtparams: Passed to csv.DictReader (e.g. delimiter, fieldnames).
+
+        Returns:
+            A new collection with one dictionary per row.
+
+        Raises:
+            ValueError: If memory_map is used with a file-like object.
+
+        Examples:
+            users = Collection.from_csv("users.csv", delimiter=";")
+        """
+        with _open_lines(source, encoding, memory_map, newline="") as lines:
+            return cls._from_list(list(csv.DictReader(lines, **fmtparams)))
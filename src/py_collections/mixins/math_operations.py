@@ -1,17 +1,179 @@
 """Math operations mixin for Collection class."""
 
+import math
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Callable, TypeVar, Union
 
+from ..key_access import compile_key
+
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover - numpy is optional
+    _np = None
+
 if TYPE_CHECKING:
     from ..collection import Collection
 
 T = TypeVar("T")
 
+# Exact types that need no per-item isinstance check (bool and other
+# subclasses fall back to the slower, equivalent validation loop).
+_NUMERIC_TYPES = frozenset((int, float))
+
+# Below this size, converting to a NumPy array costs more than it saves in
+# std() (measured crossover: a few hundred floats); ColumnarCollection uses
+# the same threshold for its zero-copy column views. Collection.sum() and
+# average() never convert: the builtin sum() is faster at every size. The
+# "Collection.std (pure Python)" benchmark case shows the difference.
+_VECTORIZE_MIN_SIZE = 1_000
+
+
+def _float_array(values: list[int | float]) -> Any:
+    """
+    Return the values as a NumPy float64 array when vectorizing pays off.
+
+    Only homogeneous float data is vectorized: integers keep their exact
+    pure-Python arithmetic.
+
+    Returns:
+        A NumPy array, or None when NumPy is not installed, the data is small,
+        or the values are not all floats.
+    """
+    if _np is None or len(values) < _VECTORIZE_MIN_SIZE:
+        return None
+    if set(map(type, values)) != {float}:
+        return None
+    return _np.fromiter(values, dtype=_np.float64, count=len(values))
+
+
+def _value_getter(
+    key_or_callback: str | Callable[[Any], int | float], operation: str
+) -> tuple[Callable[[Any], Any], str, str]:
+    """
+    Resolve a key or callback argument into a value getter.
+
+    Args:
+        key_or_callback: A key/attribute name or a callable.
+        operation: Name of the calling operation, used in error messages.
+
+    Returns:
+        The getter, the message for a non-numeric value and the message for an
+        empty result.
+
+    Raises:
+        TypeError: If the argument is not a string or a callable.
+    """
+    if isinstance(key_or_callback, str):
+        return (
+            compile_key(key_or_callback, strict=True),
+            f"Value for key '{key_or_callback}' must be numeric",
+            f"No values found for key to {operation}",
+        )
+    if callable(key_or_callback):
+        return (
+            key_or_callback,
+            "Callback must return a numeric value",
+            f"No results found from callback to {operation}",
+        )
+    raise TypeError("Argument must be None, a string key, or a callable")
+
+
+def numeric_total(
+    items: Iterable[Any],
+    key_or_callback: str | Callable[[Any], int | float] | None,
+    operation: str,
+    allow_empty: bool = True,
+) -> tuple[int | float, int]:
+    """
+    Sum the numeric values of items read one at a time, and count them.
+
+    Values are resolved, validated and summed as they are read, so items
+    from a generator are never held in memory together. Arguments, skipping
+    and errors are the same as for Collection.sum(), and the total is
+    computed by the builtin sum(), so it matches Collection.sum() exactly.
+
+    Args:
+        items: The items to read.
+        key_or_callback: None, a key/attribute name or a callable.
+        operation: Name of the calling operation, used in error messages.
+        allow_empty: Whether an empty result is allowed for key and callback
+                     arguments. Without arguments, empty is always an error.
+
+    Returns:
+        The sum and the number of values.
+
+    Raises:
+        ValueError: If no values are found and empty results are not allowed.
+        TypeError: If a value is not numeric, or the argument is invalid.
+    """
+    if key_or_callback is None:
+        values = iter(items)
+        error = None
+        empty_error = f"No numeric values found in collection to {operation}"
+    else:
+        get_value, error, empty_error = _value_getter(key_or_callback, operation)
+        values = map(get_value, items)
+
+    count = 0
+
+    def validated() -> Iterator[int | float]:
+        nonlocal count
+        for value in values:
+            if type(value) not in _NUMERIC_TYPES and not isinstance(value, int | float):
+                # Without a key, non-numeric items are skipped
+                if error is None:
+                    continue
+                raise TypeError(f"{error}, got {type(value).__name__}")
+            count += 1
+            yield value
+
+    total = sum(validated())
+    if not count and (error is None or not allow_empty):
+        raise ValueError(empty_error)
+    return total, count
+
+
+@dataclass(frozen=True, slots=True)
+class Stats:
+    """
+    Summary statistics computed by Collection.stats().
+
+    Attributes:
+        count: Number of values.
+        sum: Sum of the values.
+        mean: Arithmetic mean of the values.
+        min: Smallest value.
+        max: Largest value.
+        variance: Population variance of the values.
+    """
+
+    count: int
+    sum: int | float
+    mean: float
+    min: int | float
+    max: int | float
+    variance: float
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation of the values."""
+        return math.sqrt(self.variance)
+
+    @property
+    def sample_variance(self) -> float:
+        """Sample variance of the values (0.0 when there is a single value)."""
+        if self.count < 2:
+            return 0.0
+        return self.variance * self.count / (self.count - 1)
+
 
 class MathOperationsMixin[T]:
     """Mixin providing mathematical operations for collections."""
 
-    def sum(  # noqa: PLR0912
+    __slots__ = ()
+
+    def sum(
         self, key_or_callback: str | Callable[[T], int | float] | None = None
     ) -> int | float:
         """
@@ -43,56 +205,12 @@ class MathOperationsMixin[T]:
             >>> items.sum(lambda x: x["price"] * 1.1)  # With 10% tax
             66.0
         """
-        if key_or_callback is None:
-            # Sum all numeric values in the collection
-            numeric_items = [
-                item for item in self._items if isinstance(item, int | float)
-            ]
-            if not numeric_items:
-                raise ValueError("No numeric values found in collection to sum")
-            return sum(numeric_items)
-
-        elif isinstance(key_or_callback, str):
-            # Sum the values of a specific key/attribute from each item
-            total = 0
-            for item in self._items:
-                if isinstance(item, dict):
-                    if key_or_callback not in item:
-                        raise KeyError(
-                            f"Key '{key_or_callback}' not found in item: {item}"
-                        )
-                    value = item[key_or_callback]
-                elif hasattr(item, key_or_callback):
-                    value = getattr(item, key_or_callback)
-                else:
-                    raise AttributeError(
-                        f"Item {item} has no attribute '{key_or_callback}'"
-                    )
-
-                if not isinstance(value, int | float):
-                    raise TypeError(
-                        f"Value for key '{key_or_callback}' must be numeric, got {type(value).__name__}"
-                    )
-
-                total += value
-            return total
-
-        elif callable(key_or_callback):
-            # Sum the results returned by the callback for each item
-            total = 0
-            for item in self._items:
-                result = key_or_callback(item)
-                if not isinstance(result, int | float):
-                    raise TypeError(
-                        f"Callback must return a numeric value, got {type(result).__name__}"
-                    )
-                total += result
-            return total
-
-        else:
-            raise TypeError("Argument must be None, a string key, or a callable")
+        values = self._numeric_values(key_or_callback, "sum")
+        if not values:
+            return 0
+        return sum(values)
 
-    def average( # noqa: PLR0912
+    def average(
         self, key_or_callback: str | Callable[[T], int | float] | None = None
     ) -> float:
         """
@@ -124,50 +242,212 @@ class MathOperationsMixin[T]:
             >>> items.average(lambda x: x["price"] * 1.1)  # With 10% tax
             22.0
         """
+        values = self._numeric_values(key_or_callback, "average", allow_empty=False)
+        return sum(values) / len(values)
+
+    def min(
+        self, key_or_callback: str | Callable[[T], int | float] | None = None
+    ) -> int | float:
+        """
+        Find the smallest numeric value in the collection.
+
+        Args:
+            key_or_callback: Optional key or callback function, with the same
+                meaning as in sum().
+
+        Returns:
+            The smallest value.
+
+        Raises:
+            ValueError: If there are no values to compare.
+            AttributeError: If the specified key doesn't exist on items.
+            TypeError: If a value is not numeric.
+
+        Examples:
+            >>> Collection([3, 1, 2]).min()
+            1
+        """
+        values = self._numeric_values(key_or_callback, "min", allow_empty=False)
+        return min(values)
+
+    def max(
+        self, key_or_callback: str | Callable[[T], int | float] | None = None
+    ) -> int | float:
+        """
+        Find the largest numeric value in the collection.
+
+        Args:
+            key_or_callback: Optional key or callback function, with the same
+                meaning as in sum().
+
+        Returns:
+            The largest value.
+
+        Raises:
+            ValueError: If there are no values to compare.
+            AttributeError: If the specified key doesn't exist on items.
+            TypeError: If a value is not numeric.
+
+        Examples:
+            >>> Collection([{"price": 10}, {"price": 30}]).max("price")
+            30
+        """
+        values = self._numeric_values(key_or_callback, "max", allow_empty=False)
+        return max(values)
+
+    def std(
+        self,
+        key_or_callback: str | Callable[[T], int | float] | None = None,
+        ddof: int = 0,
+    ) -> float:
+        """
+        Calculate the standard deviation of items in the collection.
+
+        Args:
+            key_or_callback: Optional key or callback function, with the same
+                meaning as in sum().
+            ddof: Delta degrees of freedom. The default of 0 gives the population
+                  standard deviation; pass 1 for the sample standard deviation.
+
+        Returns:
+            The standard deviation of the values.
+
+        Raises:
+            ValueError: If there are no values, or not more values than ddof.
+            AttributeError: If the specified key doesn't exist on items.
+            TypeError: If a value is not numeric.
+
+        Examples:
+            >>> Collection([2, 4, 4, 4, 5, 5, 7, 9]).std()
+            2.0
+        """
+        values = self._numeric_values(key_or_callback, "std", allow_empty=False)
+        count = len(values)
+        if count <= ddof:
+            raise ValueError(f"Need more than {ddof} values to compute std")
+
+        array = _float_array(values)
+        if array is not None:
+            return float(array.std(ddof=ddof))
+
+        mean = math.fsum(values) / count
+        return math.sqrt(math.fsum((v - mean) ** 2 for v in values) / (count - ddof))
+
+    def stats(
+        self, key_or_callback: str | Callable[[T], int | float] | None = None
+    ) -> Stats:
+        """
+        Calculate count, sum, mean, min, max and variance in a single pass.
+
+        The key or callback is resolved once, and each value is validated and
+        folded into the running mean and variance (Welford's algorithm) as the
+        items are walked, without building a list of values. This replaces
+        separate sum(), average(), min() and max() calls.
+
+        Args:
+            key_or_callback: Optional key or callback function, with the same
+                meaning as in sum().
+
+        Returns:
+            A Stats object with the computed values.
+
+        Raises:
+            ValueError: If there are no values.
+            AttributeError: If the specified key doesn't exist on items.
+            TypeError: If a value is not numeric.
+
+        Examples:
+            >>> stats = Collection([{"ms": 10}, {"ms": 30}]).stats("ms")
+            >>> stats.count, stats.mean, stats.max
+            (2, 20.0, 30)
+        """
         if key_or_callback is None:
-            numeric_items = [
-                item for item in self._items if isinstance(item, int | float)
-            ]
-            if not numeric_items:
-                raise ValueError("No numeric values found in collection to average")
-            return sum(numeric_items) / len(numeric_items)
-
-        elif isinstance(key_or_callback, str):
-            values = []
-            for item in self._items:
-                if isinstance(item, dict):
-                    if key_or_callback not in item:
-                        raise KeyError(
-                            f"Key '{key_or_callback}' not found in item: {item}"
-                        )
-                    value = item[key_or_callback]
-                elif hasattr(item, key_or_callback):
-                    value = getattr(item, key_or_callback)
-                else:
-                    raise AttributeError(
-                        f"Item {item} has no attribute '{key_or_callback}'"
-                    )
-                if not isinstance(value, int | float):
-                    raise TypeError(
-                        f"Value for key '{key_or_callback}' must be numeric, got {type(value).__name__}"
-                    )
-                values.append(value)
+            values = self._items
+            error = None
+            empty_error = "No numeric values found in collection to compute stats"
+        else:
+            get_value, error, empty_error = _value_getter(
+                key_or_callback, "compute stats"
+            )
+            values = map(get_value, self._items)
+
+        count = 0
+        total = 0
+        mean = 0.0
+        m2 = 0.0
+        low = high = None
+        for value in values:
+            if type(value) not in _NUMERIC_TYPES and not isinstance(value, int | float):
+                # Without a key, non-numeric items are skipped as in sum()
+                if error is None:
+                    continue
+                raise TypeError(f"{error}, got {type(value).__name__}")
+            count += 1
+            total += value
+            delta = value - mean
+            mean += delta / count
+            m2 += delta * (value - mean)
+            if count == 1:
+                low = high = value
+            elif value < low:
+                low = value
+            elif value > high:
+                high = value
+
+        if not count:
+            raise ValueError(empty_error)
+        return Stats(
+            count=count,
+            sum=total,
+            mean=mean,
+            min=low,
+            max=high,
+            variance=m2 / count,
+        )
+
+    def _numeric_values(
+        self,
+        key_or_callback: str | Callable[[T], int | float] | None,
+        operation: str,
+        allow_empty: bool = True,
+    ) -> list[int | float]:
+        """
+        Resolve and validate the numeric values an operation works on.
+
+        Collections made only of ints and floats are validated with a single
+        C-level pass over the value types; the per-item isinstance loop only
+        runs when that fast check fails.
+
+        Args:
+            key_or_callback: None, a key/attribute name or a callable.
+            operation: Name of the calling operation, used in error messages.
+            allow_empty: Whether an empty result is allowed for key and callback
+                         arguments. Without arguments, empty is always an error.
+
+        Returns:
+            The numeric values. Without arguments this may be the collection's
+            own list, so callers must not modify it.
+
+        Raises:
+            ValueError: If no values are found and empty results are not allowed.
+            TypeError: If a value is not numeric, or the argument is invalid.
+        """
+        if key_or_callback is None:
+            values = self._items
+            if not _NUMERIC_TYPES.issuperset(map(type, values)):
+                values = [item for item in values if isinstance(item, int | float)]
             if not values:
-                raise ValueError("No values found for key to average")
-            return sum(values) / len(values)
-
-        elif callable(key_or_callback):
-            results = []
-            for item in self._items:
-                result = key_or_callback(item)
-                if not isinstance(result, int | float):
-                    raise TypeError(
-                        f"Callback must return a numeric value, got {type(result).__name__}"
-                    )
-                results.append(result)
-            if not results:
-                raise ValueError("No results found from callback to average")
-            return sum(results) / len(results)
+                raise ValueError(
+                    f"No numeric values found in collection to {operation}"
+                )
+            return values
 
-        else:
-            raise TypeError("Argument must be None, a string key, or a callable")
+        get_value, error, empty_error = _value_getter(key_or_callback, operation)
+        values = list(map(get_value, self._items))
+        if not _NUMERIC_TYPES.issuperset(map(type, values)):
+            for value in values:
+                if not isinstance(value, int | float):
+                    raise TypeError(f"{error}, got {type(value).__name__}")
+        if not values and not allow_empty:
+            raise ValueError(empty_error)
+        return values
@@ -3,12 +3,16 @@
 from collections.abc import Callable
 from typing import TypeVar
 
+from .storage import StorageMixin
+
 T = TypeVar("T")
 
 
-class NavigationMixin[T]:
+class NavigationMixin[T](StorageMixin[T]):
     """Mixin providing navigation methods."""
 
+    __slots__ = ()
+
     def after(self, target: T | Callable[[T], bool]) -> T | None:
         """
         Get the element that comes after the first occurrence of the target element or predicate match.
@@ -36,16 +40,12 @@ class NavigationMixin[T]:
                     return None
             return None
 
-        # Handle case where target is an element
-        try:
-            index = self._items.index(target)
-            # Check if there's a next element
-            if index + 1 < len(self._items):
-                return self._items[index + 1]
-            return None
-        except ValueError:
-            # Element not found
-            return None
+        # Handle case where target is an element (uses the index if one was built)
+        index = self._position_of(target)
+        # Check if there's a next element
+        if index is not None and index + 1 < len(self._items):
+            return self._items[index + 1]
+        return None
 
     def before(self, target: T | Callable[[T], bool]) -> T | None:
         """
@@ -74,13 +74,9 @@ class NavigationMixin[T]:
                     return None
             return None
 
-        # Handle case where target is an element
-        try:
-            index = self._items.index(target)
-            # Check if there's a previous element
-            if index > 0:
-                return self._items[index - 1]
-            return None
-        except ValueError:
-            # Element not found
-            return None
+        # Handle case where target is an element (uses the index if one was built)
+        index = self._position_of(target)
+        # Check if there's a previous element
+        if index is not None and index > 0:
+            return self._items[index - 1]
+        return None
@@ -3,12 +3,16 @@
 from collections.abc import Callable
 from typing import TypeVar
 
+from .storage import StorageMixin
+
 T = TypeVar("T")
 
 
-class RemovalMixin[T]:
+class RemovalMixin[T](StorageMixin[T]):
     """Mixin providing removal methods."""
 
+    __slots__ = ()
+
     def remove(self, target: T | Callable[[T], bool]) -> None:
         """
         Remove all items that match the target element or predicate.
@@ -20,9 +24,11 @@ class RemovalMixin[T]:
         """
         if callable(target):
             predicate = target
-            self._items[:] = [item for item in self._items if not predicate(item)]
+            kept = [item for item in self._items if not predicate(item)]
         else:
-            self._items[:] = [item for item in self._items if item != target]
+            kept = [item for item in self._items if item != target]
+        self._own_items()[:] = kept
+        self._invalidate_index()
 
     def remove_one(self, target: T | Callable[[T], bool]) -> None:
         """
@@ -40,11 +46,12 @@ class RemovalMixin[T]:
             predicate = target
             for i, item in enumerate(self._items):
                 if predicate(item):
-                    del self._items[i]
+                    del self._own_items()[i]
+                    self._index_removed(item, i)
                     return
         else:
-            try:
-                self._items.remove(target)
-            except ValueError:
-                # Element not found, do nothing
-                pass
+            index = self._position_of(target)
+            if index is not None:
+                items = self._own_items()
+                item = items.pop(index)
+                self._index_removed(item, index)
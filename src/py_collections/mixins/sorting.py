@@ -0,0 +1,221 @@
+"""Sorting mixin for Collection class."""
+
+import heapq
+from collections.abc import Callable, Iterable, Sequence
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from ..key_access import resolve_key
+from .storage import StorageMixin
+
+if TYPE_CHECKING:
+    from ..collection import Collection
+
+T = TypeVar("T")
+
+type SortKey = str | Callable[[Any], Any]
+
+
+def _directions(descending: bool | Sequence[bool], count: int) -> list[bool]:
+    """
+    Expand the descending argument to one direction per key.
+
+    Raises:
+        ValueError: If a sequence is given whose length differs from the keys.
+    """
+    if isinstance(descending, bool):
+        return [descending] * count
+    directions = [bool(direction) for direction in descending]
+    if len(directions) != count:
+        raise ValueError(
+            f"descending has {len(directions)} values for {count} sort keys"
+        )
+    return directions
+
+
+def _none_last(get: Callable[[Any], Any], descending: bool) -> Callable[[Any], Any]:
+    """Wrap a key so None values sort after every other value in either direction."""
+    if descending:
+        return lambda item: ((value := get(item)) is not None, value)
+    return lambda item: ((value := get(item)) is None, value)
+
+
+def sorted_items(
+    items: list[Any], keys: Sequence[SortKey], descending: bool | Sequence[bool]
+) -> list[Any]:
+    """
+    Return a sorted copy of the items.
+
+    The copy is sorted once per key, least significant key first; because each
+    sort is stable, the result is ordered by all keys, and every key can have
+    its own direction. list.sort computes each key once per item and compares
+    the cached values (decorate-sort-undecorate). Keys are first used as they
+    are; only when a comparison fails (typically because of None values) is
+    the pass redone with None placed last.
+
+    Args:
+        items: The items to sort.
+        keys: Key strings (dot notation supported) or callables; none means the
+              items themselves.
+        descending: One direction for all keys, or one per key.
+
+    Raises:
+        ValueError: If descending does not match the number of keys.
+        TypeError: If a key is neither a string nor a callable, or values of
+                   incomparable types are compared.
+    """
+    getters = [resolve_key(key) for key in keys] or [resolve_key(None)]
+    directions = _directions(descending, len(getters))
+
+    result = items
+    for get, reverse in zip(reversed(getters), reversed(directions), strict=True):
+        # A failed sort leaves its list partly reordered, so each pass sorts a
+        # copy of the previous pass's result
+        attempt = result.copy()
+        try:
+            attempt.sort(key=get, reverse=reverse)
+        except TypeError:
+            attempt = result.copy()
+            attempt.sort(key=_none_last(get, reverse), reverse=reverse)
+        result = attempt
+    return result
+
+
+def select_k(
+    items: Iterable[Any],
+    k: int,
+    key_or_callback: str | Callable[[Any], Any] | None,
+    largest: bool,
+) -> list[Any]:
+    """
+    Return the k largest or smallest items, best first.
+
+    A bounded heap of k items is kept while the items are consumed, so this
+    takes O(n log k) time and O(k) memory, and works on one-shot iterables.
+    Items with equal keys keep their original order, as with a stable sort.
+
+    Args:
+        items: Any iterable, including generators.
+        k: The number of items to keep.
+        key_or_callback: None to compare the items themselves, a key or
+                         attribute name (dot notation supported), or a callable.
+        largest: True for the largest items, False for the smallest.
+
+    Raises:
+        ValueError: If k is negative or not an integer.
+        KeyError: If a dict item is missing the key.
+        AttributeError: If an object item is missing the attribute.
+        TypeError: If values of incomparable types are compared.
+    """
+    if not isinstance(k, int) or isinstance(k, bool) or k < 0:
+        raise ValueError("k must be a non-negative integer")
+    key = None if key_or_callback is None else resolve_key(key_or_callback, True)
+    select = heapq.nlargest if largest else heapq.nsmallest
+    return select(k, items, key=key)
+
+
+class SortingMixin[T](StorageMixin[T]):
+    """Mixin providing sorting methods."""
+
+    __slots__ = ()
+
+    def sort_by(
+        self, *keys: SortKey, descending: bool | Sequence[bool] = False
+    ) -> "Collection[T]":
+        """
+        Return a new collection sorted by one or more keys.
+
+        Keys accept the same forms as pluck(): a key or attribute name, with dots
+        for nested access, or a callable. Each key is computed once per item
+        (twice for a key whose values include None).
+        The sort is stable, and None values (including missing keys) are placed
+        last whatever the direction.
+
+        Args:
+            *keys: The keys to sort by, most significant first. With no keys,
+                   the items themselves are compared.
+            descending: True to sort every key in descending order, or one
+                        boolean per key for mixed directions.
+
+        Returns:
+            A new Collection with the items in sorted order.
+
+        Raises:
+            ValueError: If descending does not have one value per key.
+            TypeError: If values of incomparable types are compared.
+
+        Examples:
+            rows.sort_by("country", "age", descending=[False, True])
+            users.sort_by("address.city", lambda u: u["name"].lower())
+        """
+        from ..collection import Collection
+
+        return Collection._from_list(sorted_items(self._items, keys, descending))
+
+    def sort_inplace(
+        self, *keys: SortKey, descending: bool | Sequence[bool] = False
+    ) -> None:
+        """
+        Sort the collection in place, with the same arguments as sort_by().
+
+        Raises:
+            ValueError: If descending does not have one value per key.
+            TypeError: If values of incomparable types are compared.
+        """
+        self._own_items()[:] = sorted_items(self._items, keys, descending)
+        self._invalidate_index()
+
+    def top_k(
+        self, k: int, key_or_callback: str | Callable[[T], Any] | None = None
+    ) -> "Collection[T]":
+        """
+        Return the k items with the largest values, largest first.
+
+        Uses a bounded heap instead of a full sort: O(n log k) rather than
+        O(n log n), which matters when k is small and the collection is large.
+        The result equals sort_by(key, descending=True).take(k) for values
+        without None.
+
+        Args:
+            k: The number of items to return. Fewer are returned if the
+               collection is smaller.
+            key_or_callback: Optional key or callback function, as for sum().
+                - If None: compares the items themselves
+                - If str: compares the values of the specified key/attribute
+                - If callable: compares the results of the callback
+
+        Returns:
+            A new Collection with at most k items.
+
+        Raises:
+            ValueError: If k is negative or not an integer.
+            KeyError: If a dict item is missing the key.
+            AttributeError: If an object item is missing the attribute.
+            TypeError: If values of incomparable types are compared.
+
+        Examples:
+            >>> scores = Collection([{"score": 3}, {"score": 9}, {"score": 5}])
+            >>> scores.top_k(2, "score")
+            Collection([{'score': 9}, {'score': 5}])
+        """
+        from ..collection import Collection
+
+        return Collection._from_list(select_k(self._items, k, key_or_callback, True))
+
+    def bottom_k(
+        self, k: int, key_or_callback: str | Callable[[T], Any] | None = None
+    ) -> "Collection[T]":
+        """
+        Return the k items with the smallest values, smallest first.
+
+        The counterpart of top_k(), with the same arguments and errors.
+
+        Returns:
+            A new Collection with at most k items.
+
+        Examples:
+            >>> Collection([4, 1, 3, 2]).bottom_k(2)
+            Collection([1, 2])
+        """
+        from ..collection import Collection
+
+        return Collection._from_list(select_k(self._items, k, key_or_callback, False))
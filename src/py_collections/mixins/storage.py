@@ -0,0 +1,64 @@
+"""Storage mixin shared by the mixins that modify or search _items."""
+
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class StorageMixin[T]:
+    """
+    Mixin providing the bookkeeping state around _items.
+
+    Mixins that modify or search _items inherit this, so a class composed
+    from mixins only needs to set _items. The class attributes below are the
+    defaults for such classes; Collection stores the same names in slots,
+    which Collection.__new__ initializes. The index hooks do nothing here and
+    are overridden by IndexingMixin.
+    """
+
+    __slots__ = ()
+
+    # The HashIndex built by IndexingMixin.index_by(), if any
+    _index = None
+    # Whether _items is still shared with a copy-on-write clone
+    _shared = False
+    # Number of in-place changes, checked by views of the collection
+    _version = 0
+
+    def _own_items(self) -> list[T]:
+        """
+        Prepare _items for an in-place change and return it.
+
+        Every method that modifies _items in place calls this first. It counts
+        the change in _version, which invalidates views, and gives the
+        collection its own copy of a list it still shares with a clone.
+
+        Returns:
+            The list to modify.
+        """
+        self._version += 1
+        if self._shared:
+            self._items = self._items.copy()
+            self._shared = False
+        return self._items
+
+    def _position_of(self, target: Any) -> int | None:
+        """
+        Find the position of the first item equal to target.
+
+        Returns:
+            The index of the first matching item, or None if there is none.
+        """
+        try:
+            return self._items.index(target)
+        except ValueError:
+            return None
+
+    def _index_appended(self, start: int) -> None:
+        """Record items appended from position start onwards in the index."""
+
+    def _index_removed(self, item: Any, position: int) -> None:
+        """Record that the item at the given position was removed."""
+
+    def _invalidate_index(self) -> None:
+        """Mark the index stale after positions have shifted."""
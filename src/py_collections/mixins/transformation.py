@@ -1,17 +1,117 @@
 """Transformation mixin for Collection class."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from typing import TYPE_CHECKING, Any, TypeVar
 
+from ..hashing import BloomFilter, canonical_key, check_bloom_parameters
+from ..key_access import compile_key, resolve_key
+
 if TYPE_CHECKING:
     from ..collection import Collection
+    from ..collection_view import CollectionView
+    from ..columnar import ColumnarCollection
+    from ..lazy_collection import LazyCollection
 
 T = TypeVar("T")
 
 
+def make_plucker(key: str, value_key: str | None = None) -> Callable[[Any], Any]:
+    """
+    Build the per-item extraction function used by pluck().
+
+    Args:
+        key: The key or attribute to extract. Supports dot notation.
+        value_key: Optional key to use as the value of a single-entry dictionary.
+
+    Returns:
+        A callable returning the key's value, or {key_value: value_value} when
+        value_key is given.
+    """
+    get_key = compile_key(key)
+    if value_key is None:
+        return get_key
+
+    get_value = compile_key(value_key)
+    return lambda item: {get_key(item): get_value(item)}
+
+
+def check_distinct_parameters(
+    approximate: bool, capacity: int | None, error_rate: float
+) -> None:
+    """
+    Validate the approximate mode arguments of distinct().
+
+    Raises:
+        ValueError: If approximate is set without a capacity, or with a
+                    capacity or error rate out of range.
+    """
+    if not approximate:
+        return
+    if capacity is None:
+        raise ValueError("Approximate distinct requires a capacity")
+    check_bloom_parameters(capacity, error_rate)
+
+
+def iter_distinct(
+    items: Iterable[Any],
+    key_or_callback: str | Callable[[Any], Any] | None = None,
+    approximate: bool = False,
+    capacity: int | None = None,
+    error_rate: float = 0.01,
+) -> Iterator[Any]:
+    """
+    Yield the first item for each distinct value, as the items are read.
+
+    Values are compared like in find_duplicates(): hashable values by
+    equality, unhashable ones by their canonical structural key.
+
+    Args:
+        items: The items to deduplicate.
+        key_or_callback: None to compare the items themselves, a key/attribute
+                         name (dot notation supported), or a callable.
+        approximate: Remember the values seen in a BloomFilter of fixed size
+                     instead of a set.
+        capacity: Expected number of distinct values; required when approximate.
+        error_rate: False positive rate of the BloomFilter.
+
+    Raises:
+        ValueError: If approximate is set without a valid capacity and error rate.
+        KeyError: If a dict item is missing the key.
+        AttributeError: If an object item is missing the attribute.
+    """
+    if approximate:
+        check_distinct_parameters(approximate, capacity, error_rate)
+        # Built before the first item is requested, like the checks above
+        seen_filter = BloomFilter(capacity, error_rate)
+    get_value = (
+        None if key_or_callback is None else resolve_key(key_or_callback, strict=True)
+    )
+
+    def generate() -> Iterator[Any]:
+        if approximate:
+            add = seen_filter.add
+            for item in items:
+                value = item if get_value is None else get_value(item)
+                if not add(canonical_key(value)):
+                    yield item
+            return
+
+        seen: set[Any] = set()
+        remember = seen.add
+        for item in items:
+            key = canonical_key(item if get_value is None else get_value(item))
+            if key not in seen:
+                remember(key)
+                yield item
+
+    return generate()
+
+
 class TransformationMixin[T]:
     """Mixin providing transformation methods."""
 
+    __slots__ = ()
+
     def map(self, func: Callable[[T], Any]) -> "Collection[Any]":
         """
         Apply a function to every item in the collection and return a new collection with the results.
@@ -30,8 +130,7 @@ class TransformationMixin[T]:
         """
         from ..collection import Collection
 
-        mapped_items = [func(item) for item in self._items]
-        return Collection(mapped_items)
+        return Collection._from_list([func(item) for item in self._items])
 
     def pluck(self, key: str, value_key: str | None = None) -> "Collection[Any]":
         """
@@ -70,39 +169,54 @@ class TransformationMixin[T]:
         if not self._items:
             return Collection()
 
-        def get_nested_value(obj, key_path: str):
-            """Get nested value using dot notation."""
-            keys = key_path.split(".")
-            current = obj
+        return Collection._from_list(
+            list(map(make_plucker(key, value_key), self._items))
+        )
+
+    def lazy(self) -> "LazyCollection[T]":
+        """
+        Return a lazy pipeline over the collection's items.
+
+        Chained map, filter, pluck and take calls are recorded instead of being
+        executed, and the whole chain runs as a single pass only when a terminal
+        operation (all, first, sum, iteration, to_json, ...) is reached. No
+        intermediate lists are built, and take() stops pulling items as soon as
+        enough results have been produced.
+
+        Returns:
+            A LazyCollection reading from this collection's items.
+
+        Examples:
+            collection = Collection(list(range(1_000_000)))
+            collection.lazy().filter(lambda x: x % 2).map(str).take(3).all()
+            # ['1', '3', '5'] - only the first six items are ever visited
+        """
+        from ..lazy_collection import LazyCollection
 
-            for k in keys:
-                if isinstance(current, dict):
-                    if k in current:
-                        current = current[k]
-                    else:
-                        return None
-                elif hasattr(current, k):
-                    current = getattr(current, k)
-                else:
-                    return None
+        return LazyCollection(self._items)
 
-                if current is None:
-                    return None
+    def to_columnar(self) -> "ColumnarCollection":
+        """
+        Return the items stored column by column.
 
-            return current
+        The items must be dictionaries that all have the same keys. Fields are
+        stored as one list (or typed array for int and float fields) each, which
+        takes far less memory than one dictionary per row and lets per-field
+        operations such as sum("price") read a single column.
 
-        plucked_items = []
+        Returns:
+            A ColumnarCollection holding the same records.
 
-        for item in self._items:
-            key_value = get_nested_value(item, key)
+        Raises:
+            ValueError: If the items do not all have the same keys.
 
-            if value_key is None:
-                plucked_items.append(key_value)
-            else:
-                value_value = get_nested_value(item, value_key)
-                plucked_items.append({key_value: value_value})
+        Examples:
+            orders = Collection(rows).to_columnar()
+            orders.sum("price")
+        """
+        from ..columnar import ColumnarCollection
 
-        return Collection(plucked_items)
+        return ColumnarCollection(self._items)
 
     def filter(self, predicate: Callable[[T], bool]) -> "Collection[T]":
         """
@@ -117,8 +231,84 @@ class TransformationMixin[T]:
         """
         from ..collection import Collection
 
-        filtered_items = [item for item in self._items if predicate(item)]
-        return Collection(filtered_items)
+        return Collection._from_list([item for item in self._items if predicate(item)])
+
+    def distinct(
+        self,
+        key_or_callback: str | Callable[[T], Any] | None = None,
+        approximate: bool = False,
+        capacity: int | None = None,
+        error_rate: float = 0.01,
+    ) -> "Collection[T]":
+        """
+        Remove repeated items, keeping the first occurrence of each value.
+
+        Values are compared like in find_duplicates(): hashable values by
+        equality, unhashable ones (dicts, lists) by structure.
+
+        With approximate=True, the values already seen are remembered in a
+        Bloom filter whose size depends only on capacity and error_rate, instead
+        of a set holding every distinct value. Repeated values are still always
+        removed, but a value that was not seen before is dropped with a
+        probability of about error_rate.
+
+        Args:
+            key_or_callback: Optional key or callback function.
+                - If None: compares the items themselves
+                - If str: compares the values of the specified key/attribute (dot notation supported)
+                - If callable: compares the results of the callback
+            approximate: Use a fixed-size Bloom filter instead of an exact set.
+            capacity: Expected number of distinct values for the Bloom filter.
+                      Defaults to the number of items.
+            error_rate: Probability of wrongly dropping a new value (approximate only).
+
+        Returns:
+            A new Collection with the first item for each distinct value, in order.
+
+        Raises:
+            ValueError: If capacity or error_rate is out of range.
+            KeyError: If a dict item is missing the key.
+            AttributeError: If an object item is missing the attribute.
+
+        Examples:
+            Collection([3, 1, 3, 2, 1]).distinct().all()  # [3, 1, 2]
+            events.distinct("event_id", approximate=True, error_rate=0.001)
+        """
+        from ..collection import Collection
+
+        if key_or_callback is None and not approximate:
+            try:
+                # dict keeps the first of equal keys, in insertion order
+                return Collection._from_list(list(dict.fromkeys(self._items)))
+            except TypeError:
+                pass
+
+        if approximate and capacity is None:
+            capacity = max(len(self._items), 1)
+        return Collection._from_list(
+            list(
+                iter_distinct(
+                    self._items, key_or_callback, approximate, capacity, error_rate
+                )
+            )
+        )
+
+    def unique_by(
+        self,
+        key_or_callback: str | Callable[[T], Any],
+        approximate: bool = False,
+        capacity: int | None = None,
+        error_rate: float = 0.01,
+    ) -> "Collection[T]":
+        """
+        Keep the first item for each distinct value of a key or callback.
+
+        Same as distinct(key_or_callback, ...), with the key required.
+
+        Examples:
+            users.unique_by("email")
+        """
+        return self.distinct(key_or_callback, approximate, capacity, error_rate)
 
     def reverse(self) -> "Collection[T]":
         """
@@ -129,16 +319,51 @@ class TransformationMixin[T]:
         """
         from ..collection import Collection
 
-        reversed_items = self._items[::-1]
-        return Collection(reversed_items)
+        return Collection._from_list(self._items[::-1])
+
+    def view(
+        self,
+        start: int | None = None,
+        stop: int | None = None,
+        step: int | None = None,
+    ) -> "CollectionView[T]":
+        """
+        Return a read-only view of a range of the items, without copying them.
+
+        The view takes slice-style bounds and supports the read-only Collection
+        API; slicing, reversing or taking from it returns further views in
+        O(1). It becomes invalid once this collection is modified.
+
+        Args:
+            start: First position, as in a slice.
+            stop: Position to stop before, as in a slice.
+            step: Step between positions, as in a slice.
+
+        Returns:
+            A CollectionView over the selected items.
+
+        Examples:
+            page = events.view(2_000, 2_100)
+            newest_first = events.view(step=-1)
+        """
+        from ..collection_view import CollectionView
+
+        return CollectionView(self, start, stop, step)
 
     def clone(self) -> "Collection[T]":
         """
         Return a new collection with the same items.
 
+        The clone is copy-on-write: both collections share the same list until
+        one of them is modified (append, extend, remove, remove_one or
+        sort_inplace), which then copies it first. Cloning is O(1), and a
+        clone that is only read is never copied.
+
         Returns:
             A new Collection containing the same items as the original.
         """
         from ..collection import Collection
 
-        return Collection(self._items.copy())
+        clone = Collection._from_list(self._items)
+        clone._shared = self._shared = True
+        return clone
@@ -1,16 +1,53 @@
 """Utility mixin for Collection class."""
 
-from typing import TYPE_CHECKING, Any, TypeVar
+import json
+from collections.abc import Iterable, Iterator
+from itertools import batched
+from typing import TYPE_CHECKING, Any, TextIO, TypeVar
+
+from ..serialization import Converter, to_plain
 
 if TYPE_CHECKING:
     from ..collection import Collection
 
 T = TypeVar("T")
 
+# Encoder matching the json.dumps(..., ensure_ascii=False) call of to_json()
+_json_encoder = json.JSONEncoder(ensure_ascii=False)
+
+# Number of items encoded into each chunk by iter_json() and write_json()
+_DEFAULT_JSON_CHUNK_SIZE = 1000
+
+
+def json_chunks(items: Iterable[Any], chunk_size: int) -> Iterator[str]:
+    """
+    Encode items as a JSON array, chunk_size items per yielded string.
+
+    Items are converted like to_dict(mode="json") and read one batch at a
+    time, so neither the converted items nor the whole text are held at once;
+    the items may come from any iterable, including a generator.
+
+    Args:
+        items: The items to encode.
+        chunk_size: Number of items encoded into each chunk (positive).
+
+    Returns:
+        An iterator of strings that together form the JSON array.
+    """
+    convert = Converter(json_mode=True).convert
+    encode = _json_encoder.encode
+    opening = "["
+    for batch in batched(items, chunk_size, strict=False):
+        yield opening + ", ".join(encode(convert(item)) for item in batch)
+        opening = ", "
+    yield "[]" if opening == "[" else "]"
+
 
 class UtilityMixin[T]:
     """Mixin providing utility methods."""
 
+    __slots__ = ()
+
     def take(self, count: int) -> "Collection[T]":
         """
         Return a new collection with the specified number of items.
@@ -35,7 +72,7 @@ class UtilityMixin[T]:
             return Collection()
 
         taken_items = self._items[:count] if count >= 0 else self._items[count:]
-        return Collection(taken_items)
+        return Collection._from_list(taken_items)
 
     def dump_me(self) -> None:
         """
@@ -79,7 +116,7 @@ class UtilityMixin[T]:
         self.dump_me()
         raise SystemExit("Collection dump completed - execution stopped")
 
-    def to_dict(self, mode: str | None = None) -> list["Any"]:
+    def to_dict(self, mode: str | None = None) -> list[Any]:
         """
         Return the collection items converted to plain Python structures.
 
@@ -88,220 +125,16 @@ class UtilityMixin[T]:
         - If mode == "json", the result is guaranteed to be JSON-serializable
           (datetimes to ISO strings, Decimals to float, UUIDs to str, sets to lists, etc.).
 
+        How each type is converted is resolved once and cached, so large
+        collections of the same kind of item only pay for the lookup once.
+
         Args:
             mode: When set to "json", ensures the returned structure is JSON-serializable.
 
         Returns:
             A list containing the converted items.
         """
-
-        json_mode = mode == "json"
-
-        # Track objects currently being processed to avoid infinite recursion on cycles
-        processing_ids: set[int] = set()
-        circular_marker = "[Circular]"
-
-        def is_hashable(obj: "Any") -> bool:
-            try:
-                hash(obj)
-            except Exception:
-                return False
-            return True
-
-        def safe_json_key(key: "Any") -> str:
-            # Map keys to JSON-safe strings with best-effort type-aware formatting
-            if key is None:
-                return "null"
-            if isinstance(key, bool | int | float | str):
-                return str(key)
-            try:
-                import datetime as _dt  # type: ignore
-                import decimal as _decimal  # type: ignore
-                import uuid as _uuid  # type: ignore
-            except Exception:  # pragma: no cover - defensive
-                _dt = None  # type: ignore
-                _decimal = None  # type: ignore
-                _uuid = None  # type: ignore
-            if _dt and isinstance(key, _dt.datetime | _dt.date | _dt.time):
-                return key.isoformat()
-            if _uuid and isinstance(key, _uuid.UUID):
-                return str(key)
-            if _decimal and isinstance(key, _decimal.Decimal):
-                # Keep decimal textual representation to avoid precision loss in keys
-                return str(key)
-            # Fallback: include type name to reduce collision chance
-            return f"<{type(key).__name__}:{key!r}>"
-
-        def convert(value: "Any") -> "Any":  # noqa: PLR0912
-            # Primitives
-            if value is None or isinstance(value, bool | int | float | str):
-                return value
-
-            # Avoid circular import: import here
-            from ..collection import Collection as _Collection
-
-            # Collections
-            if isinstance(value, _Collection):
-                obj_id = id(value)
-                if obj_id in processing_ids:
-                    return circular_marker
-                processing_ids.add(obj_id)
-                try:
-                    return [convert(v) for v in value.all()]
-                finally:
-                    processing_ids.discard(obj_id)
-
-            # Built-in containers
-            if isinstance(value, list | tuple):
-                obj_id = id(value)
-                if obj_id in processing_ids:
-                    return circular_marker
-                processing_ids.add(obj_id)
-                try:
-                    return [convert(v) for v in value]
-                finally:
-                    processing_ids.discard(obj_id)
-            if isinstance(value, set):
-                # sets are not JSON-serializable; always convert to list for consistency
-                obj_id = id(value)
-                if obj_id in processing_ids:
-                    return circular_marker
-                processing_ids.add(obj_id)
-                try:
-                    return [convert(v) for v in value]
-                finally:
-                    processing_ids.discard(obj_id)
-            if isinstance(value, dict):
-                obj_id = id(value)
-                if obj_id in processing_ids:
-                    return circular_marker
-                processing_ids.add(obj_id)
-                try:
-                    if json_mode:
-                        result: dict[str, Any] = {}
-                        for k, v in value.items():
-                            key_str = safe_json_key(k)
-                            if key_str in result:
-                                raise ValueError(
-                                    "Duplicate key after JSON stringification detected; potential data loss prevented"
-                                )
-                            result[key_str] = convert(v)
-                        return result
-                    # Non-JSON mode: preserve original keys to avoid creating unhashable keys
-                    return {k: convert(v) for k, v in value.items()}
-                finally:
-                    processing_ids.discard(obj_id)
-
-            # Dataclasses
-            try:
-                from dataclasses import asdict, is_dataclass  # type: ignore
-            except Exception:  # pragma: no cover - defensive
-                is_dataclass = None  # type: ignore
-                asdict = None  # type: ignore
-            if callable(is_dataclass) and is_dataclass(value):  # type: ignore
-                obj_id = id(value)
-                if obj_id in processing_ids:
-                    return circular_marker
-                processing_ids.add(obj_id)
-                try:
-                    data = asdict(value)  # type: ignore
-                    return convert(data)
-                finally:
-                    processing_ids.discard(obj_id)
-
-            # Pydantic models (v1 and v2)
-            # Use duck-typing to avoid hard dependency
-            model_dump_fn = getattr(value, "model_dump", None)
-            dict_fn = getattr(value, "dict", None)
-            if callable(model_dump_fn):
-                obj_id = id(value)
-                if obj_id in processing_ids:
-                    return circular_marker
-                processing_ids.add(obj_id)
-                try:
-                    try:
-                        # In v2, mode="json" ensures JSON-safe primitives when requested
-                        data = (
-                            model_dump_fn(mode="json") if json_mode else model_dump_fn()
-                        )
-                    except TypeError:
-                        # Older signatures without mode param
-                        data = model_dump_fn()
-                    return convert(data)
-                finally:
-                    processing_ids.discard(obj_id)
-            if callable(dict_fn):
-                obj_id = id(value)
-                if obj_id in processing_ids:
-                    return circular_marker
-                processing_ids.add(obj_id)
-                try:
-                    try:
-                        data = dict_fn()
-                    except Exception:
-                        # If dict() method requires args or fails, fall through to other strategies
-                        raise
-                    return convert(data)
-                except Exception:
-                    # Will try other representations below
-                    pass
-                finally:
-                    processing_ids.discard(obj_id)
-
-            # Third-party/common types handling in json mode
-            if json_mode:
-                try:
-                    import datetime as _dt
-                    import decimal as _decimal
-                    import uuid as _uuid
-                except Exception:  # pragma: no cover - defensive
-                    _dt = None  # type: ignore
-                    _decimal = None  # type: ignore
-                    _uuid = None  # type: ignore
-
-                if _dt and isinstance(value, _dt.datetime | _dt.date | _dt.time):
-                    # Use ISO format for JSON
-                    return value.isoformat()
-                if _decimal and isinstance(value, _decimal.Decimal):
-                    # Convert Decimal to float for JSON
-                    return float(value)
-                if _uuid and isinstance(value, _uuid.UUID):
-                    return str(value)
-
-            # Objects exposing to_dict()
-            if hasattr(value, "to_dict") and callable(value.to_dict):
-                obj_id = id(value)
-                if obj_id in processing_ids:
-                    return circular_marker
-                processing_ids.add(obj_id)
-                try:
-                    try:
-                        return convert(value.to_dict())  # type: ignore
-                    except Exception:
-                        # Some to_dict expect args or may raise; fall back to __dict__
-                        pass
-                finally:
-                    processing_ids.discard(obj_id)
-
-            # Fallback: use __dict__ if available, else string representation
-            if hasattr(value, "__dict__"):
-                obj_id = id(value)
-                if obj_id in processing_ids:
-                    return circular_marker
-                processing_ids.add(obj_id)
-                try:
-                    return {
-                        k: convert(v)
-                        for k, v in vars(value).items()
-                        if not k.startswith("__")
-                    }
-                finally:
-                    processing_ids.discard(obj_id)
-
-            # Final fallback: string representation (ensures json serializable when needed)
-            return str(value)
-
-        return [convert(item) for item in self._items]
+        return to_plain(self._items, json_mode=mode == "json")
 
     def to_json(self) -> str:
         """
@@ -312,7 +145,79 @@ class UtilityMixin[T]:
         Returns:
             A JSON-formatted string.
         """
+        return json.dumps(self.to_dict(mode="json"), ensure_ascii=False)
 
-        import json
+    def iter_json(self, chunk_size: int = _DEFAULT_JSON_CHUNK_SIZE) -> Iterator[str]:
+        """
+        Generate the JSON text of the collection in chunks.
 
-        return json.dumps(self.to_dict(mode="json"), ensure_ascii=False)
+        Items are converted (with the same rules as to_dict(mode="json")) and
+        encoded one at a time, so only the current chunk is held in memory.
+        Joining the chunks gives exactly the string returned by to_json().
+
+        Args:
+            chunk_size: Number of items encoded into each generated chunk.
+
+        Returns:
+            An iterator of strings that together form a JSON array.
+
+        Raises:
+            ValueError: If chunk_size is not a positive integer, or (while
+                        iterating) if an item has keys that collide after
+                        JSON stringification.
+
+        Examples:
+            for chunk in collection.iter_json():
+                response.write(chunk)
+        """
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError("Chunk size must be a positive integer")
+        return json_chunks(self._items, chunk_size)
+
+    def write_json(
+        self, fp: TextIO, chunk_size: int = _DEFAULT_JSON_CHUNK_SIZE
+    ) -> None:
+        """
+        Write the collection as a JSON array to a text file-like object.
+
+        The output is the same as to_json(), written chunk by chunk as it is
+        produced by iter_json() instead of being built as a single string.
+
+        Args:
+            fp: An object with a write(str) method, e.g. a file opened in text mode.
+            chunk_size: Number of items encoded per write() call.
+
+        Raises:
+            ValueError: If chunk_size is not a positive integer.
+
+        Examples:
+            with open("export.json", "w", encoding="utf-8") as fp:
+                collection.write_json(fp)
+        """
+        write = fp.write
+        for chunk in self.iter_json(chunk_size):
+            write(chunk)
+
+    def iter_jsonl(self) -> Iterator[str]:
+        """
+        Generate the collection as JSON Lines, one item at a time.
+
+        Each item is converted with the same rules as to_dict(mode="json") and
+        encoded on its own line.
+
+        Returns:
+            An iterator of strings, each one a JSON document ending with a newline.
+        """
+        convert = Converter(json_mode=True).convert
+        encode = _json_encoder.encode
+        for item in self._items:
+            yield encode(convert(item)) + "\n"
+
+    def to_jsonl(self) -> str:
+        """
+        Return the collection as a JSON Lines string.
+
+        Returns:
+            A string with one JSON document per item, each ending with a newline.
+        """
+        return "".join(self.iter_jsonl())
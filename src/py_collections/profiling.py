@@ -0,0 +1,345 @@
+"""
+Opt-in per-method instrumentation for Collection and CollectionMap.
+
+While profiling is enabled, the public methods of the instrumented classes
+are replaced by wrappers that record call counts, cumulative time, the
+number of items each call worked on and, optionally, the memory allocated
+during each call. Disabling profiling puts the original methods back, so
+there is no cost at all while it is off.
+
+Examples:
+    from py_collections import profiling
+
+    with profiling.profile(track_memory=True) as profiler:
+        handle_request()
+    print(profiler.to_prometheus())
+"""
+
+import functools
+import inspect
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any
+
+_MISSING = object()
+
+
+@dataclass(slots=True)
+class MethodStats:
+    """
+    Totals recorded for one method.
+
+    Attributes:
+        calls: Number of calls.
+        seconds: Cumulative wall-clock time, including nested profiled calls.
+        items: Total number of items the calls worked on (the size of the
+               collection for instance methods, of the result for constructors).
+        bytes: Total peak memory allocated during the calls, when memory
+               tracking is enabled.
+    """
+
+    calls: int = 0
+    seconds: float = 0.0
+    items: int = 0
+    bytes: int = 0
+
+
+_METRICS = (
+    ("calls", "calls_total", "Number of calls per method."),
+    ("seconds", "seconds_total", "Cumulative time spent per method."),
+    ("items", "items_total", "Number of items processed per method."),
+    ("bytes", "allocated_bytes_total", "Peak bytes allocated per method."),
+)
+
+
+class Profiler:
+    """
+    Collects MethodStats per "<Class>.<method>" name.
+
+    Args:
+        track_memory: Whether to measure allocations with tracemalloc. This is
+                      much slower than timing alone.
+    """
+
+    __slots__ = ("_local", "_lock", "_stats", "track_memory")
+
+    def __init__(self, track_memory: bool = False):
+        self.track_memory = track_memory
+        self._stats: dict[str, MethodStats] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def record(self, name: str, seconds: float, items: int, allocated: int) -> None:
+        """Add one call to the totals of a method."""
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = MethodStats()
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.items += items
+            stats.bytes += allocated
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        with self._lock:
+            self._stats.clear()
+
+    def report(self) -> dict[str, dict[str, int | float]]:
+        """
+        Return the recorded totals.
+
+        Returns:
+            A dictionary from method name to its calls, seconds, items and
+            bytes, sorted by cumulative time (slowest first).
+        """
+        with self._lock:
+            ordered = sorted(
+                self._stats.items(), key=lambda entry: entry[1].seconds, reverse=True
+            )
+            return {name: asdict(stats) for name, stats in ordered}
+
+    def to_prometheus(self, prefix: str = "py_collections") -> str:
+        """
+        Return the recorded totals in the Prometheus text exposition format.
+
+        Args:
+            prefix: Prefix of the metric names.
+
+        Returns:
+            One counter family per measurement, labelled by method.
+        """
+        report = self.report()
+        lines = []
+        for field, suffix, description in _METRICS:
+            if field == "bytes" and not self.track_memory:
+                continue
+            metric = f"{prefix}_{suffix}"
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} counter")
+            for name, stats in report.items():
+                lines.append(f'{metric}{{method="{name}"}} {stats[field]}')
+        return "\n".join(lines) + "\n"
+
+    def _call(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        constructor: bool,
+    ) -> Any:
+        """Run a wrapped method and record it."""
+        items = 0 if constructor else _size_of(args[0])
+        tracking = self.track_memory and tracemalloc.is_tracing()
+        start_bytes = self._enter_memory_frame() if tracking else 0
+        result = None
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            allocated = self._exit_memory_frame(start_bytes) if tracking else 0
+            if constructor:
+                items = _size_of(result)
+            self.record(name, elapsed, items, allocated)
+        return result
+
+    async def _acall(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Await a wrapped coroutine method and record it (time only)."""
+        items = _size_of(args[0])
+        start = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            self.record(name, time.perf_counter() - start, items, 0)
+
+    def _enter_memory_frame(self) -> int:
+        """
+        Start measuring the allocation peak of a call.
+
+        tracemalloc has a single peak, so the enclosing call's peak so far is
+        saved on a per-thread stack before resetting it.
+        """
+        frames = getattr(self._local, "frames", None)
+        if frames is None:
+            frames = self._local.frames = []
+        current, peak = tracemalloc.get_traced_memory()
+        if frames:
+            frames[-1][1] = max(frames[-1][1], peak)
+        tracemalloc.reset_peak()
+        frames.append([current, current])
+        return current
+
+    def _exit_memory_frame(self, start_bytes: int) -> int:
+        """Finish measuring a call and return the bytes it allocated at peak."""
+        frames = self._local.frames
+        peak = max(frames.pop()[1], tracemalloc.get_traced_memory()[1])
+        if frames:
+            frames[-1][1] = max(frames[-1][1], peak)
+        return max(peak - start_bytes, 0)
+
+
+def _size_of(obj: Any) -> int:
+    """Number of items held by a collection-like object, 0 for anything else."""
+    items = getattr(obj, "_items", None)
+    if isinstance(items, list):
+        return len(items)
+    data = getattr(obj, "_data", None)
+    if isinstance(data, dict):
+        return sum(_size_of(value) for value in data.values())
+    return 0
+
+
+def _instrumented_classes() -> tuple[type, ...]:
+    from .collection import Collection
+    from .collection_map import CollectionMap
+
+    return (Collection, CollectionMap)
+
+
+def _wrap(profiler: Profiler, name: str, attribute: Any) -> Any:
+    """Build the profiled replacement of a method, classmethod or coroutine."""
+    if isinstance(attribute, classmethod):
+        func = attribute.__func__
+
+        @functools.wraps(func)
+        def constructor(*args: Any, **kwargs: Any) -> Any:
+            return profiler._call(name, func, args, kwargs, constructor=True)
+
+        return classmethod(constructor)
+
+    if inspect.iscoroutinefunction(attribute):
+
+        @functools.wraps(attribute)
+        async def coroutine(*args: Any, **kwargs: Any) -> Any:
+            return await profiler._acall(name, attribute, args, kwargs)
+
+        return coroutine
+
+    @functools.wraps(attribute)
+    def method(*args: Any, **kwargs: Any) -> Any:
+        return profiler._call(name, attribute, args, kwargs, constructor=False)
+
+    return method
+
+
+class _State:
+    """The active profiler and the class attributes its wrappers replaced."""
+
+    __slots__ = ("lock", "originals", "profiler", "started_tracemalloc")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.profiler: Profiler | None = None
+        self.originals: list[tuple[type, str, Any]] = []
+        self.started_tracemalloc = False
+
+
+_state = _State()
+
+
+def enable(track_memory: bool = False) -> Profiler:
+    """
+    Start profiling every public method of Collection and CollectionMap.
+
+    Args:
+        track_memory: Also record the peak memory allocated by each call,
+                      using tracemalloc (started here if it is not running).
+
+    Returns:
+        The Profiler collecting the measurements.
+
+    Raises:
+        RuntimeError: If profiling is already enabled.
+    """
+    with _state.lock:
+        if _state.profiler is not None:
+            raise RuntimeError("Profiling is already enabled")
+
+        profiler = Profiler(track_memory)
+        for cls in _instrumented_classes():
+            for name in dir(cls):
+                if name.startswith("_"):
+                    continue
+                attribute = inspect.getattr_static(cls, name)
+                if not (
+                    inspect.isfunction(attribute) or isinstance(attribute, classmethod)
+                ):
+                    continue
+                _state.originals.append((cls, name, cls.__dict__.get(name, _MISSING)))
+                setattr(cls, name, _wrap(profiler, f"{cls.__name__}.{name}", attribute))
+
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _state.started_tracemalloc = True
+
+        _state.profiler = profiler
+        return profiler
+
+
+def disable() -> Profiler | None:
+    """
+    Stop profiling and restore the original methods.
+
+    Returns:
+        The Profiler that was active, with its measurements, or None if
+        profiling was not enabled.
+    """
+    with _state.lock:
+        profiler = _state.profiler
+        if profiler is None:
+            return None
+
+        for cls, name, original in reversed(_state.originals):
+            if original is _MISSING:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+        _state.originals.clear()
+
+        if _state.started_tracemalloc:
+            tracemalloc.stop()
+            _state.started_tracemalloc = False
+
+        _state.profiler = None
+        return profiler
+
+
+def is_enabled() -> bool:
+    """Check whether profiling is currently enabled."""
+    return _state.profiler is not None
+
+
+def active() -> Profiler | None:
+    """Return the Profiler currently collecting measurements, if any."""
+    return _state.profiler
+
+
+@contextmanager
+def profile(track_memory: bool = False) -> Iterator[Profiler]:
+    """
+    Enable profiling for the duration of a with block.
+
+    Args:
+        track_memory: Also record the peak memory allocated by each call.
+
+    Returns:
+        A context manager producing the Profiler; its measurements remain
+        available after the block ends.
+    """
+    profiler = enable(track_memory)
+    try:
+        yield profiler
+    finally:
+        disable()
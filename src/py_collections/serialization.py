@@ -0,0 +1,285 @@
+"""Conversion of collection items to plain Python and JSON-safe structures."""
+
+import datetime
+import decimal
+import uuid
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, is_dataclass
+from typing import Any
+
+CIRCULAR_MARKER = "[Circular]"
+
+# Exact types returned as-is without consulting the dispatch table
+_PRIMITIVE_TYPES = frozenset((bool, int, float, str, type(None)))
+
+_TEMPORAL_TYPES = (datetime.datetime, datetime.date, datetime.time)
+
+# Returned by fallible strategies to hand the value to the next one
+_FALLTHROUGH = object()
+
+# The dispatch table is cleared when it grows past this many entries, so
+# short-lived classes (e.g. defined inside functions) cannot leak through it.
+_MAX_CACHED_TYPES = 1024
+
+type Strategy = Callable[["Converter", Any], Any]
+
+_strategies: dict[tuple[type, bool], Strategy] = {}
+
+
+class Converter:
+    """
+    Convert values to plain Python structures.
+
+    How a value is converted depends only on its type, so the strategy for
+    each type is resolved once and cached in a dispatch table shared by all
+    converters. Exact primitive types skip the table entirely, and cycle
+    tracking only happens for containers and objects.
+
+    A converter keeps track of the containers it is currently inside, so one
+    instance must not be used from several threads at once.
+
+    Args:
+        json_mode: When True, the converted structure is JSON-serializable
+                   (datetimes to ISO strings, Decimals to float, UUIDs to str,
+                   dict keys to strings).
+    """
+
+    __slots__ = ("active", "json_mode")
+
+    def __init__(self, json_mode: bool = False):
+        self.json_mode = json_mode
+        self.active: set[int] = set()
+
+    def convert(self, value: Any) -> Any:
+        """
+        Convert a single value.
+
+        Returns:
+            The converted value. A container or object that is already being
+            converted higher up in the structure is replaced by "[Circular]".
+
+        Raises:
+            ValueError: In JSON mode, if two dict keys become the same string.
+        """
+        cls = type(value)
+        if cls in _PRIMITIVE_TYPES:
+            return value
+        strategy = _strategies.get((cls, self.json_mode))
+        if strategy is None:
+            strategy = _strategy_for(cls, self.json_mode)
+        return strategy(self, value)
+
+    def convert_all(self, items: Iterable[Any]) -> list[Any]:
+        """Convert every item of an iterable into a new list."""
+        convert = self.convert
+        return [convert(item) for item in items]
+
+
+def to_plain(items: Iterable[Any], json_mode: bool = False) -> list[Any]:
+    """
+    Convert items to plain Python structures.
+
+    Args:
+        items: The items to convert.
+        json_mode: Whether the result must be JSON-serializable.
+
+    Returns:
+        A list containing the converted items.
+    """
+    return Converter(json_mode).convert_all(items)
+
+
+def _strategy_for(cls: type, json_mode: bool) -> Strategy:
+    """Resolve and cache the strategy for a type."""
+    if len(_strategies) >= _MAX_CACHED_TYPES:
+        _strategies.clear()
+    strategy = _strategies[(cls, json_mode)] = _resolve(cls, json_mode)
+    return strategy
+
+
+def _resolve(cls: type, json_mode: bool) -> Strategy:
+    """
+    Pick the strategy for a type.
+
+    The checks run in the same order for every type: primitives, Collections
+    and CollectionMaps, built-in containers, dataclasses, model_dump(), dict(), JSON special types,
+    to_dict(), and finally __dict__ or str().
+    """
+    from .collection import Collection
+    from .collection_map import CollectionMap
+
+    if issubclass(cls, bool | int | float | str):
+        return _as_is
+    if issubclass(cls, Collection):
+        return _guarded(_convert_collection)
+    if issubclass(cls, CollectionMap):
+        return _convert_collection_map
+    if issubclass(cls, list | tuple | set):
+        return _guarded(_convert_iterable)
+    if issubclass(cls, dict):
+        return _guarded(_convert_dict_json if json_mode else _convert_dict)
+    if is_dataclass(cls):
+        return _guarded(_convert_dataclass)
+    if callable(getattr(cls, "model_dump", None)):
+        return _guarded(_convert_model)
+
+    steps: list[Strategy] = []
+    if callable(getattr(cls, "dict", None)):
+        steps.append(_try_dict_method)
+
+    special = _json_special(cls) if json_mode else None
+    if special is not None:
+        final = special
+    else:
+        if callable(getattr(cls, "to_dict", None)):
+            steps.append(_try_to_dict_method)
+        final = _convert_attributes
+
+    if not steps:
+        return final if special is not None else _guarded(final)
+    return _guarded(_first_of(tuple(steps), final))
+
+
+def _json_special(cls: type) -> Strategy | None:
+    """Return the JSON-mode strategy for datetime, Decimal and UUID types."""
+    if issubclass(cls, _TEMPORAL_TYPES):
+        return _isoformat
+    if issubclass(cls, decimal.Decimal):
+        return _decimal_to_float
+    if issubclass(cls, uuid.UUID):
+        return _to_str
+    return None
+
+
+def _guarded(body: Strategy) -> Strategy:
+    """Wrap a strategy so values already being converted become "[Circular]"."""
+
+    def strategy(converter: Converter, value: Any) -> Any:
+        active = converter.active
+        obj_id = id(value)
+        if obj_id in active:
+            return CIRCULAR_MARKER
+        active.add(obj_id)
+        try:
+            return body(converter, value)
+        finally:
+            active.discard(obj_id)
+
+    return strategy
+
+
+def _first_of(steps: tuple[Strategy, ...], final: Strategy) -> Strategy:
+    """Try fallible strategies in order, then the final one."""
+
+    def strategy(converter: Converter, value: Any) -> Any:
+        for step in steps:
+            result = step(converter, value)
+            if result is not _FALLTHROUGH:
+                return result
+        return final(converter, value)
+
+    return strategy
+
+
+def _as_is(converter: Converter, value: Any) -> Any:
+    return value
+
+
+def _convert_collection(converter: Converter, value: Any) -> list[Any]:
+    return converter.convert_all(value._items)
+
+
+def _convert_collection_map(converter: Converter, value: Any) -> Any:
+    # Converted like a dict of lists; the dict conversion tracks cycles
+    return converter.convert(value._data)
+
+
+def _convert_iterable(converter: Converter, value: Any) -> list[Any]:
+    # Tuples and sets become lists, sets because they are not JSON-serializable
+    return converter.convert_all(value)
+
+
+def _convert_dict(converter: Converter, value: dict[Any, Any]) -> dict[Any, Any]:
+    # Keep the original keys: converting them could make them unhashable
+    convert = converter.convert
+    return {k: convert(v) for k, v in value.items()}
+
+
+def _convert_dict_json(converter: Converter, value: dict[Any, Any]) -> dict[str, Any]:
+    convert = converter.convert
+    result: dict[str, Any] = {}
+    for k, v in value.items():
+        key = k if type(k) is str else _json_key(k)
+        if key in result:
+            raise ValueError(
+                "Duplicate key after JSON stringification detected; potential data loss prevented"
+            )
+        result[key] = convert(v)
+    return result
+
+
+def _json_key(key: Any) -> str:
+    """Map a dict key to a JSON-safe string with type-aware formatting."""
+    if key is None:
+        return "null"
+    if isinstance(key, bool | int | float | str):
+        return str(key)
+    if isinstance(key, _TEMPORAL_TYPES):
+        return key.isoformat()
+    if isinstance(key, uuid.UUID | decimal.Decimal):
+        # Keep the textual Decimal representation to avoid precision loss
+        return str(key)
+    # Include the type name to reduce the chance of collisions
+    return f"<{type(key).__name__}:{key!r}>"
+
+
+def _convert_dataclass(converter: Converter, value: Any) -> Any:
+    return converter.convert(asdict(value))
+
+
+def _convert_model(converter: Converter, value: Any) -> Any:
+    # Pydantic v2 style models; mode="json" yields JSON-safe primitives
+    try:
+        data = (
+            value.model_dump(mode="json") if converter.json_mode else value.model_dump()
+        )
+    except TypeError:
+        # Older signatures without the mode parameter
+        data = value.model_dump()
+    return converter.convert(data)
+
+
+def _try_dict_method(converter: Converter, value: Any) -> Any:
+    # Pydantic v1 style models; a failing dict() falls through
+    try:
+        return converter.convert(value.dict())
+    except Exception:
+        return _FALLTHROUGH
+
+
+def _try_to_dict_method(converter: Converter, value: Any) -> Any:
+    # Some to_dict() methods expect arguments or raise; fall through to __dict__
+    try:
+        return converter.convert(value.to_dict())
+    except Exception:
+        return _FALLTHROUGH
+
+
+def _convert_attributes(converter: Converter, value: Any) -> Any:
+    if not hasattr(value, "__dict__"):
+        # Final fallback, which is always JSON-serializable
+        return str(value)
+    convert = converter.convert
+    return {k: convert(v) for k, v in vars(value).items() if not k.startswith("__")}
+
+
+def _isoformat(converter: Converter, value: Any) -> str:
+    return value.isoformat()
+
+
+def _decimal_to_float(converter: Converter, value: Any) -> float:
+    return float(value)
+
+
+def _to_str(converter: Converter, value: Any) -> str:
+    return str(value)
@@ -0,0 +1,324 @@
+"""Collection that keeps its items ordered by a key."""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any, Self, TypeVar
+
+from .collection import Collection
+from .key_access import resolve_key
+from .mixins.sorting import SortKey
+
+T = TypeVar("T")
+
+# extend() merges a batch with binary searches and slice copies while it is
+# smaller than 1/_MERGE_RATIO of the collection, and sorts everything otherwise.
+_MERGE_RATIO = 8
+
+
+class SortedCollection[T](Collection[T]):
+    """
+    A Collection whose items are always ordered by a key.
+
+    Alongside the items, the collection caches the key of every item in a
+    parallel list, so positions are found with a binary search instead of a
+    scan: insert(), first_ge(), last_le() and irange() take O(log n)
+    comparisons, and so do after(), before(), remove_one() and the ``in``
+    operator when given an element. Inserting in the middle still shifts the
+    tail of the underlying list (a fast memmove); items arriving in key order,
+    such as timestamped events, are appended without shifting anything, and
+    extend() merges a whole batch in one pass.
+
+    Items with equal keys keep their insertion order. The key is assumed to be
+    consistent with equality: equal items must have equal keys. Every other
+    Collection method is available; methods returning a new collection return
+    a plain Collection.
+
+    Args:
+        items: Optional list of items; they are sorted, not modified.
+        key: None to order by the items themselves, a key or attribute name
+             (dot notation supported), or a callable. Keys must be mutually
+             comparable.
+
+    Raises:
+        KeyError: If a dict item is missing the key.
+        AttributeError: If an object item is missing the attribute.
+        TypeError: If the key is not None, a string or a callable, or two keys
+                   cannot be compared.
+    """
+
+    __slots__ = ("_key", "_key_spec", "_keys")
+
+    def __init__(
+        self,
+        items: list[T] | None = None,
+        key: str | Callable[[T], Any] | None = None,
+    ):
+        get_key = resolve_key(key, strict=True)
+        self._items = sorted(items, key=get_key) if items else []
+        self._keys = list(map(get_key, self._items))
+        self._key = get_key
+        self._key_spec = key
+
+    @classmethod
+    def _from_list(
+        cls, items: list[T], key: str | Callable[[T], Any] | None = None
+    ) -> Self:
+        """
+        Wrap a freshly built list, sorting it in place.
+
+        Args:
+            items: A list that is not referenced anywhere else.
+            key: The key to order the items by, as for the constructor.
+
+        Returns:
+            A new SortedCollection that owns the given list.
+        """
+        get_key = resolve_key(key, strict=True)
+        items.sort(key=get_key)
+        collection = cls.__new__(cls)
+        collection._items = items
+        collection._keys = list(map(get_key, items))
+        collection._key = get_key
+        collection._key_spec = key
+        return collection
+
+    def __getstate__(self) -> tuple[dict[str, Any] | None, dict[str, Any]]:
+        """Pickle the key as given; the compiled accessor is a closure."""
+        state, slots = super().__getstate__()
+        del slots["_key"]
+        return state, slots
+
+    def __setstate__(self, state: tuple[dict[str, Any] | None, dict[str, Any]]) -> None:
+        """Restore the attributes and compile the key again."""
+        state, slots = state
+        for name, value in {**(state or {}), **slots}.items():
+            setattr(self, name, value)
+        self._key = resolve_key(self._key_spec, strict=True)
+
+    def insert(self, item: T) -> None:
+        """
+        Insert an item at its sorted position, after any items with an equal key.
+
+        Args:
+            item: The item to insert.
+        """
+        key = self._key(item)
+        keys = self._keys
+        items = self._own_items()
+        if not keys or not key < keys[-1]:
+            keys.append(key)
+            items.append(item)
+            if self._index is not None:
+                self._index_appended(len(keys) - 1)
+            return
+
+        position = bisect_right(keys, key)
+        keys.insert(position, key)
+        items.insert(position, item)
+        self._invalidate_index()
+
+    def append(self, item: T) -> None:
+        """
+        Add an item at its sorted position; the same as insert().
+
+        Args:
+            item: The item to add.
+        """
+        self.insert(item)
+
+    def extend(self, items: list[T] | Collection[T]) -> None:
+        """
+        Add several items at their sorted positions.
+
+        The new items are sorted among themselves and merged with the existing
+        ones in a single pass, which is much faster than inserting them one by
+        one. A batch whose keys all follow the current last key is appended.
+        Existing items stay before new items with an equal key.
+
+        Args:
+            items: A list or Collection containing the items to add.
+        """
+        new_items = list(items._items if hasattr(items, "_items") else items)
+        if not new_items:
+            return
+        get_key = self._key
+        new_items.sort(key=get_key)
+        new_keys = list(map(get_key, new_items))
+        keys = self._keys
+        items = self._own_items()
+
+        start = len(keys)
+        if not keys or not new_keys[0] < keys[-1]:
+            keys.extend(new_keys)
+            items.extend(new_items)
+            if self._index is not None:
+                self._index_appended(start)
+            return
+
+        if len(new_keys) * _MERGE_RATIO > len(keys):
+            # Large batch: one stable sort of the concatenated keys, which
+            # merges the two sorted runs
+            keys = keys + new_keys
+            items = items + new_items
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            self._keys = [keys[i] for i in order]
+            self._items = [items[i] for i in order]
+        else:
+            # Small batch: find where each new item goes (after existing items
+            # with an equal key) and copy the runs between them as slices
+            merged_items: list[T] = []
+            merged_keys: list[Any] = []
+            previous = 0
+            for item, key in zip(new_items, new_keys, strict=True):
+                position = bisect_right(keys, key, previous)
+                merged_items += items[previous:position]
+                merged_keys += keys[previous:position]
+                merged_items.append(item)
+                merged_keys.append(key)
+                previous = position
+            merged_items += items[previous:]
+            merged_keys += keys[previous:]
+            self._items = merged_items
+            self._keys = merged_keys
+        self._invalidate_index()
+
+    def first_ge(self, value: Any) -> T | None:
+        """
+        Get the first item whose key is greater than or equal to a value.
+
+        Args:
+            value: The key value to compare with.
+
+        Returns:
+            The first such item, or None if every key is smaller.
+
+        Examples:
+            >>> events = SortedCollection(rows, key="timestamp")
+            >>> events.first_ge(start_of_day)
+        """
+        position = bisect_left(self._keys, value)
+        return self._items[position] if position < len(self._items) else None
+
+    def last_le(self, value: Any) -> T | None:
+        """
+        Get the last item whose key is less than or equal to a value.
+
+        Args:
+            value: The key value to compare with.
+
+        Returns:
+            The last such item, or None if every key is greater.
+        """
+        position = bisect_right(self._keys, value)
+        return self._items[position - 1] if position else None
+
+    def irange(self, lo: Any = None, hi: Any = None) -> Iterator[T]:
+        """
+        Iterate over the items whose key lies between lo and hi, inclusive.
+
+        Both bounds are found by binary search, so reaching the first item
+        takes O(log n) however far into the collection it is. The collection
+        must not be modified while the iterator is in use.
+
+        Args:
+            lo: The smallest key to include, or None for no lower bound.
+            hi: The largest key to include, or None for no upper bound.
+
+        Returns:
+            An iterator over the matching items, in key order.
+
+        Examples:
+            >>> list(SortedCollection([5, 1, 4, 2]).irange(2, 4))
+            [2, 4]
+        """
+        keys = self._keys
+        start = 0 if lo is None else bisect_left(keys, lo)
+        stop = len(keys) if hi is None else bisect_right(keys, hi)
+        return map(self._items.__getitem__, range(start, stop))
+
+    def remove(self, target: T | Callable[[T], bool]) -> None:
+        """
+        Remove all items that match the target element or predicate.
+
+        Args:
+            target: Either an element to remove, or a callable that takes an item
+                    and returns a boolean.
+        """
+        if callable(target):
+            keep = [not target(item) for item in self._items]
+        else:
+            keep = [item != target for item in self._items]
+        kept_items = [
+            item for item, kept in zip(self._items, keep, strict=True) if kept
+        ]
+        self._own_items()[:] = kept_items
+        self._keys[:] = [
+            key for key, kept in zip(self._keys, keep, strict=True) if kept
+        ]
+        self._invalidate_index()
+
+    def remove_one(self, target: T | Callable[[T], bool]) -> None:
+        """
+        Remove the first item that matches the target element or predicate.
+
+        An element is located by binary search on its key; a predicate is
+        tested against every item in order.
+
+        Args:
+            target: Either an element to remove, or a callable that takes an item
+                    and returns a boolean.
+        """
+        if callable(target):
+            position = next(
+                (i for i, item in enumerate(self._items) if target(item)), None
+            )
+        else:
+            position = self._position_of(target)
+        if position is not None:
+            item = self._own_items().pop(position)
+            del self._keys[position]
+            self._index_removed(item, position)
+
+    def sort_inplace(
+        self,
+        *keys: SortKey,  # noqa: ARG002
+        descending: bool | Sequence[bool] = False,  # noqa: ARG002
+    ) -> None:
+        """
+        Not supported: the order of a SortedCollection is fixed by its key.
+
+        Use sort_by() to get a Collection in another order.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise TypeError(
+            "SortedCollection is ordered by its key; use sort_by() for another order"
+        )
+
+    def _position_of(self, target: Any) -> int | None:
+        """
+        Find the position of the first item equal to target.
+
+        Without an index, only the run of items sharing the target's key is
+        searched. Targets whose key cannot be computed or compared fall back to
+        the inherited lookup.
+
+        Returns:
+            The index of the first matching item, or None if there is none.
+        """
+        if self._index is not None:
+            return super()._position_of(target)
+        keys = self._keys
+        try:
+            key = self._key(target)
+            position = bisect_left(keys, key)
+            stop = bisect_right(keys, key, position)
+        except (KeyError, AttributeError, TypeError):
+            return super()._position_of(target)
+
+        items = self._items
+        for i in range(position, stop):
+            if items[i] == target:
+                return i
+        return None
@@ -0,0 +1,101 @@
+import json
+
+import pytest
+
+from benchmarks import slots
+from benchmarks.cases import CASES
+from benchmarks.datasets import GENERATORS, make_dataset
+from benchmarks.runner import Result, compare, main
+from py_collections import Collection, CollectionMap
+
+
+def public_methods(cls: type) -> set[str]:
+    return {
+        f"{cls.__name__}.{name}"
+        for name in dir(cls)
+        if not name.startswith("_") and callable(getattr(cls, name))
+    }
+
+
+class TestBenchmarkCases:
+    def test_every_public_method_has_a_case(self):
+        """Test that each public Collection and CollectionMap method is benchmarked."""
+        expected = public_methods(Collection) | public_methods(CollectionMap)
+        assert expected - set(CASES) == set()
+
+    @pytest.mark.parametrize("kind", list(GENERATORS))
+    def test_cases_run_on_every_dataset(self, kind, capsys):
+        """Test that every case runs on a small dataset of each kind."""
+        dataset = make_dataset(kind, 20)
+        for case in CASES.values():
+            if case.applies_to(dataset):
+                case.run(case.setup(dataset), dataset)
+        capsys.readouterr()
+
+    def test_unknown_dataset(self):
+        """Test that an unknown dataset kind is rejected."""
+        with pytest.raises(ValueError, match="Unknown or unavailable dataset"):
+            make_dataset("tuples", 10)
+
+
+class TestBenchmarkRunner:
+    def test_compare_flags_slowdowns_and_allocation_growth(self):
+        """Test that only changes beyond the threshold count as regressions."""
+        baseline = {
+            "a": {"ops_per_sec": 100.0, "alloc_peak_bytes": 1_000_000},
+            "b": {"ops_per_sec": 100.0, "alloc_peak_bytes": 1_000_000},
+            "c": {"ops_per_sec": 100.0, "alloc_peak_bytes": 1_000},
+        }
+        results = {
+            "a": Result(80.0, 1_100_000, 0, None),
+            "b": Result(60.0, 2_000_000, 0, None),
+            "c": Result(100.0, 10_000, 0, None),
+            "new": Result(1.0, 10**9, 0, None),
+        }
+
+        regressions = compare(results, baseline, threshold=0.25)
+        assert len(regressions) == 2
+        assert all(message.startswith("b:") for message in regressions)
+
+    def test_save_and_compare_baseline(self, tmp_path, capsys):
+        """Test a baseline round trip through the command line entry point."""
+        baseline = tmp_path / "baseline.json"
+        output = tmp_path / "results.json"
+        args = [
+            "--sizes",
+            "10",
+            "--datasets",
+            "ints",
+            "--cases",
+            r"Collection\.sum$",
+            "--min-time",
+            "0",
+            "--baseline",
+            str(baseline),
+        ]
+
+        assert main([*args, "--save-baseline"]) == 0
+        saved = json.loads(baseline.read_text())["results"]
+        assert list(saved) == ["Collection.sum[ints-10]"]
+
+        assert main([*args, "--threshold", "1", "--output", str(output)]) == 0
+        assert "No regressions" in capsys.readouterr().out
+        assert list(json.loads(output.read_text())["results"]) == list(saved)
+
+
+class TestSlotsBenchmark:
+    def test_slots_script_runs(self, monkeypatch, capsys):
+        """Test that the __slots__ vs __dict__ comparison runs on small inputs."""
+        monkeypatch.setattr(slots, "INSTANCES", 100)
+        monkeypatch.setattr(slots, "ACCESSES", 100)
+        slots.main()
+        output = capsys.readouterr().out
+        assert "bytes per instance" in output
+        assert "group_by peak memory (MB)" in output
+
+    def test_dict_collection_matches_collection(self):
+        """Test that the __dict__ variant keeps every Collection method and no slots."""
+        collection = slots.DictCollection([3, 1, 2])
+        collection.append(4)
+        assert collection.clone().sort_by().all() == [1, 2, 3, 4]
+        assert "_items" in vars(collection)
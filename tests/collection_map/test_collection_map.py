@@ -464,3 +464,23 @@ class TestCollectionMap:
         # Test __repr__ method
         repr_result = repr(cmap)
         assert repr_result == result  # __repr__ should return the same as __str__
+
+    def test_group_from_generator(self):
+        """Test building a CollectionMap by grouping a generator."""
+        rows = ({"level": level, "n": n} for n, level in enumerate("ab" * 3))
+
+        cmap = CollectionMap.group(rows, "level")
+
+        assert cmap.keys() == ["a", "b"]
+        assert isinstance(cmap["a"], Collection)
+        assert cmap["a"].pluck("n").all() == [0, 2, 4]
+        assert cmap.total_items() == 6
+
+    def test_group_without_key(self):
+        """Test grouping items by themselves."""
+        cmap = CollectionMap.group(["x", "y", "x"])
+        assert cmap.group_sizes() == {"x": 2, "y": 1}
+
+    def test_group_empty(self):
+        """Test grouping an empty iterable."""
+        assert len(CollectionMap.group([])) == 0
@@ -0,0 +1,152 @@
+import pytest
+
+from py_collections import Collection, CollectionView, SortedCollection
+
+
+class TestCollectionView:
+    """Test cases for read-only views created by Collection.view()."""
+
+    def test_view_bounds_match_slicing(self):
+        """Test that views select the same items as list slicing."""
+        items = list(range(20))
+        collection = Collection(items)
+        for bounds in [
+            (None, None, None),
+            (3, 12, None),
+            (-5, None, None),
+            (None, None, -1),
+            (15, 2, -3),
+            (1, 19, 4),
+            (30, 40, None),
+        ]:
+            view = collection.view(*bounds)
+            assert isinstance(view, CollectionView)
+            assert view.all() == items[slice(*bounds)]
+            assert len(view) == len(items[slice(*bounds)])
+
+    def test_view_does_not_copy(self):
+        """Test that a view reads the parent's items rather than a copy."""
+        item = {"id": 1}
+        collection = Collection([item, {"id": 2}])
+        assert collection.view()[0] is item
+
+    def test_slicing_a_view_returns_a_view(self):
+        """Test slicing, negative indexes and nested views."""
+        view = Collection(list(range(10))).view(2, 9)
+        page = view[1:4]
+        assert isinstance(page, CollectionView)
+        assert page.all() == [3, 4, 5]
+        assert page[::-1].all() == [5, 4, 3]
+        assert view[-1] == 8
+        with pytest.raises(IndexError):
+            view[7]
+
+    def test_reverse_and_take_return_views(self):
+        """Test that reverse() and take() on a view do not copy."""
+        view = Collection([1, 2, 3, 4, 5]).view()
+        assert isinstance(view.reverse(), CollectionView)
+        assert view.reverse().all() == [5, 4, 3, 2, 1]
+        assert view.take(2).all() == [1, 2]
+        assert view.take(-2).all() == [4, 5]
+        assert view.take(10).all() == [1, 2, 3, 4, 5]
+        assert view.reverse().take(2).reverse().all() == [4, 5]
+
+    def test_read_only_api(self):
+        """Test that read-only Collection methods work through the view."""
+        rows = Collection([{"g": i % 2, "v": i} for i in range(10)])
+        view = rows.view(2, 8)
+        assert view.sum("v") == 2 + 3 + 4 + 5 + 6 + 7
+        assert view.pluck("v").all() == [2, 3, 4, 5, 6, 7]
+        assert view.first(lambda row: row["v"] > 4) == {"g": 1, "v": 5}
+        assert view.filter(lambda row: row["g"]).pluck("v").all() == [3, 5, 7]
+        assert view.group_by("g")[0].pluck("v").all() == [2, 4, 6]
+        assert view.top_k(2, "v").pluck("v").all() == [7, 6]
+        assert view.sort_by("v", descending=True).first()["v"] == 7
+        assert view.after({"g": 0, "v": 4}) == {"g": 1, "v": 5}
+        assert {"g": 0, "v": 2} in view
+        assert {"g": 0, "v": 0} not in view
+        assert view.chunk(4)[1].pluck("v").all() == [6, 7]
+        assert view.lazy().pluck("v").take(2).all() == [2, 3]
+        assert view.to_dict()[0] == {"g": 0, "v": 2}
+        assert view.index_by("v").lookup(3).all() == [{"g": 1, "v": 3}]
+
+    def test_derived_collections_are_plain(self):
+        """Test that methods building a new collection return a Collection."""
+        view = Collection([3, 1, 2]).view()
+        for result in [view.map(str), view.filter(bool), view.clone(), view + view]:
+            assert type(result) is Collection
+        assert (view + Collection([4])).all() == [3, 1, 2, 4]
+        assert (Collection([0]) + view).all() == [0, 3, 1, 2]
+
+    def test_equality_and_str(self):
+        """Test equality with collections and the string representation."""
+        collection = Collection([1, 2, 3])
+        assert collection.view(1) == Collection([2, 3])
+        assert Collection([2, 3]) == collection.view(1)
+        assert collection.view() == collection
+        assert collection.view(1) != Collection([2])
+        assert str(collection.view(step=-1)) == "CollectionView([3, 2, 1])"
+
+    def test_materialize(self):
+        """Test that materialize() returns an independent Collection."""
+        collection = Collection([1, 2, 3])
+        copy = collection.view(1).materialize()
+        assert type(copy) is Collection
+        collection.append(4)
+        copy.append(5)
+        assert copy.all() == [2, 3, 5]
+        assert collection.all() == [1, 2, 3, 4]
+
+    def test_view_is_read_only(self):
+        """Test that mutators raise TypeError and leave the parent unchanged."""
+        collection = Collection([1, 2, 3])
+        view = collection.view()
+        for call in [
+            lambda: view.append(4),
+            lambda: view.extend([4]),
+            lambda: view.remove(1),
+            lambda: view.remove_one(1),
+            view.sort_inplace,
+        ]:
+            with pytest.raises(TypeError, match="CollectionView is read-only"):
+                call()
+        assert collection.all() == [1, 2, 3]
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda c: c.append(9),
+            lambda c: c.extend([9]),
+            lambda c: c.remove(1),
+            lambda c: c.remove_one(2),
+            lambda c: c.sort_inplace(descending=True),
+        ],
+        ids=["append", "extend", "remove", "remove_one", "sort_inplace"],
+    )
+    def test_parent_mutation_invalidates_views(self, mutate):
+        """Test that using a view after its parent changed raises RuntimeError."""
+        collection = Collection([1, 2, 3])
+        view = collection.view()
+        page = view[:2]
+        mutate(collection)
+        with pytest.raises(RuntimeError, match="modified after the view"):
+            view.all()
+        with pytest.raises(RuntimeError, match="modified after the view"):
+            len(page)
+        assert collection.view().all() == collection.all()
+
+    def test_sorted_collection_mutation_invalidates_views(self):
+        """Test that SortedCollection mutators also invalidate views."""
+        numbers = SortedCollection([3, 1])
+        view = numbers.view()
+        numbers.insert(2)
+        with pytest.raises(RuntimeError):
+            list(view)
+
+    def test_empty_views(self):
+        """Test views that select nothing."""
+        assert Collection([]).view().all() == []
+        empty = Collection([1, 2]).view(2)
+        assert empty.all() == []
+        assert list(reversed(empty._items)) == []
+        assert empty.first() is None
@@ -0,0 +1,177 @@
+import json
+from array import array
+
+import pytest
+
+from py_collections import Collection, ColumnarCollection
+
+ROWS = [
+    {"id": 1, "city": "Paris", "price": 10.5, "tags": ["a"]},
+    {"id": 2, "city": "Rome", "price": 20.0, "tags": []},
+    {"id": 3, "city": "Paris", "price": 4.5, "tags": ["b", "c"]},
+]
+
+
+class TestColumnarCollection:
+    """Test cases for the column-oriented collection."""
+
+    def test_columns_are_compacted(self):
+        """Test that int and float fields are stored as typed arrays."""
+        columnar = ColumnarCollection(ROWS)
+        assert columnar._columns["id"] == array("q", [1, 2, 3])
+        assert columnar._columns["price"] == array("d", [10.5, 20.0, 4.5])
+        assert isinstance(columnar._columns["city"], list)
+        assert columnar.columns == ["id", "city", "price", "tags"]
+
+    def test_bool_and_large_int_columns_stay_lists(self):
+        """Test that bool columns and ints beyond 64 bits are not put in arrays."""
+        columnar = ColumnarCollection([{"flag": True, "big": 2**70}])
+        assert columnar._columns["flag"] == [True]
+        assert columnar._columns["big"] == [2**70]
+
+    def test_rows_roundtrip(self):
+        """Test that the rows are rebuilt on demand with their original values."""
+        columnar = ColumnarCollection(ROWS)
+        assert len(columnar) == 3
+        assert columnar.all() == ROWS
+        assert list(columnar) == ROWS
+        assert columnar[1] == ROWS[1]
+        assert columnar[-1] == ROWS[-1]
+        assert columnar.first() == ROWS[0]
+        assert columnar.to_collection() == Collection(ROWS)
+
+    def test_index_out_of_range(self):
+        """Test that an out-of-range position raises IndexError."""
+        with pytest.raises(IndexError):
+            ColumnarCollection(ROWS)[3]
+
+    def test_empty(self):
+        """Test an empty columnar collection."""
+        columnar = ColumnarCollection()
+        assert len(columnar) == 0
+        assert columnar.all() == []
+        assert columnar.first() is None
+        assert columnar.sum("price") == 0
+        assert columnar.to_dict() == []
+
+    def test_mismatched_keys(self):
+        """Test that rows with different keys are rejected."""
+        with pytest.raises(ValueError, match="All rows must have the same keys"):
+            ColumnarCollection([{"a": 1}, {"b": 2}])
+        with pytest.raises(ValueError, match="All rows must have the same keys"):
+            ColumnarCollection([{"a": 1}, {"a": 2, "b": 3}])
+
+    def test_non_dict_rows(self):
+        """Test that rows that are not dictionaries are rejected."""
+        with pytest.raises(TypeError, match="rows must be dictionaries"):
+            ColumnarCollection([1, 2])
+        with pytest.raises(TypeError, match="rows must be dictionaries"):
+            ColumnarCollection([None, {"a": 1}])
+
+    def test_rows_without_fields(self):
+        """Test that empty rows are counted and materialized consistently."""
+        columnar = ColumnarCollection([{}, {}])
+        assert len(columnar) == 2
+        assert columnar.columns == []
+        assert columnar.all() == [{}, {}]
+        assert columnar[1] == {}
+        assert columnar.first() == {}
+        assert columnar.to_collection() == Collection([{}, {}])
+
+    def test_from_columns(self):
+        """Test building from per-field sequences."""
+        columnar = ColumnarCollection.from_columns({"a": [1, 2], "b": ("x", "y")})
+        assert columnar.all() == [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]
+        assert columnar.column("b") == ["x", "y"]
+
+        with pytest.raises(ValueError, match="same length"):
+            ColumnarCollection.from_columns({"a": [1], "b": []})
+
+    def test_to_columnar(self):
+        """Test converting a Collection of dictionaries."""
+        columnar = Collection(ROWS).to_columnar()
+        assert isinstance(columnar, ColumnarCollection)
+        assert columnar.all() == ROWS
+
+    def test_pluck(self):
+        """Test plucking a column, a pair of columns and a nested path."""
+        columnar = ColumnarCollection(ROWS)
+        assert columnar.pluck("city").all() == ["Paris", "Rome", "Paris"]
+        assert columnar.pluck("id", "city").all() == [
+            {1: "Paris"},
+            {2: "Rome"},
+            {3: "Paris"},
+        ]
+        assert columnar.pluck("missing").all() == [None, None, None]
+
+    def test_sum_and_average(self):
+        """Test aggregates on typed, list and callback values."""
+        columnar = ColumnarCollection(ROWS)
+        assert columnar.sum("price") == 35.0
+        assert columnar.sum("id") == 6
+        assert columnar.average("id") == 2.0
+        assert columnar.sum(lambda row: row["id"] * 2) == 12
+
+        mixed = ColumnarCollection([{"n": 1}, {"n": 2.5}])
+        assert mixed.sum("n") == 3.5
+
+    def test_large_float_column_matches_collection(self):
+        """Test that large float columns give the same aggregates as Collection."""
+        rows = [{"value": i * 0.5} for i in range(20_000)]
+        columnar = ColumnarCollection(rows)
+        assert columnar.sum("value") == Collection(rows).sum("value")
+        assert columnar.average("value") == Collection(rows).average("value")
+
+    def test_sum_errors_match_collection(self):
+        """Test that invalid aggregates raise the same errors as Collection."""
+        columnar = ColumnarCollection(ROWS)
+        with pytest.raises(TypeError, match="Value for key 'city' must be numeric"):
+            columnar.sum("city")
+        with pytest.raises(KeyError):
+            columnar.sum("missing")
+        with pytest.raises(ValueError, match="No values found for key to average"):
+            ColumnarCollection().average("price")
+
+    def test_filter_and_where(self):
+        """Test filtering with a row predicate and with a column predicate."""
+        columnar = ColumnarCollection(ROWS)
+        expensive = columnar.where("price", lambda price: price > 5)
+        assert isinstance(expensive, ColumnarCollection)
+        assert expensive.pluck("id").all() == [1, 2]
+        assert expensive._columns["id"].typecode == "q"
+
+        paris = columnar.filter(lambda row: row["city"] == "Paris")
+        assert paris.all() == [ROWS[0], ROWS[2]]
+
+        with pytest.raises(KeyError, match="Column 'missing' not found"):
+            columnar.where("missing", bool)
+
+    def test_group_by(self):
+        """Test grouping by a column and by a callback."""
+        columnar = ColumnarCollection(ROWS)
+        by_city = columnar.group_by("city")
+        assert list(by_city) == ["Paris", "Rome"]
+        assert by_city["Paris"].pluck("id").all() == [1, 3]
+        assert by_city["Rome"].sum("price") == 20.0
+
+        by_size = columnar.group_by(lambda row: len(row["tags"]))
+        assert {k: v.pluck("id").all() for k, v in by_size.items()} == {
+            1: [1],
+            0: [2],
+            2: [3],
+        }
+
+    def test_to_dict_and_to_json(self):
+        """Test that serialization matches the equivalent Collection."""
+        columnar = ColumnarCollection(ROWS)
+        assert columnar.to_dict() == Collection(ROWS).to_dict()
+        assert json.loads(columnar.to_json()) == Collection(ROWS).to_dict(mode="json")
+
+    def test_equality_and_str(self):
+        """Test equality and the string representation."""
+        assert ColumnarCollection(ROWS) == ColumnarCollection(ROWS)
+        assert ColumnarCollection(ROWS) != ColumnarCollection(ROWS[:2])
+        assert ColumnarCollection(ROWS) != ROWS
+        assert str(ColumnarCollection(ROWS[:1])) == (
+            "ColumnarCollection(columns=['id', 'city', 'price', 'tags'], rows=1)"
+        )
@@ -0,0 +1,104 @@
+"""Tests for collections built by subclassing Collection or combining mixins."""
+
+from py_collections import Collection
+from py_collections.mixins import (
+    BasicOperationsMixin,
+    ElementAccessMixin,
+    GroupingMixin,
+    NavigationMixin,
+    RemovalMixin,
+    SortingMixin,
+    StorageMixin,
+    TransformationMixin,
+    UtilityMixin,
+)
+
+
+class Mine(Collection):
+    def __init__(self, items):
+        self._items = list(items)
+
+
+class Custom(
+    BasicOperationsMixin,
+    ElementAccessMixin,
+    NavigationMixin,
+    RemovalMixin,
+    SortingMixin,
+):
+    def __init__(self, items):
+        self._items = list(items)
+
+
+class ReadOnly(
+    BasicOperationsMixin,
+    ElementAccessMixin,
+    NavigationMixin,
+    TransformationMixin,
+    GroupingMixin,
+    UtilityMixin,
+):
+    def __init__(self, items):
+        self._items = list(items)
+
+
+class Stored(StorageMixin):
+    def __init__(self, items):
+        self._items = items
+
+
+class TestCollectionSubclass:
+    def test_init_setting_only_items(self):
+        """Test a subclass whose __init__ only sets _items."""
+        mine = Mine([3, 1, 2])
+        mine.append(4)
+        assert mine.all() == [3, 1, 2, 4]
+        assert mine.view(1, 3).all() == [1, 2]
+        assert mine.after(1) == 2
+        assert mine.index_by().lookup(4).all() == [4]
+        mine.remove_one(3)
+        assert mine.all() == [1, 2, 4]
+
+    def test_clone_of_subclass(self):
+        """Test copy-on-write cloning of a subclass instance."""
+        mine = Mine([1, 2])
+        clone = mine.clone()
+        mine.append(3)
+        assert clone.all() == [1, 2]
+        assert mine.all() == [1, 2, 3]
+
+
+class TestMixinComposition:
+    def test_storage_defaults(self):
+        """Test that _own_items() works on a class that only sets _items."""
+        items = [1]
+        stored = Stored(items)
+        stored._own_items().append(2)
+        assert stored._version == 1
+        assert stored._items is items
+
+        stored._shared = True
+        stored._own_items().append(3)
+        assert stored._items == [1, 2, 3]
+        assert items == [1, 2]
+
+    def test_collection_from_mixins_alone(self):
+        """Test the custom collection pattern from the architecture docs."""
+        custom = Custom([3, 1, 2])
+        custom.append(4)
+        custom.extend([5, 1])
+        assert custom.after(1) == 2
+        assert custom.before(lambda x: x > 3) == 2
+        custom.remove_one(1)
+        custom.remove(lambda x: x > 4)
+        assert custom.all() == [3, 2, 4, 1]
+        custom.sort_inplace()
+        assert custom.all() == [1, 2, 3, 4]
+        assert custom.first() == 1
+
+    def test_read_only_pattern(self):
+        """Test a read-only collection composed without removal operations."""
+        numbers = ReadOnly([1, 2, 3, 4])
+        assert numbers.after(2) == 3
+        assert numbers.filter(lambda x: x % 2).all() == [1, 3]
+        assert numbers.to_dict() == [1, 2, 3, 4]
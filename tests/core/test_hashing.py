@@ -0,0 +1,129 @@
+"""Tests for canonical structural keys."""
+
+import gc
+from dataclasses import dataclass
+
+import pytest
+
+from py_collections import Collection
+from py_collections.hashing import BloomFilter, canonical_key
+
+
+@dataclass
+class Point:
+    x: int
+    y: list[int]
+
+
+class Tag:
+    def __init__(self, name):
+        self.name = name
+
+    __hash__ = None
+
+    def __eq__(self, other):
+        return isinstance(other, Tag) and self.name == other.name
+
+
+class TestCanonicalKey:
+    def test_hashable_values_are_returned_unchanged(self):
+        """Hashable non-container values are their own key."""
+        marker = object()
+        for value in (1, "a", None, 2.5, marker):
+            assert canonical_key(value) is value
+
+    def test_containers_are_frozen_consistently(self):
+        """Hashable and unhashable containers with equal contents share a key."""
+        assert canonical_key((1, "b")) == canonical_key((1.0, "b"))
+        assert canonical_key(frozenset({1})) == canonical_key({1})
+
+    def test_hashable_keys_keep_python_equality(self):
+        """Keys of hashable values compare like the values themselves."""
+        assert canonical_key(1) == canonical_key(1.0) == canonical_key(True)
+
+    def test_dicts_ignore_key_order(self):
+        """Dictionaries with the same items in any order share a key."""
+        first = {"a": 1, "b": {"c": [1, 2], "d": None}}
+        second = {"b": {"d": None, "c": [1, 2]}, "a": 1}
+        assert canonical_key(first) == canonical_key(second)
+        assert hash(canonical_key(first)) == hash(canonical_key(second))
+
+    def test_different_structures_differ(self):
+        """Different values, or the same values in different containers, differ."""
+        assert canonical_key([1, 2]) != canonical_key([2, 1])
+        assert canonical_key([1, 2]) != canonical_key((1, 2))
+        assert canonical_key({"a": 1}) != canonical_key({"a": 2})
+        assert canonical_key({"a": 1}) != canonical_key([("a", 1)])
+
+    def test_nested_lists_and_tuples(self):
+        """Tuples holding unhashable values are frozen recursively."""
+        assert canonical_key(([1], {"a": 2})) == canonical_key(([1], {"a": 2}))
+        assert canonical_key(([1],)) != canonical_key(([2],))
+
+    def test_sets(self):
+        """Sets are keyed by their contents and differ from lists and dicts."""
+        assert canonical_key({1, 2}) == canonical_key(frozenset({2, 1}))
+        assert canonical_key({1, 2}) != canonical_key([1, 2])
+        assert canonical_key({("a", 1)}) != canonical_key({"a": 1})
+
+    def test_unhashable_dataclasses(self):
+        """Unhashable dataclasses are keyed by type and fields."""
+        assert canonical_key(Point(1, [2])) == canonical_key(Point(1, [2]))
+        assert canonical_key(Point(1, [2])) != canonical_key(Point(1, [3]))
+
+    def test_unhashable_objects(self):
+        """Other unhashable objects are keyed by type and attributes."""
+        assert canonical_key(Tag("x")) == canonical_key(Tag("x"))
+        assert canonical_key(Tag("x")) != canonical_key(Tag("y"))
+        assert canonical_key(Tag("x")) != canonical_key({"name": "x"})
+
+    def test_garbage_collector_stays_enabled(self):
+        """Finding duplicates of unhashable values leaves the GC running."""
+
+        class Probe(Tag):
+            def __getattribute__(self, name):
+                states.append(gc.isenabled())
+                return super().__getattribute__(name)
+
+        states = []
+        Collection([[Probe("a")], [Probe("a")]]).find_duplicates()
+        assert states
+        assert all(states)
+        assert gc.isenabled()
+
+
+class TestBloomFilter:
+    def test_added_keys_are_present(self):
+        """Keys that were added are always reported as present."""
+        bloom = BloomFilter(1000)
+        for key in range(1000):
+            bloom.add(key)
+        assert all(key in bloom for key in range(1000))
+        assert all(bloom.add(key) for key in range(1000))
+
+    @pytest.mark.parametrize("error_rate", [0.05, 0.01, 0.001])
+    def test_false_positive_rate(self, error_rate):
+        """The false positive rate at full capacity stays near the target."""
+        bloom = BloomFilter(20_000, error_rate)
+        for key in range(20_000):
+            bloom.add(f"key-{key}")
+        false_positives = sum(f"other-{key}" in bloom for key in range(20_000))
+        assert false_positives / 20_000 <= error_rate * 1.5
+
+    def test_size_depends_on_parameters_only(self):
+        """Memory grows with the capacity and the precision, not the keys."""
+        small = BloomFilter(10_000, 0.01)
+        assert small.nbytes < 10_000 * 2
+        assert BloomFilter(10_000, 0.001).nbytes > small.nbytes
+        for key in range(50_000):
+            small.add(key)
+        assert small.nbytes < 10_000 * 2
+
+    @pytest.mark.parametrize(
+        ("capacity", "error_rate"),
+        [(0, 0.01), (-1, 0.01), (1.5, 0.01), (10, 0), (10, 1)],
+    )
+    def test_invalid_parameters(self, capacity, error_rate):
+        """Out of range parameters raise ValueError."""
+        with pytest.raises(ValueError):
+            BloomFilter(capacity, error_rate)
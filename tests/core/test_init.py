@@ -41,3 +41,55 @@ class TestCollectionInit:
         collection = Collection(complex_items)
         assert len(collection) == 4
         assert collection.all() == complex_items
+
+    def test_init_copies_by_default(self):
+        """Test that the constructor copies the given list by default."""
+        items = [1, 2, 3]
+        collection = Collection(items)
+        items.append(4)
+        assert collection.all() == [1, 2, 3]
+
+    def test_init_without_copy(self):
+        """Test that copy=False adopts the given list as backing storage."""
+        items = [1, 2, 3]
+        collection = Collection(items, copy=False)
+        assert collection._items is items
+
+    def test_init_without_copy_and_none(self):
+        """Test that copy=False with no items still creates an empty collection."""
+        collection = Collection(None, copy=False)
+        assert collection.all() == []
+
+    def test_from_list_does_not_copy(self):
+        """Test that the internal constructor wraps the list as-is."""
+        items = [1, 2, 3]
+        collection = Collection._from_list(items)
+        assert collection._items is items
+        assert isinstance(collection, Collection)
+
+    def test_derived_collections_own_their_items(self):
+        """Test that results of transformations never share storage with the source."""
+        collection = Collection([1, 2, 3])
+        results = [
+            collection.map(lambda x: x),
+            collection.filter(lambda x: True),
+            collection.reverse(),
+            collection.take(3),
+            collection + Collection(),
+        ]
+        for result in results:
+            assert result._items is not collection._items
+
+    def test_clone_copies_on_write(self):
+        """Test that a clone shares storage only until either side is modified."""
+        collection = Collection([1, 2, 3])
+        clone = collection.clone()
+        assert clone._items is collection._items
+
+        clone.append(4)
+        assert clone._items is not collection._items
+        assert collection.all() == [1, 2, 3]
+
+        collection.remove_one(1)
+        assert collection.all() == [2, 3]
+        assert clone.all() == [1, 2, 3, 4]
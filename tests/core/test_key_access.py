@@ -0,0 +1,126 @@
+import pytest
+
+from py_collections import Collection
+from py_collections.key_access import compile_key, resolve_key
+
+
+class Address:
+    def __init__(self, city):
+        self.city = city
+
+
+class User:
+    def __init__(self, name, address=None):
+        self.name = name
+        self.address = address
+
+
+class TestCompileKey:
+    """Test cases for the shared key accessor compiler."""
+
+    def test_single_key_dict_and_object(self):
+        """Test reading a top-level key from dicts and objects."""
+        get_name = compile_key("name")
+        assert get_name({"name": "Alice"}) == "Alice"
+        assert get_name(User("Bob")) == "Bob"
+
+    def test_dotted_path_mixed_types(self):
+        """Test reading a nested path across dicts and objects."""
+        get_city = compile_key("address.city")
+        assert get_city({"address": {"city": "NYC"}}) == "NYC"
+        assert get_city(User("Alice", Address("LA"))) == "LA"
+        assert get_city({"address": Address("SF")}) == "SF"
+
+    def test_lenient_missing_returns_none(self):
+        """Test that the lenient accessor returns None for missing levels."""
+        get_city = compile_key("address.city")
+        assert get_city({}) is None
+        assert get_city({"address": None}) is None
+        assert get_city(User("Alice")) is None
+        assert get_city(42) is None
+
+    def test_strict_missing_dict_key(self):
+        """Test that the strict accessor raises KeyError for missing dict keys."""
+        with pytest.raises(KeyError, match="Key 'price' not found in item"):
+            compile_key("price", strict=True)({"cost": 1})
+
+    def test_strict_missing_attribute(self):
+        """Test that the strict accessor raises AttributeError for missing attributes."""
+        with pytest.raises(AttributeError, match="has no attribute 'age'"):
+            compile_key("age", strict=True)(User("Alice"))
+
+    def test_strict_dotted_path(self):
+        """Test strict nested access."""
+        get_city = compile_key("address.city", strict=True)
+        assert get_city({"address": {"city": "NYC"}}) == "NYC"
+        with pytest.raises(KeyError, match="Key 'city' not found"):
+            get_city({"address": {}})
+
+    def test_accessors_are_memoized(self):
+        """Test that compiling the same key twice reuses the accessor."""
+        assert compile_key("a.b") is compile_key("a.b")
+        assert compile_key("a.b") is not compile_key("a.b", strict=True)
+
+
+class TestResolveKey:
+    """Test cases for resolve_key."""
+
+    def test_none_returns_identity(self):
+        """Test that None resolves to the item itself."""
+        assert resolve_key(None)(5) == 5
+
+    def test_callable_is_returned_as_is(self):
+        """Test that callables are passed through."""
+        func = len
+        assert resolve_key(func) is func
+
+    def test_invalid_argument(self):
+        """Test that unsupported arguments raise TypeError."""
+        with pytest.raises(TypeError, match="Argument must be None"):
+            resolve_key(42)
+
+
+class TestDottedPathsInMixins:
+    """Test that mixins accepting key strings share dot notation support."""
+
+    def test_sum_and_average_nested(self):
+        """Test summing and averaging a nested key."""
+        orders = Collection([{"amount": {"net": 10}}, {"amount": {"net": 30}}])
+        assert orders.sum("amount.net") == 40
+        assert orders.average("amount.net") == 20.0
+
+    def test_group_by_nested(self):
+        """Test grouping by a nested key."""
+        users = Collection(
+            [
+                {"name": "Alice", "address": {"city": "NYC"}},
+                {"name": "Bob", "address": {"city": "LA"}},
+                {"name": "Carol", "address": {"city": "NYC"}},
+            ]
+        )
+        grouped = users.group_by("address.city")
+        assert grouped["NYC"].pluck("name").all() == ["Alice", "Carol"]
+
+    def test_find_duplicates_nested(self):
+        """Test finding duplicates and uniques by a nested key."""
+        rows = Collection([{"a": {"b": 1}}, {"a": {"b": 2}}, {"a": {"b": 1}}])
+        assert rows.find_duplicates("a.b").all() == [{"a": {"b": 1}}]
+        assert rows.find_uniques("a.b").all() == [{"a": {"b": 2}}]
+
+    def test_flat_keys_containing_dots(self):
+        """Test that a flat key containing a dot is read literally first."""
+        rows = Collection([{"a.b": 1}, {"a.b": 2}, {"a.b": 1}])
+        assert rows.sum("a.b") == 4
+        assert rows.average("a.b") == 4 / 3
+        assert list(rows.group_by("a.b")) == [1, 2]
+        assert rows.find_duplicates("a.b").all() == [{"a.b": 1}]
+        assert rows.find_uniques("a.b").all() == [{"a.b": 2}]
+        assert rows.pluck("a.b").all() == [1, 2, 1]
+
+    def test_literal_key_takes_precedence_over_path(self):
+        """Test that the path is only followed when the literal key misses."""
+        get_value = compile_key("a.b", strict=True)
+        assert get_value({"a.b": 1, "a": {"b": 2}}) == 1
+        assert get_value({"a": {"b": 2}}) == 2
+        with pytest.raises(KeyError, match="Key 'a' not found"):
+            get_value({"c": 1})
@@ -0,0 +1,208 @@
+"""Tests for the opt-in profiling instrumentation."""
+
+import asyncio
+import threading
+
+import pytest
+
+from py_collections import Collection, CollectionMap, profiling
+
+
+@pytest.fixture(autouse=True)
+def _disable_profiling():
+    """Make sure no test leaves profiling enabled."""
+    yield
+    profiling.disable()
+
+
+class TestEnableDisable:
+    def test_disabled_by_default(self):
+        """Methods are the mixins' own functions while profiling is off."""
+        assert not profiling.is_enabled()
+        assert profiling.active() is None
+        assert "group_by" not in Collection.__dict__
+
+    def test_enable_wraps_and_disable_restores(self):
+        """Enabling installs wrappers that disabling removes again."""
+        original_map = CollectionMap.__dict__["flatten"]
+        profiler = profiling.enable()
+
+        assert profiling.is_enabled()
+        assert profiling.active() is profiler
+        assert "group_by" in Collection.__dict__
+        assert CollectionMap.__dict__["flatten"] is not original_map
+
+        assert profiling.disable() is profiler
+        assert not profiling.is_enabled()
+        assert "group_by" not in Collection.__dict__
+        assert CollectionMap.__dict__["flatten"] is original_map
+
+    def test_enable_twice_raises(self):
+        """Only one profiler can be active at a time."""
+        profiling.enable()
+        with pytest.raises(RuntimeError, match="already enabled"):
+            profiling.enable()
+
+    def test_disable_when_not_enabled(self):
+        """Disabling without enabling is a no-op."""
+        assert profiling.disable() is None
+
+    def test_context_manager(self):
+        """profile() enables for the with block only."""
+        with profiling.profile() as profiler:
+            assert profiling.active() is profiler
+            Collection([1, 2]).sum()
+        assert not profiling.is_enabled()
+        assert profiler.report()["Collection.sum"]["calls"] == 1
+
+    def test_behavior_unchanged(self):
+        """Wrapped methods return the same results and keep their metadata."""
+        items = [{"a": 1}, {"a": 2}, {"a": 1}]
+        expected = Collection(items).group_by("a")
+        with profiling.profile():
+            assert Collection(items).group_by("a") == expected
+            assert Collection.group_by.__name__ == "group_by"
+            assert Collection.group_by.__doc__
+
+
+class TestRecording:
+    def test_counts_time_and_items(self):
+        """Calls, time and the size of the collection are accumulated."""
+        collection = Collection(list(range(10)))
+        with profiling.profile() as profiler:
+            collection.sum()
+            collection.sum()
+            collection.filter(lambda x: x > 5)
+
+        report = profiler.report()
+        assert report["Collection.sum"]["calls"] == 2
+        assert report["Collection.sum"]["items"] == 20
+        assert report["Collection.sum"]["seconds"] >= 0
+        assert report["Collection.filter"]["items"] == 10
+        assert report["Collection.sum"]["bytes"] == 0
+
+    def test_nested_calls_are_recorded(self):
+        """Methods called by other methods are recorded too."""
+        with profiling.profile() as profiler:
+            Collection([{"a": 1}]).to_json()
+
+        report = profiler.report()
+        assert report["Collection.to_json"]["calls"] == 1
+        assert report["Collection.to_dict"]["calls"] == 1
+
+    def test_classmethods_count_result_items(self):
+        """Constructors record the size of the collection they build."""
+        with profiling.profile() as profiler:
+            collection = Collection.from_iterable(range(7))
+
+        assert isinstance(collection, Collection)
+        assert profiler.report()["Collection.from_iterable"]["items"] == 7
+
+    def test_collection_map_items(self):
+        """CollectionMap methods count the items across all groups."""
+        groups = CollectionMap(Collection([1, 2, 3, 4]).group_by(lambda x: x % 2))
+        with profiling.profile() as profiler:
+            groups.flatten()
+
+        assert profiler.report()["CollectionMap.flatten"]["items"] == 4
+
+    def test_exceptions_are_recorded_and_propagated(self):
+        """A failing call still counts and its exception is raised."""
+        with profiling.profile() as profiler, pytest.raises(KeyError):
+            Collection([{"a": 1}]).sum("missing")
+
+        assert profiler.report()["Collection.sum"]["calls"] == 1
+
+    def test_coroutine_methods(self):
+        """Async methods are awaited and timed."""
+
+        async def double(x):
+            return x * 2
+
+        with profiling.profile() as profiler:
+            result = asyncio.run(Collection([1, 2]).amap(double))
+
+        assert result.all() == [2, 4]
+        assert profiler.report()["Collection.amap"]["calls"] == 1
+
+    def test_track_memory(self):
+        """Memory tracking records the bytes allocated by each call."""
+        collection = Collection(list(range(10_000)))
+        with profiling.profile(track_memory=True) as profiler:
+            collection.map(lambda x: [x])
+
+        assert profiler.report()["Collection.map"]["bytes"] > 10_000 * 56
+
+    def test_track_memory_nested_calls(self):
+        """The outer call's allocations include those of nested calls."""
+        collection = Collection([{"a": i} for i in range(1_000)])
+        with profiling.profile(track_memory=True) as profiler:
+            collection.to_json()
+
+        report = profiler.report()
+        assert (
+            report["Collection.to_json"]["bytes"]
+            >= report["Collection.to_dict"]["bytes"]
+        )
+
+    def test_threads(self):
+        """Calls from several threads are all counted."""
+        collection = Collection(list(range(100)))
+        with profiling.profile() as profiler:
+            threads = [
+                threading.Thread(target=lambda: [collection.sum() for _ in range(50)])
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert profiler.report()["Collection.sum"]["calls"] == 200
+
+    def test_reset(self):
+        """reset() clears the recorded totals."""
+        with profiling.profile() as profiler:
+            Collection([1]).sum()
+            profiler.reset()
+            Collection([1]).first()
+
+        assert list(profiler.report()) == ["Collection.first"]
+
+
+class TestExport:
+    def test_report_is_sorted_by_time(self):
+        """The report lists the slowest methods first."""
+        profiler = profiling.Profiler()
+        profiler.record("Collection.fast", 0.1, 1, 0)
+        profiler.record("Collection.slow", 0.5, 1, 0)
+
+        assert list(profiler.report()) == ["Collection.slow", "Collection.fast"]
+        assert profiler.report()["Collection.fast"] == {
+            "calls": 1,
+            "seconds": 0.1,
+            "items": 1,
+            "bytes": 0,
+        }
+
+    def test_prometheus(self):
+        """The Prometheus export has one counter family per measurement."""
+        profiler = profiling.Profiler()
+        profiler.record("Collection.group_by", 0.25, 100, 0)
+        profiler.record("Collection.group_by", 0.25, 50, 0)
+
+        text = profiler.to_prometheus()
+        assert "# TYPE py_collections_calls_total counter" in text
+        assert 'py_collections_calls_total{method="Collection.group_by"} 2' in text
+        assert 'py_collections_seconds_total{method="Collection.group_by"} 0.5' in text
+        assert 'py_collections_items_total{method="Collection.group_by"} 150' in text
+        assert "allocated_bytes" not in text
+        assert text.endswith("\n")
+
+    def test_prometheus_with_memory_and_prefix(self):
+        """Bytes are exported when tracked, under the given prefix."""
+        profiler = profiling.Profiler(track_memory=True)
+        profiler.record("Collection.map", 0.1, 10, 2048)
+
+        text = profiler.to_prometheus(prefix="app")
+        assert 'app_allocated_bytes_total{method="Collection.map"} 2048' in text
@@ -0,0 +1,61 @@
+"""Tests for the cached per-type serializer."""
+
+import datetime as dt
+from dataclasses import dataclass
+
+from py_collections import Collection, serialization
+from py_collections.serialization import Converter, to_plain
+
+
+class TestConverter:
+    def test_primitives_are_returned_as_is(self):
+        """Test that primitive values are passed through unchanged."""
+        assert to_plain([1, 2.5, True, None, "x"]) == [1, 2.5, True, None, "x"]
+
+    def test_primitive_subclasses_are_returned_as_is(self):
+        """Test that subclasses of primitive types are not converted."""
+
+        class Label(str):
+            pass
+
+        label = Label("a")
+        assert to_plain([label])[0] is label
+
+    def test_strategy_is_cached_per_type(self):
+        """Test that the strategy of a type is resolved once and reused."""
+
+        @dataclass
+        class Point:
+            x: int
+            y: int
+
+        to_plain([Point(1, 2)])
+        strategy = serialization._strategies[(Point, False)]
+        assert to_plain([Point(3, 4)]) == [{"x": 3, "y": 4}]
+        assert serialization._strategies[(Point, False)] is strategy
+
+    def test_modes_are_cached_separately(self):
+        """Test that JSON mode and plain mode do not share strategies."""
+        value = dt.datetime(2020, 1, 2, 3, 4, 5)
+        assert to_plain([value]) == ["2020-01-02 03:04:05"]
+        assert to_plain([value], json_mode=True) == ["2020-01-02T03:04:05"]
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """Test that the dispatch table is cleared once it grows too large."""
+        monkeypatch.setattr(serialization, "_MAX_CACHED_TYPES", 2)
+        serialization._strategies.clear()
+
+        to_plain([[1], (2,), {3}])
+        assert len(serialization._strategies) <= 2
+
+    def test_shared_value_is_not_circular(self):
+        """Test that a value referenced twice (without a cycle) is converted twice."""
+        shared = {"a": 1}
+        assert to_plain([[shared, shared]]) == [[{"a": 1}, {"a": 1}]]
+
+    def test_converter_can_be_reused(self):
+        """Test that one converter can convert several values in turn."""
+        converter = Converter(json_mode=True)
+        assert converter.convert({1: "one"}) == {"1": "one"}
+        assert converter.convert(Collection([{2: "two"}])) == [{"2": "two"}]
+        assert converter.active == set()
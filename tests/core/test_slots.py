@@ -0,0 +1,134 @@
+"""Tests for the __slots__ layout of the collection classes."""
+
+import copy
+import pickle
+import weakref
+
+import pytest
+
+from py_collections import (
+    Collection,
+    CollectionMap,
+    CollectionView,
+    ColumnarCollection,
+    LazyCollection,
+    SortedCollection,
+)
+from py_collections.mixins import (
+    BasicOperationsMixin,
+    ConcurrencyMixin,
+    ElementAccessMixin,
+    GroupingMixin,
+    IndexingMixin,
+    IngestionMixin,
+    MathOperationsMixin,
+    NavigationMixin,
+    RemovalMixin,
+    SortingMixin,
+    StorageMixin,
+    TransformationMixin,
+    UtilityMixin,
+)
+
+
+class TestSlots:
+    @pytest.mark.parametrize(
+        "mixin",
+        [
+            BasicOperationsMixin,
+            ConcurrencyMixin,
+            ElementAccessMixin,
+            GroupingMixin,
+            IndexingMixin,
+            IngestionMixin,
+            MathOperationsMixin,
+            NavigationMixin,
+            RemovalMixin,
+            SortingMixin,
+            StorageMixin,
+            TransformationMixin,
+            UtilityMixin,
+        ],
+    )
+    def test_mixins_declare_empty_slots(self, mixin):
+        """Test that every mixin declares empty __slots__."""
+        assert mixin.__dict__["__slots__"] == ()
+
+    @pytest.mark.parametrize(
+        "instance",
+        [
+            Collection([1, 2]),
+            Collection._from_list([1, 2]),
+            CollectionMap({"a": [1]}),
+            LazyCollection([1]),
+            ColumnarCollection([{"a": 1}]),
+            SortedCollection([2, 1]),
+            Collection([1, 2]).view(),
+        ],
+        ids=[
+            "collection",
+            "from_list",
+            "collection_map",
+            "lazy",
+            "columnar",
+            "sorted",
+            "view",
+        ],
+    )
+    def test_instances_have_no_dict(self, instance):
+        """Test that instances have no per-instance __dict__."""
+        assert not hasattr(instance, "__dict__")
+        with pytest.raises(AttributeError):
+            instance.unexpected = 1
+
+    def test_groups_have_no_dict(self):
+        """Test that collections created by group_by and chunk are slotted too."""
+        collection = Collection([1, 2, 3])
+        for group in [*collection.group_by().values(), *collection.chunk(2)]:
+            assert not hasattr(group, "__dict__")
+
+    def test_weak_references(self):
+        """Test that collections can still be weakly referenced."""
+        collection = Collection([1])
+        assert weakref.ref(collection)() is collection
+        collection_map = CollectionMap()
+        assert weakref.ref(collection_map)() is collection_map
+
+    def test_pickle_and_copy(self):
+        """Test that slotted collections can be pickled and copied."""
+        indexed = Collection([1, (2, 3)]).index_by()
+        restored = pickle.loads(pickle.dumps(indexed))
+        assert restored == indexed
+        assert restored.lookup((2, 3)).all() == [(2, 3)]
+
+        rows = Collection([{"id": 1}, {"id": 2, "tag": "x"}]).index_by("id")
+        restored = pickle.loads(pickle.dumps(rows))
+        assert restored.lookup(2).all() == [{"id": 2, "tag": "x"}]
+        restored.append({"id": 3})
+        assert {"id": 3} in restored
+        assert copy.deepcopy(rows).lookup(1).all() == [{"id": 1}]
+
+        collection = Collection([1, [2, 3]])
+        duplicate = copy.deepcopy(collection)
+        assert duplicate == collection
+        assert duplicate.all()[1] is not collection.all()[1]
+
+        collection_map = CollectionMap({"a": [1]})
+        assert pickle.loads(pickle.dumps(collection_map))["a"].all() == [1]
+
+    def test_subclass_can_add_attributes(self):
+        """Test that subclasses without __slots__ can still add attributes."""
+
+        class Tagged(Collection):
+            pass
+
+        tagged = Tagged([1])
+        tagged.tag = "x"
+        assert tagged.tag == "x"
+        assert tagged.all() == [1]
+
+    def test_collection_map_inside_to_dict(self):
+        """Test that a nested CollectionMap is converted to a dict of lists."""
+        nested = Collection([CollectionMap({"a": [1, 2]})])
+        assert nested.to_dict() == [{"a": [1, 2]}]
+        assert nested.to_dict(mode="json") == [{"a": [1, 2]}]
@@ -0,0 +1,234 @@
+import json
+import tracemalloc
+
+import pytest
+
+from py_collections import Collection, LazyCollection
+
+
+class TestLazyCollection:
+    """Test cases for the lazy pipeline returned by Collection.lazy()."""
+
+    def test_lazy_returns_lazy_collection(self):
+        """Test that lazy() returns a LazyCollection without running anything."""
+        calls = []
+        collection = Collection([1, 2, 3])
+
+        pipeline = collection.lazy().map(lambda x: calls.append(x) or x)
+
+        assert isinstance(pipeline, LazyCollection)
+        assert calls == []
+
+    def test_chain_matches_eager_result(self):
+        """Test that a fused chain produces the same result as eager calls."""
+        users = Collection(
+            [
+                {"name": "Alice", "age": 25, "address": {"city": "NYC"}},
+                {"name": "Bob", "age": 17, "address": {"city": "LA"}},
+                {"name": "Carol", "age": 40, "address": {"city": "SF"}},
+            ]
+        )
+
+        eager = users.filter(lambda u: u["age"] >= 18).pluck("address.city").take(1)
+        lazy = users.lazy().filter(lambda u: u["age"] >= 18).pluck("address.city")
+
+        assert lazy.take(1).all() == eager.all() == ["NYC"]
+
+    def test_take_short_circuits(self):
+        """Test that take() stops reading the source once satisfied."""
+        seen = []
+
+        def record(x):
+            seen.append(x)
+            return x
+
+        collection = Collection(list(range(100)))
+        result = collection.lazy().map(record).filter(lambda x: x % 2 == 0).take(3)
+
+        assert result.all() == [0, 2, 4]
+        assert seen == [0, 1, 2, 3, 4]
+
+    def test_negative_take(self):
+        """Test that a negative take keeps the last items."""
+        collection = Collection([1, 2, 3, 4, 5])
+        assert collection.lazy().map(lambda x: x * 10).take(-2).all() == [40, 50]
+
+    def test_pluck_with_value_key(self):
+        """Test pluck with a value key inside a pipeline."""
+        users = Collection([{"name": "Alice", "age": 25}, {"name": "Bob", "age": 30}])
+        assert users.lazy().pluck("name", "age").all() == [{"Alice": 25}, {"Bob": 30}]
+
+    def test_pipeline_is_reusable(self):
+        """Test that chaining does not modify the original pipeline."""
+        base = Collection([1, 2, 3, 4]).lazy().filter(lambda x: x > 1)
+
+        doubled = base.map(lambda x: x * 2)
+
+        assert base.all() == [2, 3, 4]
+        assert doubled.all() == [4, 6, 8]
+        assert base.all() == [2, 3, 4]
+
+    def test_collect_returns_collection(self):
+        """Test that collect() wraps the results in a Collection."""
+        result = Collection([1, 2, 3]).lazy().map(str).collect()
+        assert isinstance(result, Collection)
+        assert result.all() == ["1", "2", "3"]
+
+    def test_iteration(self):
+        """Test iterating over a pipeline."""
+        pipeline = Collection([1, 2, 3]).lazy().map(lambda x: x + 1)
+        assert list(pipeline) == [2, 3, 4]
+
+    def test_first(self):
+        """Test first() with and without a predicate."""
+        pipeline = Collection([1, 2, 3, 4]).lazy().map(lambda x: x * 3)
+        assert pipeline.first() == 3
+        assert pipeline.first(lambda x: x > 5) == 6
+        assert pipeline.first(lambda x: x > 100) is None
+
+    def test_first_short_circuits(self):
+        """Test that first() does not run the pipeline past the first result."""
+        seen = []
+        collection = Collection([1, 2, 3])
+        collection.lazy().map(lambda x: seen.append(x) or x).first()
+        assert seen == [1]
+
+    def test_exists(self):
+        """Test exists() with and without a predicate."""
+        pipeline = Collection([1, 2, 3]).lazy().filter(lambda x: x > 1)
+        assert pipeline.exists() is True
+        assert pipeline.exists(lambda x: x == 3) is True
+        assert pipeline.filter(lambda x: x > 3).exists() is False
+
+    def test_sum_and_average(self):
+        """Test numeric terminal operations."""
+        orders = Collection([{"price": 10}, {"price": 20}, {"price": 30}])
+        assert orders.lazy().pluck("price").sum() == 60
+        assert orders.lazy().take(2).average("price") == 15.0
+
+    def test_sum_errors_match_collection(self):
+        """Test that terminal operations raise the same errors as Collection."""
+        with pytest.raises(ValueError, match="No numeric values"):
+            Collection(["a", "b"]).lazy().sum()
+
+    @pytest.mark.parametrize(
+        "items,argument",
+        [
+            ([1, 2.5, 3], None),
+            ([1, "a", None, 4], None),
+            (["a", "b"], None),
+            ([], None),
+            ([{"p": 1}, {"p": 2}], "p"),
+            ([{"p": 1}, {"p": "x"}], "p"),
+            ([{"p": 1}, {"q": 2}], "p"),
+            ([], "p"),
+            ([1, 2], lambda x: x / 3),
+            ([1, 2], str),
+            ([1], 5),
+        ],
+    )
+    def test_numeric_terminals_match_collection(self, items, argument):
+        """Test that sum() and average() give Collection's results and errors."""
+        for method in ("sum", "average"):
+            try:
+                expected = getattr(Collection(items), method)(argument)
+            except Exception as error:
+                with pytest.raises(type(error), match=str(error)):
+                    getattr(LazyCollection(items), method)(argument)
+            else:
+                assert getattr(LazyCollection(items), method)(argument) == expected
+
+    def test_terminals_do_not_collect_results(self):
+        """Test that sum, average and to_json stream a large generator."""
+
+        def rows():
+            return ({"price": i * 0.5, "name": f"item-{i}"} for i in range(100_000))
+
+        def peak_memory(run):
+            tracemalloc.start()
+            try:
+                run()
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        # A collected list of 100k results alone would take over 800 KB
+        assert (
+            peak_memory(lambda: LazyCollection(rows()).pluck("price").sum()) < 100_000
+        )
+        assert peak_memory(lambda: LazyCollection(rows()).average("price")) < 100_000
+        assert peak_memory(
+            lambda: LazyCollection(rows()).pluck("price").to_json()
+        ) < peak_memory(
+            lambda: LazyCollection(rows()).pluck("price").collect().to_json()
+        )
+
+    def test_to_json_matches_collection(self):
+        """Test that the chunked to_json() gives the same text as Collection."""
+        rows = [{"id": i, "tags": {"a"}} for i in range(2_500)]
+        assert LazyCollection(rows).to_json() == Collection(rows).to_json()
+        assert LazyCollection([]).to_json() == "[]"
+        assert LazyCollection(iter(rows)).to_dict(mode="json") == Collection(
+            rows
+        ).to_dict(mode="json")
+
+    def test_to_dict_and_to_json(self):
+        """Test serialization terminal operations."""
+        pipeline = Collection([{"a": 1}, {"a": 2}]).lazy().filter(lambda d: d["a"] > 1)
+        assert pipeline.to_dict() == [{"a": 2}]
+        assert json.loads(pipeline.to_json()) == [{"a": 2}]
+
+    def test_empty_collection(self):
+        """Test a pipeline over an empty collection."""
+        pipeline = Collection().lazy().map(lambda x: x * 2).take(5)
+        assert pipeline.all() == []
+        assert pipeline.first() is None
+
+    def test_reads_from_generator(self):
+        """Test that a LazyCollection can read from any iterable."""
+        pipeline = LazyCollection(x * x for x in range(10)).take(3)
+        assert pipeline.all() == [0, 1, 4]
+
+    def test_distinct(self):
+        """Test that distinct keeps first occurrences while streaming."""
+        seen = []
+        source = (seen.append(i) or i % 3 for i in range(100))
+        pipeline = LazyCollection(source).distinct().take(3)
+
+        assert pipeline.all() == [0, 1, 2]
+        assert len(seen) == 3
+
+    def test_distinct_with_key_matches_collection(self):
+        """Test that a distinct step gives the same result as Collection.distinct."""
+        rows = Collection([{"id": i % 4, "tags": [i % 2]} for i in range(20)])
+        assert rows.lazy().distinct("id").all() == rows.distinct("id").all()
+        assert rows.lazy().distinct("tags").all() == rows.distinct("tags").all()
+
+    def test_distinct_approximate(self):
+        """Test a bounded-memory distinct step over a generator."""
+        pipeline = LazyCollection(i % 50 for i in range(1000)).distinct(
+            approximate=True, capacity=50, error_rate=0.001
+        )
+        values = pipeline.all()
+        assert len(values) == len(set(values))
+        assert len(values) >= 48
+
+    def test_distinct_approximate_requires_capacity(self):
+        """Test that approximate distinct without a capacity fails immediately."""
+        with pytest.raises(ValueError, match="requires a capacity"):
+            LazyCollection([1]).distinct(approximate=True)
+        with pytest.raises(ValueError, match="Error rate"):
+            LazyCollection([1]).distinct(approximate=True, capacity=5, error_rate=2)
+
+    def test_top_k_and_bottom_k_over_generator(self):
+        """Test ranking a generator through the top_k and bottom_k terminals."""
+        rows = ({"id": i, "score": (i * 7) % 10} for i in range(10))
+        top = LazyCollection(rows).filter(lambda r: r["id"] > 0).top_k(3, "score")
+        assert top.pluck("score").all() == [9, 8, 7]
+        assert LazyCollection(iter(range(10, 0, -1))).bottom_k(2).all() == [1, 2]
+
+    def test_str(self):
+        """Test the string representation lists the recorded steps."""
+        pipeline = Collection([1]).lazy().map(str).take(1)
+        assert str(pipeline) == "LazyCollection(steps=[map, take])"
+        assert repr(pipeline) == str(pipeline)
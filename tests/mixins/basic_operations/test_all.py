@@ -1,3 +1,7 @@
+from collections.abc import Sequence
+
+import pytest
+
 from py_collections.collection import Collection
 
 
@@ -85,3 +89,27 @@ class TestCollectionAll:
 
         assert all_items == [None, "hello", None, 42]
         assert len(all_items) == 4
+
+    def test_all_without_copy(self):
+        """Test that all(copy=False) returns a read-only sequence without copying."""
+        item = {"id": 1}
+        collection = Collection([item, {"id": 2}])
+        items = collection.all(copy=False)
+
+        assert isinstance(items, Sequence)
+        assert items == [item, {"id": 2}]
+        assert items[0] is item
+        assert items[-1] == {"id": 2}
+        assert items[:1] == [item]
+        assert len(items) == 2
+        assert item in items
+        assert list(reversed(items)) == [{"id": 2}, item]
+        assert not hasattr(items, "append")
+
+    def test_all_without_copy_detects_changes(self):
+        """Test that the sequence cannot be used after the collection changes."""
+        collection = Collection([1, 2])
+        items = collection.all(copy=False)
+        collection.append(3)
+        with pytest.raises(RuntimeError, match="modified"):
+            list(items)
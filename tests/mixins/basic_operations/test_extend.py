@@ -67,3 +67,25 @@ class TestExtend:
         collection = Collection([1, 2])
         collection.extend([None, 3])
         assert collection.all() == [1, 2, None, 3]
+
+    def test_extend_with_own_view(self):
+        """Test extending a collection with a view or window of itself."""
+        collection = Collection([1, 2, 3])
+        collection.extend(collection.view(0, 2))
+        assert collection.all() == [1, 2, 3, 1, 2]
+        collection.extend(collection.all(copy=False))
+        assert collection.all() == [1, 2, 3, 1, 2, 1, 2, 3, 1, 2]
+
+    def test_failed_extend_leaves_views_valid(self):
+        """Test that an extend that fails while reading its items changes nothing."""
+
+        def failing():
+            yield 4
+            raise ValueError("source failed")
+
+        collection = Collection([1, 2, 3])
+        view = collection.view()
+        with pytest.raises(ValueError, match="source failed"):
+            collection.extend(failing())
+        assert collection.all() == [1, 2, 3]
+        assert view.all() == [1, 2, 3]
@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+
+from py_collections import Collection
+
+
+class ConcurrencyTracker:
+    """Async callable wrapper recording the peak number of concurrent calls."""
+
+    def __init__(self, func):
+        self.func = func
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, item):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            # Later items finish first, so ordering has to be restored
+            await asyncio.sleep(0.001 * (10 - item % 10))
+            return self.func(item)
+        finally:
+            self.active -= 1
+
+
+class TestAmap:
+    """Test cases for async map."""
+
+    def test_amap_preserves_order(self):
+        """Test that results keep item order."""
+        tracker = ConcurrencyTracker(lambda x: x * 2)
+        result = asyncio.run(Collection(list(range(20))).amap(tracker, concurrency=5))
+        assert isinstance(result, Collection)
+        assert result.all() == [x * 2 for x in range(20)]
+
+    def test_amap_bounds_concurrency(self):
+        """Test that no more than `concurrency` calls run at once."""
+        tracker = ConcurrencyTracker(lambda x: x)
+        asyncio.run(Collection(list(range(30))).amap(tracker, concurrency=4))
+        assert tracker.peak == 4
+
+    def test_amap_empty(self):
+        """Test amap on an empty collection."""
+        tracker = ConcurrencyTracker(lambda x: x)
+        assert asyncio.run(Collection().amap(tracker)).all() == []
+
+    def test_amap_propagates_errors(self):
+        """Test that the first error is raised unchanged."""
+
+        async def fail_on_three(x):
+            await asyncio.sleep(0)
+            if x == 3:
+                raise LookupError("boom")
+            return x
+
+        with pytest.raises(LookupError, match="boom"):
+            asyncio.run(Collection(list(range(10))).amap(fail_on_three, concurrency=2))
+
+    def test_amap_invalid_concurrency(self):
+        """Test that concurrency must be positive."""
+        tracker = ConcurrencyTracker(lambda x: x)
+        with pytest.raises(ValueError, match="Concurrency must be a positive integer"):
+            asyncio.run(Collection([1]).amap(tracker, concurrency=0))
+
+
+class TestAfilter:
+    """Test cases for async filter."""
+
+    def test_afilter(self):
+        """Test filtering with an async predicate."""
+        tracker = ConcurrencyTracker(lambda x: x % 2 == 0)
+        result = asyncio.run(
+            Collection(list(range(10))).afilter(tracker, concurrency=3)
+        )
+        assert result.all() == [0, 2, 4, 6, 8]
+        assert tracker.peak == 3
+
+
+class TestAfirst:
+    """Test cases for async first."""
+
+    def test_afirst_returns_earliest_match(self):
+        """Test that the earliest match wins even if a later one finishes first."""
+        tracker = ConcurrencyTracker(lambda x: x in (3, 4))
+        result = asyncio.run(Collection(list(range(10))).afirst(tracker, concurrency=5))
+        assert result == 3
+
+    def test_afirst_stops_starting_new_calls(self):
+        """Test that items after a match are not checked."""
+        checked = []
+
+        async def is_match(x):
+            checked.append(x)
+            await asyncio.sleep(0)
+            return x == 1
+
+        result = asyncio.run(
+            Collection(list(range(100))).afirst(is_match, concurrency=2)
+        )
+        assert result == 1
+        assert max(checked) < 5
+
+    def test_afirst_no_match(self):
+        """Test that None is returned when nothing matches."""
+        tracker = ConcurrencyTracker(lambda x: False)
+        assert asyncio.run(Collection([1, 2, 3]).afirst(tracker)) is None
+        assert asyncio.run(Collection().afirst(tracker)) is None
@@ -0,0 +1,82 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from py_collections import Collection
+
+
+class TestPmap:
+    """Test cases for parallel map."""
+
+    def test_pmap_matches_map(self):
+        """Test that pmap returns the same result as map, in order."""
+        collection = Collection(list(range(1000)))
+        result = collection.pmap(lambda x: x * 2, workers=4)
+        assert isinstance(result, Collection)
+        assert result.all() == collection.map(lambda x: x * 2).all()
+
+    def test_pmap_uses_multiple_threads(self):
+        """Test that work is spread over several threads."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait_for_peer(x):
+            if x in (0, 1):
+                barrier.wait()
+            return threading.get_ident()
+
+        result = Collection([0, 1]).pmap(wait_for_peer, workers=2, chunksize=1)
+        assert len(set(result.all())) == 2
+
+    def test_pmap_process_executor(self):
+        """Test mapping with a process pool and a picklable function."""
+        result = Collection([-3, 1, -2]).pmap(abs, workers=2, executor="process")
+        assert result.all() == [3, 1, 2]
+
+    def test_pmap_existing_executor(self):
+        """Test that a passed-in executor is used and left running."""
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            result = Collection([1, 2, 3]).pmap(str, executor=pool, chunksize=2)
+            assert result.all() == ["1", "2", "3"]
+            assert pool.submit(len, "ab").result() == 2
+
+    def test_pmap_empty(self):
+        """Test pmap on an empty collection."""
+        assert Collection().pmap(str).all() == []
+
+    def test_pmap_propagates_errors(self):
+        """Test that exceptions raised by the function propagate."""
+        with pytest.raises(ZeroDivisionError):
+            Collection([1, 0]).pmap(lambda x: 1 / x, workers=2)
+
+    @pytest.mark.parametrize(
+        "kwargs,message",
+        [
+            ({"workers": 0}, "Workers must be a positive integer"),
+            ({"chunksize": 0}, "Chunk size must be a positive integer"),
+            ({"executor": "gpu"}, "Executor must be"),
+        ],
+    )
+    def test_pmap_invalid_arguments(self, kwargs, message):
+        """Test argument validation."""
+        with pytest.raises(ValueError, match=message):
+            Collection([1]).pmap(str, **kwargs)
+
+
+class TestPfilter:
+    """Test cases for parallel filter."""
+
+    def test_pfilter_matches_filter(self):
+        """Test that pfilter keeps the same items as filter, in order."""
+        collection = Collection(list(range(1000)))
+        result = collection.pfilter(lambda x: x % 3 == 0, workers=4, chunksize=7)
+        assert result.all() == collection.filter(lambda x: x % 3 == 0).all()
+
+    def test_pfilter_process_executor(self):
+        """Test filtering with a process pool."""
+        result = Collection([0, 1, "", "a", None]).pfilter(bool, executor="process")
+        assert result.all() == [1, "a"]
+
+    def test_pfilter_empty(self):
+        """Test pfilter on an empty collection."""
+        assert Collection().pfilter(bool).all() == []
@@ -260,3 +260,21 @@ class TestFindDuplicates:
         duplicates = collection.find_duplicates()
         assert len(duplicates) == 3  # Three duplicate items (one instance of each)
         assert duplicates == Collection([500, 501, 502])
+
+    def test_find_duplicates_dicts_in_any_key_order(self):
+        """Test that dictionaries with the same items in a different order match."""
+        rows = Collection(
+            [{"a": 1, "b": [1, 2]}, {"a": 2}, {"b": [1, 2], "a": 1}, {"a": 2, "b": 1}]
+        )
+        assert rows.find_duplicates() == Collection([{"a": 1, "b": [1, 2]}])
+
+    def test_find_duplicates_with_unhashable_key_values(self):
+        """Test find_duplicates() when the key resolves to unhashable values."""
+        rows = Collection(
+            [
+                {"id": 1, "tags": ["x"]},
+                {"id": 2, "tags": ["y"]},
+                {"id": 3, "tags": ["x"]},
+            ]
+        )
+        assert rows.find_duplicates("tags").pluck("id").all() == [1]
@@ -311,3 +311,13 @@ class TestFindUniques:
 
         # Only items 1 and 5 appear exactly once
         assert uniques == Collection([1, 5])
+
+    def test_find_uniques_dicts_in_any_key_order(self):
+        """Test that dictionaries with the same items in a different order match."""
+        rows = Collection([{"a": 1, "b": 2}, {"b": 2, "a": 1}, {"a": 3, "b": [4]}])
+        assert rows.find_uniques() == Collection([{"a": 3, "b": [4]}])
+
+    def test_find_uniques_with_mixed_hashable_and_unhashable_values(self):
+        """Test that hashable values keep their equality next to unhashable ones."""
+        items = Collection([1, [1], 1.0, "1", [1]])
+        assert items.find_uniques() == Collection(["1"])
@@ -0,0 +1,61 @@
+"""Tests for the partition_by_multiplicity method in ElementAccessMixin."""
+
+import pytest
+
+from py_collections import Collection, MultiplicityPartition
+
+
+class TestPartitionByMultiplicity:
+    """Test cases for the partition_by_multiplicity method."""
+
+    def test_without_arguments(self):
+        """Test partitioning items compared directly."""
+        result = Collection([1, 2, 2, 3, 3, 3, 4]).partition_by_multiplicity()
+
+        assert isinstance(result, MultiplicityPartition)
+        assert result.duplicates == Collection([2, 3])
+        assert result.uniques == Collection([1, 4])
+        assert result.counts == {1: 1, 2: 2, 3: 3, 4: 1}
+
+    def test_empty_collection(self):
+        """Test partitioning an empty collection."""
+        result = Collection([]).partition_by_multiplicity()
+
+        assert result.duplicates == Collection([])
+        assert result.uniques == Collection([])
+        assert result.counts == {}
+
+    @pytest.mark.parametrize(
+        "key_or_callback", [None, "id", lambda item: item["id"] % 3]
+    )
+    def test_matches_separate_methods(self, key_or_callback):
+        """Test that the result equals find_duplicates, find_uniques and value_counts."""
+        items = Collection([{"id": i % 5, "n": i} for i in range(12)])
+        if key_or_callback is None:
+            items = items.pluck("id")
+
+        result = items.partition_by_multiplicity(key_or_callback)
+
+        assert result.duplicates == items.find_duplicates(key_or_callback)
+        assert result.uniques == items.find_uniques(key_or_callback)
+        assert result.counts == items.value_counts(key_or_callback)
+
+    def test_unhashable_values(self):
+        """Test that unhashable values are compared by structure."""
+        rows = Collection([{"a": 1, "b": [2]}, {"b": [2], "a": 1}, {"a": 3}])
+        result = rows.partition_by_multiplicity()
+
+        assert result.duplicates == Collection([{"a": 1, "b": [2]}])
+        assert result.uniques == Collection([{"a": 3}])
+        assert result.counts == {"{'a': 1, 'b': [2]}": 2, "{'a': 3}": 1}
+
+    def test_missing_key_raises(self):
+        """Test that a missing key raises KeyError."""
+        with pytest.raises(KeyError):
+            Collection([{"id": 1}, {"name": "x"}]).partition_by_multiplicity("id")
+
+    def test_result_is_immutable(self):
+        """Test that the result attributes cannot be reassigned."""
+        result = Collection([1]).partition_by_multiplicity()
+        with pytest.raises(AttributeError):
+            result.uniques = Collection([])
@@ -0,0 +1,60 @@
+"""Tests for the value_counts method in ElementAccessMixin."""
+
+from dataclasses import dataclass
+
+import pytest
+
+from py_collections import Collection
+
+
+class TestValueCounts:
+    """Test cases for the value_counts method."""
+
+    def test_without_arguments(self):
+        """Test counting the items themselves, in order of first occurrence."""
+        counts = Collection(["b", "a", "b", "c", "b"]).value_counts()
+        assert counts == {"b": 3, "a": 1, "c": 1}
+        assert list(counts) == ["b", "a", "c"]
+
+    def test_empty_collection(self):
+        """Test counting an empty collection."""
+        assert Collection([]).value_counts() == {}
+
+    def test_with_key_string(self):
+        """Test counting the values of a key, including nested keys."""
+        orders = Collection(
+            [
+                {"status": "paid", "customer": {"country": "FR"}},
+                {"status": "open", "customer": {"country": "DE"}},
+                {"status": "paid", "customer": {"country": "FR"}},
+            ]
+        )
+        assert orders.value_counts("status") == {"paid": 2, "open": 1}
+        assert orders.value_counts("customer.country") == {"FR": 2, "DE": 1}
+
+    def test_with_attribute_and_callback(self):
+        """Test counting attributes and callback results."""
+
+        @dataclass
+        class User:
+            role: str
+            age: int
+
+        users = Collection([User("admin", 30), User("user", 17), User("user", 45)])
+        assert users.value_counts("role") == {"admin": 1, "user": 2}
+        assert users.value_counts(lambda u: u.age >= 18) == {True: 2, False: 1}
+
+    def test_unhashable_values(self):
+        """Test that unhashable values are counted by structure and keyed by str."""
+        rows = Collection([{"tags": ["a", "b"]}, {"tags": ["a", "b"]}, {"tags": 1}])
+        assert rows.value_counts("tags") == {"['a', 'b']": 2, 1: 1}
+
+    def test_dicts_in_any_key_order(self):
+        """Test that dictionaries with the same items count together."""
+        counts = Collection([{"a": 1, "b": 2}, {"b": 2, "a": 1}]).value_counts()
+        assert counts == {"{'a': 1, 'b': 2}": 2}
+
+    def test_missing_key_raises(self):
+        """Test that a missing key raises KeyError."""
+        with pytest.raises(KeyError):
+            Collection([{"status": "paid"}, {}]).value_counts("status")
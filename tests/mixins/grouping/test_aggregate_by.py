@@ -0,0 +1,134 @@
+import pytest
+
+from py_collections import Collection, CollectionMap
+
+
+class Order:
+    def __init__(self, customer, amount):
+        self.customer = customer
+        self.amount = amount
+
+
+@pytest.fixture
+def orders():
+    return Collection(
+        [
+            {"customer": "alice", "amount": 10},
+            {"customer": "bob", "amount": 5},
+            {"customer": "alice", "amount": 20},
+            {"customer": "carol", "amount": 7.5},
+        ]
+    )
+
+
+class TestAggregateBy:
+    """Test cases for single-pass group aggregation."""
+
+    def test_all_operations(self, orders):
+        """Test every aggregation operation on dict rows."""
+        result = orders.aggregate_by(
+            "customer",
+            n="count",
+            total=("sum", "amount"),
+            mean=("avg", "amount"),
+            low=("min", "amount"),
+            high=("max", "amount"),
+        )
+
+        assert list(result) == ["alice", "bob", "carol"]
+        assert result["alice"] == {
+            "n": 2,
+            "total": 30,
+            "mean": 15.0,
+            "low": 10,
+            "high": 20,
+        }
+        assert result["carol"] == {
+            "n": 1,
+            "total": 7.5,
+            "mean": 7.5,
+            "low": 7.5,
+            "high": 7.5,
+        }
+
+    def test_matches_group_by_then_reduce(self, orders):
+        """Test that results match group_by followed by per-group sums."""
+        expected = {k: c.sum("amount") for k, c in orders.group_by("customer").items()}
+        result = orders.aggregate_by("customer", total=("sum", "amount"))
+        assert {k: v["total"] for k, v in result.items()} == expected
+
+    def test_callable_key_and_value(self, orders):
+        """Test callable grouping keys and value callbacks."""
+        result = orders.aggregate_by(
+            lambda o: o["amount"] >= 10,
+            doubled=("sum", lambda o: o["amount"] * 2),
+        )
+        assert result == {True: {"doubled": 60}, False: {"doubled": 25.0}}
+
+    def test_object_attributes(self):
+        """Test aggregating objects by attribute."""
+        orders = Collection([Order("a", 1), Order("b", 2), Order("a", 3)])
+        result = orders.aggregate_by("customer", total=("sum", "amount"))
+        assert result == {"a": {"total": 4}, "b": {"total": 2}}
+
+    def test_group_by_item(self):
+        """Test counting identical items."""
+        result = Collection(["x", "y", "x"]).aggregate_by(n="count")
+        assert result == {"x": {"n": 2}, "y": {"n": 1}}
+
+    def test_min_max_accept_comparable_values(self):
+        """Test that min and max work on non-numeric comparable values."""
+        rows = Collection([{"g": 1, "d": "2024-02"}, {"g": 1, "d": "2024-01"}])
+        result = rows.aggregate_by("g", first=("min", "d"), last=("max", "d"))
+        assert result == {1: {"first": "2024-01", "last": "2024-02"}}
+
+    def test_empty_collection(self):
+        """Test aggregating an empty collection."""
+        assert Collection().aggregate_by("k", n="count") == {}
+
+    def test_non_numeric_sum(self):
+        """Test that sum and avg reject non-numeric values."""
+        rows = Collection([{"k": 1, "v": "x"}])
+        with pytest.raises(TypeError, match="Value for key 'v' must be numeric"):
+            rows.aggregate_by("k", total=("sum", "v"))
+        with pytest.raises(TypeError, match="Callback must return a numeric value"):
+            rows.aggregate_by("k", mean=("avg", lambda r: r["v"]))
+
+    def test_missing_value_key(self):
+        """Test that a missing value key raises KeyError."""
+        with pytest.raises(KeyError, match="Key 'amount' not found"):
+            Collection([{"k": 1}]).aggregate_by("k", total=("sum", "amount"))
+
+    def test_invalid_specs(self, orders):
+        """Test validation of aggregation specs."""
+        with pytest.raises(ValueError, match="At least one aggregation"):
+            orders.aggregate_by("customer")
+        with pytest.raises(ValueError, match="Unknown aggregation 'median'"):
+            orders.aggregate_by("customer", m=("median", "amount"))
+        with pytest.raises(ValueError, match="needs a key or callback"):
+            orders.aggregate_by("customer", s=("sum", None))
+        with pytest.raises(ValueError, match="Key must be a string"):
+            orders.aggregate_by(3, n="count")
+
+
+class TestCollectionMapAgg:
+    """Test cases for CollectionMap.agg."""
+
+    def test_agg(self):
+        """Test aggregating each group of a CollectionMap."""
+        cmap = CollectionMap({"a": [1, 2, 3], "b": [10]})
+        result = cmap.agg(
+            n="count", total=("sum", lambda x: x), top=("max", lambda x: x)
+        )
+        assert result == {
+            "a": {"n": 3, "total": 6, "top": 3},
+            "b": {"n": 1, "total": 10, "top": 10},
+        }
+
+    def test_agg_empty_group(self):
+        """Test that empty groups report neutral values."""
+        cmap = CollectionMap({"a": []})
+        result = cmap.agg(
+            n="count", mean=("avg", lambda x: x), low=("min", lambda x: x)
+        )
+        assert result == {"a": {"n": 0, "mean": None, "low": None}}
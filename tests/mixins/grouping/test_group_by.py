@@ -1,6 +1,7 @@
 import pytest
 
-from py_collections import Collection
+from py_collections import Collection, CollectionMap
+from py_collections.mixins.grouping import group_items
 
 
 class TestGroupBy:
@@ -259,3 +260,52 @@ class TestGroupBy:
         assert hasattr(grouped["even"], "filter")
         assert hasattr(grouped["even"], "first")
         assert hasattr(grouped["even"], "all")
+
+    def test_group_by_as_map(self):
+        """Test that as_map=True returns a CollectionMap."""
+        numbers = Collection([1, 2, 3, 4, 5])
+
+        grouped = numbers.group_by(
+            lambda x: "even" if x % 2 == 0 else "odd", as_map=True
+        )
+
+        assert isinstance(grouped, CollectionMap)
+        assert grouped.keys() == ["odd", "even"]
+        assert grouped["odd"].all() == [1, 3, 5]
+        assert grouped.group_sizes() == {"odd": 3, "even": 2}
+
+    def test_group_by_as_map_empty(self):
+        """Test as_map=True on an empty collection."""
+        grouped = Collection().group_by("key", as_map=True)
+        assert isinstance(grouped, CollectionMap)
+        assert len(grouped) == 0
+
+    def test_group_by_invalid_key(self):
+        """Test that an unsupported key type raises ValueError."""
+        with pytest.raises(ValueError, match="Key must be a string, callable, or None"):
+            Collection([1, 2]).group_by(42)
+
+    def test_group_by_unhashable_non_container_key(self):
+        """Test that unhashable keys other than list/dict/set still raise."""
+        with pytest.raises(TypeError):
+            Collection([1]).group_by(lambda x: bytearray(b"x"))
+
+
+class TestGroupItems:
+    """Test cases for the group_items streaming engine."""
+
+    def test_group_items_from_generator(self):
+        """Test grouping a generator into plain lists."""
+        groups = group_items((n for n in range(6)), lambda n: n % 3)
+        assert groups == {0: [0, 3], 1: [1, 4], 2: [2, 5]}
+
+    def test_group_items_by_key(self):
+        """Test grouping dictionaries by key."""
+        rows = [{"k": "a"}, {"k": "b"}, {"k": "a"}, {}]
+        groups = group_items(iter(rows), "k")
+        assert groups == {"a": [rows[0], rows[2]], "b": [rows[1]], None: [rows[3]]}
+
+    def test_group_items_by_item(self):
+        """Test grouping by the items themselves, including unhashable ones."""
+        groups = group_items([1, [2], 1, [2]])
+        assert groups == {1: [1, 1], "[2]": [[2], [2]]}
@@ -0,0 +1,175 @@
+import random
+
+import pytest
+
+from py_collections import Collection
+
+
+class CountingKey:
+    """Callable key that records how many times it was called."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, item):
+        self.calls += 1
+        return item["id"]
+
+
+class TestIndexBy:
+    """Test cases for the opt-in hash index."""
+
+    def test_index_by_returns_self(self):
+        """Test that index_by can be chained."""
+        collection = Collection([1, 2, 3])
+        assert collection.index_by() is collection
+        assert collection.has_index()
+
+    def test_lookup_by_key(self):
+        """Test looking up items by an indexed key."""
+        rows = Collection(
+            [
+                {"id": 1, "name": "Alice"},
+                {"id": 2, "name": "Bob"},
+                {"id": 1, "name": "Alice again"},
+            ]
+        ).index_by("id")
+
+        assert rows.lookup(1).pluck("name").all() == ["Alice", "Alice again"]
+        assert rows.lookup(3).all() == []
+
+    def test_lookup_without_index(self):
+        """Test that lookup requires an index."""
+        with pytest.raises(ValueError, match="call index_by"):
+            Collection([1]).lookup(1)
+
+    def test_contains(self):
+        """Test the in operator with and without an index."""
+        collection = Collection([1, 2, 3])
+        assert 2 in collection
+        assert 5 not in collection
+        collection.index_by()
+        assert 2 in collection
+        assert 5 not in collection
+
+    def test_navigation_uses_index(self):
+        """Test that after/before resolve element targets through the index."""
+        key = CountingKey()
+        rows = [{"id": i} for i in range(5)]
+        collection = Collection(rows).index_by(key)
+        calls_after_build = key.calls
+
+        assert collection.after({"id": 2}) == {"id": 3}
+        assert collection.before({"id": 2}) == {"id": 1}
+        assert collection.after({"id": 4}) is None
+        assert collection.before({"id": 0}) is None
+        assert collection.after({"id": 9}) is None
+        # One key computation per lookup, no scan over the items
+        assert key.calls == calls_after_build + 5
+
+    def test_identity_index_matches_first_occurrence(self):
+        """Test that duplicates resolve to their first position."""
+        collection = Collection(["a", "b", "a", "c"]).index_by()
+        assert collection.after("a") == "b"
+        assert collection.before("c") == "a"
+
+    def test_append_and_extend_update_index(self):
+        """Test that appended items are indexed incrementally."""
+        collection = Collection([{"id": 1}]).index_by("id")
+        collection.append({"id": 2})
+        collection.extend([{"id": 3}, {"id": 2, "dup": True}])
+        collection.extend(Collection([{"id": 4}]))
+
+        assert not collection._index.stale
+        assert collection.lookup(2).all() == [{"id": 2}, {"id": 2, "dup": True}]
+        assert collection.lookup(4).all() == [{"id": 4}]
+
+    def test_remove_invalidates_index(self):
+        """Test that removals shift positions and trigger a rebuild."""
+        collection = Collection([1, 2, 3, 2, 4]).index_by()
+
+        collection.remove(2)
+        assert collection._index.stale
+        assert collection.after(3) == 4
+        assert not collection._index.stale
+
+        collection.remove_one(3)
+        assert collection.after(1) == 4
+        assert 3 not in collection
+
+    def test_remove_one_uses_index(self):
+        """Test remove_one with an element target on an indexed collection."""
+        collection = Collection(["x", "y", "x"]).index_by()
+        collection.remove_one("x")
+        assert collection.all() == ["y", "x"]
+        collection.remove_one("missing")
+        assert collection.all() == ["y", "x"]
+
+    def test_predicate_targets_still_scan(self):
+        """Test that predicates keep working on an indexed collection."""
+        collection = Collection([1, 2, 3]).index_by()
+        assert collection.after(lambda x: x > 1) == 3
+        collection.remove_one(lambda x: x == 1)
+        assert collection.all() == [2, 3]
+        assert collection.before(3) == 2
+
+    def test_unhashable_items_raise(self):
+        """Test that indexing unhashable items raises TypeError."""
+        with pytest.raises(TypeError, match="index_by requires hashable keys"):
+            Collection([[1], [2]]).index_by()
+
+    def test_unhashable_append_drops_index(self):
+        """Test that an unhashable item appended later falls back to scanning."""
+        collection = Collection([1, 2]).index_by()
+        collection.append([3])
+        assert collection.after(2) == [3]
+        assert not collection.has_index()
+
+    def test_unhashable_target_falls_back_to_scan(self):
+        """Test looking up an unhashable target in an indexed collection."""
+        collection = Collection([1, 2]).index_by()
+        assert [1] not in collection
+
+    def test_drop_index(self):
+        """Test dropping the index."""
+        collection = Collection([1, 2]).index_by()
+        collection.drop_index()
+        assert not collection.has_index()
+        assert collection.after(1) == 2
+
+    def test_derived_collections_are_not_indexed(self):
+        """Test that new collections do not inherit the index."""
+        collection = Collection([1, 2]).index_by()
+        assert not collection.filter(lambda x: True).has_index()
+        assert not collection.clone().has_index()
+
+    def test_remove_one_updates_index_in_place(self):
+        """Test that a remove/lookup loop calls the key function a linear number of times."""
+        key = CountingKey()
+        rows = [{"id": i} for i in range(1_000)]
+        collection = Collection(rows).index_by(key)
+        for row in rows[::2]:
+            collection.remove_one(row)
+            assert collection.after(row) is None
+            assert collection.lookup(row["id"] + 1).all() == [{"id": row["id"] + 1}]
+        assert not collection._index.stale
+        # One call per item to build, then a few per removal and lookup
+        assert key.calls <= 1_000 + 3 * 500
+        assert collection.all() == rows[1::2]
+
+    def test_remove_one_matches_rebuilt_index(self):
+        """Test that incremental removals and appends agree with a fresh index."""
+        rng = random.Random(7)
+        collection = Collection([rng.randrange(50) for _ in range(500)]).index_by()
+        for step in range(1_000):
+            if step % 3:
+                collection.remove_one(rng.randrange(50))
+            else:
+                collection.append(rng.randrange(50))
+            value = rng.randrange(50)
+            expected = [x for x in collection.all() if x == value]
+            assert collection.lookup(value).all() == expected
+            position = collection._position_of(value)
+            assert position == (collection.all().index(value) if expected else None)
+        rebuilt = Collection(collection.all()).index_by()
+        assert collection._index.find(3) == rebuilt._index.find(3)
@@ -0,0 +1,91 @@
+import io
+
+import pytest
+
+from py_collections import Collection
+
+
+class TestFromIterable:
+    def test_from_generator(self):
+        """Test building a collection from a generator."""
+        collection = Collection.from_iterable(x * 2 for x in range(4))
+        assert collection.all() == [0, 2, 4, 6]
+        assert isinstance(collection, Collection)
+
+    def test_from_list_does_not_share_storage(self):
+        """Test that a list argument is not used as backing storage."""
+        source = [1, 2]
+        collection = Collection.from_iterable(source)
+        source.append(3)
+        assert collection.all() == [1, 2]
+
+    def test_from_empty_iterable(self):
+        """Test building a collection from an empty iterable."""
+        assert Collection.from_iterable(iter(())).all() == []
+
+
+class TestFromJsonl:
+    @pytest.mark.parametrize("memory_map", [False, True])
+    def test_from_path(self, tmp_path, memory_map):
+        """Test loading a JSON Lines file, with and without memory mapping."""
+        path = tmp_path / "data.jsonl"
+        path.write_text('{"id": 1, "name": "é"}\n\n[1, 2]\n"x"\n', encoding="utf-8")
+
+        collection = Collection.from_jsonl(path, memory_map=memory_map)
+        assert collection.all() == [{"id": 1, "name": "é"}, [1, 2], "x"]
+
+    def test_from_file_object(self):
+        """Test loading JSON Lines from a text file-like object."""
+        collection = Collection.from_jsonl(io.StringIO('{"a": 1}\n{"a": 2}'))
+        assert collection.pluck("a").all() == [1, 2]
+
+    def test_roundtrip_with_to_jsonl(self):
+        """Test that to_jsonl() output loads back to the same items."""
+        original = Collection([{"a": [1, 2]}, None, 3.5])
+        assert Collection.from_jsonl(io.StringIO(original.to_jsonl())) == original
+
+    def test_empty_file_with_memory_map(self, tmp_path):
+        """Test that an empty file can be memory-mapped."""
+        path = tmp_path / "empty.jsonl"
+        path.write_text("")
+        assert Collection.from_jsonl(path, memory_map=True).all() == []
+
+    def test_invalid_line(self):
+        """Test that an invalid line reports its line number."""
+        with pytest.raises(ValueError, match="Invalid JSON on line 2"):
+            Collection.from_jsonl(io.StringIO('{"a": 1}\n{oops}\n'))
+
+    def test_memory_map_requires_path(self):
+        """Test that memory mapping a file-like object is rejected."""
+        with pytest.raises(ValueError, match="memory_map requires a file path"):
+            Collection.from_jsonl(io.StringIO("1\n"), memory_map=True)
+
+
+class TestFromCsv:
+    @pytest.mark.parametrize("memory_map", [False, True])
+    def test_from_path(self, tmp_path, memory_map):
+        """Test loading a CSV file, with and without memory mapping."""
+        path = tmp_path / "users.csv"
+        path.write_text('id,name\n1,Alice\n2,"Smith, Bob"\n', encoding="utf-8")
+
+        collection = Collection.from_csv(path, memory_map=memory_map)
+        assert collection.all() == [
+            {"id": "1", "name": "Alice"},
+            {"id": "2", "name": "Smith, Bob"},
+        ]
+
+    def test_quoted_newline_with_memory_map(self, tmp_path):
+        """Test that quoted fields spanning lines survive memory mapping."""
+        path = tmp_path / "notes.csv"
+        path.write_text('id,note\n1,"line one\nline two"\n', encoding="utf-8")
+
+        collection = Collection.from_csv(path, memory_map=True)
+        assert collection.first()["note"] == "line one\nline two"
+
+    def test_format_parameters(self):
+        """Test that format parameters are passed to the CSV reader."""
+        source = io.StringIO("1;Alice\n2;Bob\n", newline="")
+        collection = Collection.from_csv(
+            source, delimiter=";", fieldnames=["id", "name"]
+        )
+        assert collection.pluck("name").all() == ["Alice", "Bob"]
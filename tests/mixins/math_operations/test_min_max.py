@@ -0,0 +1,58 @@
+import pytest
+
+from py_collections import Collection
+
+
+class Dummy:
+    def __init__(self, value):
+        self.value = value
+
+
+@pytest.mark.parametrize(
+    "items,expected_min,expected_max",
+    [
+        ([3, 1, 2], 1, 3),
+        ([1.5, -2.5, 0.0], -2.5, 1.5),
+        ([7], 7, 7),
+        ([1, "skip", 5, None], 1, 5),
+    ],
+)
+def test_min_max_basic(items, expected_min, expected_max):
+    c = Collection(items)
+    assert c.min() == expected_min
+    assert c.max() == expected_max
+
+
+def test_min_max_key():
+    c = Collection([{"price": 10}, {"price": 30}, {"price": 20}])
+    assert c.min("price") == 10
+    assert c.max("price") == 30
+
+
+def test_min_max_attribute():
+    c = Collection([Dummy(4), Dummy(-1), Dummy(9)])
+    assert c.min("value") == -1
+    assert c.max("value") == 9
+
+
+def test_min_max_callback():
+    c = Collection([1, 2, 3])
+    assert c.min(lambda x: x * -1) == -3
+    assert c.max(lambda x: x * 10) == 30
+
+
+def test_min_max_empty():
+    with pytest.raises(
+        ValueError, match="No numeric values found in collection to min"
+    ):
+        Collection().min()
+    with pytest.raises(ValueError, match="No values found for key to max"):
+        Collection().max("price")
+
+
+def test_min_max_non_numeric():
+    c = Collection([{"price": "a"}])
+    with pytest.raises(TypeError, match="Value for key 'price' must be numeric"):
+        c.min("price")
+    with pytest.raises(TypeError, match="Callback must return a numeric value"):
+        Collection([1]).max(lambda x: "x")
@@ -0,0 +1,83 @@
+import dataclasses
+import statistics
+
+import pytest
+
+from py_collections import Collection, Stats
+
+
+def test_stats_basic():
+    values = [2, 4, 4, 4, 5, 5, 7, 9]
+    stats = Collection(values).stats()
+
+    assert isinstance(stats, Stats)
+    assert stats.count == 8
+    assert stats.sum == 40
+    assert stats.mean == pytest.approx(5.0)
+    assert stats.min == 2
+    assert stats.max == 9
+    assert stats.variance == pytest.approx(statistics.pvariance(values))
+    assert stats.std == pytest.approx(2.0)
+    assert stats.sample_variance == pytest.approx(statistics.variance(values))
+
+
+def test_stats_matches_individual_operations():
+    c = Collection([{"ms": 12.5}, {"ms": 3.0}, {"ms": 7.25}, {"ms": 30.0}])
+    stats = c.stats("ms")
+
+    assert stats.sum == pytest.approx(c.sum("ms"))
+    assert stats.mean == pytest.approx(c.average("ms"))
+    assert stats.min == c.min("ms")
+    assert stats.max == c.max("ms")
+    assert stats.std == pytest.approx(c.std("ms"))
+
+
+def test_stats_callback():
+    stats = Collection([1, 2, 3]).stats(lambda x: x * 10)
+    assert (stats.count, stats.sum, stats.min, stats.max) == (3, 60, 10, 30)
+
+
+def test_stats_skips_non_numeric_without_key():
+    stats = Collection([1, "a", 3, None]).stats()
+    assert stats.count == 2
+    assert stats.mean == pytest.approx(2.0)
+
+
+def test_stats_single_value():
+    stats = Collection([5]).stats()
+    assert stats.variance == 0.0
+    assert stats.sample_variance == 0.0
+
+
+def test_stats_is_immutable():
+    stats = Collection([1, 2]).stats()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        stats.count = 3
+    assert not hasattr(stats, "__dict__")
+
+
+def test_stats_errors():
+    with pytest.raises(ValueError, match="No numeric values found"):
+        Collection().stats()
+    with pytest.raises(ValueError, match="No values found for key"):
+        Collection().stats("ms")
+    with pytest.raises(TypeError, match="Value for key 'ms' must be numeric"):
+        Collection([{"ms": "slow"}]).stats("ms")
+
+
+def test_stats_streams_values():
+    calls = []
+
+    def value(item):
+        calls.append(item)
+        return item["ms"]
+
+    rows = Collection([{"ms": 1}, {"ms": "slow"}, {"ms": 3}, {"ms": 4}])
+    with pytest.raises(TypeError, match="Callback must return a numeric value"):
+        rows.stats(value)
+    # Validation happens while walking the items, so it stops at the bad one
+    assert calls == rows.all()[:2]
+
+    calls.clear()
+    Collection([{"ms": 2}, {"ms": 1}, {"ms": 3}]).stats(value)
+    assert len(calls) == 3
@@ -0,0 +1,76 @@
+import math
+
+import pytest
+
+from py_collections import Collection
+from py_collections.mixins import math_operations
+
+
+@pytest.mark.parametrize(
+    "items,expected",
+    [
+        ([2, 4, 4, 4, 5, 5, 7, 9], 2.0),
+        ([1.0, 1.0, 1.0], 0.0),
+        ([5], 0.0),
+    ],
+)
+def test_std_population(items, expected):
+    assert Collection(items).std() == pytest.approx(expected)
+
+
+def test_std_sample():
+    c = Collection([2, 4, 4, 4, 5, 5, 7, 9])
+    assert c.std(ddof=1) == pytest.approx(math.sqrt(32 / 7))
+
+
+def test_std_key_and_callback():
+    c = Collection([{"v": 1}, {"v": 3}])
+    assert c.std("v") == pytest.approx(1.0)
+    assert c.std(lambda row: row["v"] * 2) == pytest.approx(2.0)
+
+
+def test_std_errors():
+    with pytest.raises(
+        ValueError, match="No numeric values found in collection to std"
+    ):
+        Collection(["a"]).std()
+    with pytest.raises(ValueError, match="Need more than 1 values"):
+        Collection([1]).std(ddof=1)
+
+
+class TestVectorizedBackend:
+    """Test that std() of large homogeneous float data matches via NumPy."""
+
+    @pytest.fixture
+    def values(self):
+        return [i * 0.5 for i in range(math_operations._VECTORIZE_MIN_SIZE)]
+
+    def test_float_array_requires_homogeneous_floats(self, values):
+        pytest.importorskip("numpy")
+        assert math_operations._float_array(values) is not None
+        assert math_operations._float_array([*values, 1]) is None
+        assert math_operations._float_array(values[:10]) is None
+
+    def test_vectorized_results_match_pure_python(self, values, monkeypatch):
+        pytest.importorskip("numpy")
+        c = Collection(values)
+        vectorized = c.std()
+
+        monkeypatch.setattr(math_operations, "_np", None)
+        pure = c.std()
+
+        assert vectorized == pytest.approx(pure)
+        assert isinstance(vectorized, float)
+
+    def test_sum_and_average_do_not_vectorize(self, values, monkeypatch):
+        """Test that sum() and average() use builtin sum() even with NumPy."""
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(math_operations, "_float_array", None)
+        c = Collection(values)
+        assert c.sum() == sum(values)
+        assert c.average() == sum(values) / len(values)
+
+    def test_integers_stay_exact(self):
+        big = 2**62
+        c = Collection([big] * math_operations._VECTORIZE_MIN_SIZE)
+        assert c.sum() == big * math_operations._VECTORIZE_MIN_SIZE
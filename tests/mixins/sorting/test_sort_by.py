@@ -0,0 +1,160 @@
+"""Tests for the sort_by and sort_inplace methods in SortingMixin."""
+
+from dataclasses import dataclass
+
+import pytest
+
+from py_collections import Collection
+
+
+@dataclass
+class Person:
+    name: str
+    age: int | None
+
+
+ROWS = [
+    {"id": 1, "country": "NL", "age": 30},
+    {"id": 2, "country": "BE", "age": 25},
+    {"id": 3, "country": "NL", "age": 41},
+    {"id": 4, "country": "BE", "age": 25},
+    {"id": 5, "country": "DE", "age": 30},
+]
+
+
+def ids(collection):
+    return [row["id"] for row in collection]
+
+
+class TestSortBy:
+    """Test cases for the sort_by method."""
+
+    def test_sort_without_keys(self):
+        """Test that sort_by() without keys compares the items themselves."""
+        assert Collection([3, 1, 2]).sort_by().all() == [1, 2, 3]
+        assert Collection([3, 1, 2]).sort_by(descending=True).all() == [3, 2, 1]
+
+    def test_sort_by_single_key(self):
+        """Test sorting by one key in both directions."""
+        rows = Collection(ROWS)
+        assert ids(rows.sort_by("age")) == [2, 4, 1, 5, 3]
+        assert ids(rows.sort_by("age", descending=True)) == [3, 1, 5, 2, 4]
+
+    def test_sort_by_multiple_keys(self):
+        """Test that earlier keys are more significant than later ones."""
+        rows = Collection(ROWS)
+        assert ids(rows.sort_by("country", "age")) == [2, 4, 5, 1, 3]
+
+    def test_sort_with_mixed_directions(self):
+        """Test one direction per key."""
+        rows = Collection(ROWS)
+        result = rows.sort_by("country", "age", descending=[True, False])
+        assert ids(result) == [1, 3, 5, 2, 4]
+        result = rows.sort_by("age", "id", descending=[True, True])
+        assert ids(result) == [3, 5, 1, 4, 2]
+
+    def test_sort_is_stable(self):
+        """Test that items with equal keys keep their original order."""
+        rows = Collection(ROWS)
+        assert ids(rows.sort_by("country")) == [2, 4, 5, 1, 3]
+        assert ids(rows.sort_by("country", descending=True)) == [1, 3, 5, 2, 4]
+
+    def test_sort_by_callable_and_dotted_key(self):
+        """Test callables and dot notation as keys."""
+        users = Collection(
+            [
+                {"name": "bob", "address": {"city": "Utrecht"}},
+                {"name": "Alice", "address": {"city": "Utrecht"}},
+                {"name": "carol", "address": {"city": "Amsterdam"}},
+            ]
+        )
+        result = users.sort_by("address.city", lambda user: user["name"].lower())
+        assert result.pluck("name").all() == ["carol", "Alice", "bob"]
+
+    def test_sort_objects_by_attribute(self):
+        """Test sorting objects by attribute name."""
+        people = Collection([Person("b", 2), Person("a", 2), Person("c", 1)])
+        result = people.sort_by("age", "name")
+        assert [person.name for person in result] == ["c", "a", "b"]
+
+    def test_none_values_sort_last(self):
+        """Test that None values are placed last in either direction."""
+        people = Collection([Person("a", None), Person("b", 3), Person("c", 1)])
+        ascending = people.sort_by("age")
+        descending = people.sort_by("age", descending=True)
+        assert [person.name for person in ascending] == ["c", "b", "a"]
+        assert [person.name for person in descending] == ["b", "c", "a"]
+
+    def test_missing_keys_sort_last(self):
+        """Test that items missing a key sort like None values."""
+        rows = Collection([{"id": 1}, {"id": 2, "rank": 2}, {"id": 3, "rank": 1}])
+        assert ids(rows.sort_by("rank")) == [3, 2, 1]
+        assert ids(rows.sort_by("rank", descending=True)) == [2, 3, 1]
+
+    def test_none_values_within_secondary_key(self):
+        """Test None handling in a less significant key."""
+        rows = Collection(
+            [
+                {"id": 1, "group": "a", "rank": None},
+                {"id": 2, "group": "a", "rank": 5},
+                {"id": 3, "group": "b", "rank": 1},
+            ]
+        )
+        assert ids(rows.sort_by("group", "rank", descending=[True, False])) == [
+            3,
+            2,
+            1,
+        ]
+
+    def test_sort_returns_new_collection(self):
+        """Test that sort_by() leaves the original collection unchanged."""
+        numbers = Collection([2, 1])
+        result = numbers.sort_by()
+        assert result is not numbers
+        assert numbers.all() == [2, 1]
+
+    def test_sort_empty_collection(self):
+        """Test sorting an empty collection."""
+        assert Collection([]).sort_by("age").all() == []
+
+    def test_descending_length_mismatch(self):
+        """Test that a descending sequence must have one value per key."""
+        with pytest.raises(ValueError, match="descending has 1 values for 2"):
+            Collection(ROWS).sort_by("country", "age", descending=[True])
+
+    def test_incomparable_values(self):
+        """Test that values of incomparable types raise TypeError."""
+        with pytest.raises(TypeError):
+            Collection([1, "a"]).sort_by()
+
+    def test_invalid_key_type(self):
+        """Test that a key that is not a string or callable raises TypeError."""
+        with pytest.raises(TypeError):
+            Collection(ROWS).sort_by(1)
+
+
+class TestSortInplace:
+    """Test cases for the sort_inplace method."""
+
+    def test_sort_inplace(self):
+        """Test that sort_inplace() reorders the collection itself."""
+        rows = Collection(ROWS)
+        items = rows.all()
+        assert rows.sort_inplace("country", "age", descending=[False, True]) is None
+        assert ids(rows) == [2, 4, 5, 3, 1]
+        assert items == ROWS
+
+    def test_sort_inplace_invalidates_index(self):
+        """Test that the index is rebuilt after sorting in place."""
+        numbers = Collection([3, 1, 2]).index_by()
+        numbers.sort_inplace()
+        assert numbers.all() == [1, 2, 3]
+        assert numbers.after(1) == 2
+        assert numbers.lookup(3).all() == [3]
+
+    def test_failed_sort_inplace_leaves_items_unchanged(self):
+        """Test that a failing sort does not reorder the collection."""
+        items = Collection([3, "a", 1])
+        with pytest.raises(TypeError):
+            items.sort_inplace()
+        assert items.all() == [3, "a", 1]
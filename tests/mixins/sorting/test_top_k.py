@@ -0,0 +1,101 @@
+"""Tests for the top_k and bottom_k methods in SortingMixin."""
+
+from dataclasses import dataclass
+
+import pytest
+
+from py_collections import Collection
+
+
+@dataclass
+class Player:
+    name: str
+    score: int
+
+
+SCORES = [
+    {"id": 1, "score": 40},
+    {"id": 2, "score": 95},
+    {"id": 3, "score": 70},
+    {"id": 4, "score": 95},
+    {"id": 5, "score": 10},
+]
+
+
+def ids(collection):
+    return [row["id"] for row in collection]
+
+
+class TestTopK:
+    """Test cases for the top_k method."""
+
+    def test_top_k_without_key(self):
+        """Test that top_k() without a key compares the items themselves."""
+        assert Collection([5, 1, 9, 3, 7]).top_k(3).all() == [9, 7, 5]
+
+    def test_top_k_with_key_string(self):
+        """Test top_k() with a key, keeping the original order of ties."""
+        assert ids(Collection(SCORES).top_k(3, "score")) == [2, 4, 3]
+
+    def test_top_k_with_callback_and_attribute(self):
+        """Test top_k() with a callable and with an attribute name."""
+        players = Collection([Player("a", 3), Player("b", 8), Player("c", 5)])
+        assert [p.name for p in players.top_k(2, "score")] == ["b", "c"]
+        assert [p.name for p in players.top_k(1, lambda p: -p.score)] == ["a"]
+
+    def test_top_k_matches_sort(self):
+        """Test that top_k() equals a full descending sort truncated to k."""
+        rows = Collection([{"id": i, "score": (i * 37) % 101} for i in range(500)])
+        expected = rows.sort_by("score", descending=True).take(25)
+        assert rows.top_k(25, "score") == expected
+
+    def test_k_larger_than_collection(self):
+        """Test that every item is returned when k exceeds the size."""
+        assert Collection([2, 3, 1]).top_k(10).all() == [3, 2, 1]
+
+    def test_k_zero_and_empty_collection(self):
+        """Test that k=0 and an empty collection return empty collections."""
+        assert Collection([1, 2]).top_k(0).all() == []
+        assert Collection([]).top_k(3, "score").all() == []
+
+    def test_invalid_k(self):
+        """Test that a negative or non-integer k raises ValueError."""
+        with pytest.raises(ValueError, match="k must be a non-negative integer"):
+            Collection([1]).top_k(-1)
+        with pytest.raises(ValueError, match="k must be a non-negative integer"):
+            Collection([1]).top_k(1.5)
+
+    def test_missing_key(self):
+        """Test that a missing key raises KeyError, as in sum()."""
+        with pytest.raises(KeyError):
+            Collection([{"score": 1}, {"id": 2}]).top_k(1, "score")
+
+    def test_returns_new_collection(self):
+        """Test that top_k() leaves the original collection unchanged."""
+        numbers = Collection([1, 3, 2])
+        assert numbers.top_k(2) is not numbers
+        assert numbers.all() == [1, 3, 2]
+
+
+class TestBottomK:
+    """Test cases for the bottom_k method."""
+
+    def test_bottom_k_without_key(self):
+        """Test that bottom_k() returns the smallest items, smallest first."""
+        assert Collection([5, 1, 9, 3, 7]).bottom_k(2).all() == [1, 3]
+
+    def test_bottom_k_with_key(self):
+        """Test bottom_k() with a key, keeping the original order of ties."""
+        rows = Collection(SCORES)
+        assert ids(rows.bottom_k(2, "score")) == [5, 1]
+        assert ids(rows.bottom_k(5, lambda r: -r["score"])) == [2, 4, 3, 1, 5]
+
+    def test_bottom_k_matches_sort(self):
+        """Test that bottom_k() equals a full ascending sort truncated to k."""
+        rows = Collection([{"id": i, "score": (i * 37) % 101} for i in range(500)])
+        assert rows.bottom_k(25, "score") == rows.sort_by("score").take(25)
+
+    def test_invalid_k(self):
+        """Test that a negative k raises ValueError."""
+        with pytest.raises(ValueError, match="k must be a non-negative integer"):
+            Collection([1]).bottom_k(-2)
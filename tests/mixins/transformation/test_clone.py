@@ -1,5 +1,6 @@
 import pytest
 
+from py_collections import SortedCollection
 from py_collections.collection import Collection
 
 
@@ -163,3 +164,55 @@ class TestClone:
         cloned = original.clone()
         assert cloned.all() == [1, 3, 4]
         assert cloned is not original
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda c: c.append(9),
+            lambda c: c.extend([9]),
+            lambda c: c.remove(1),
+            lambda c: c.remove_one(1),
+            lambda c: c.sort_inplace(descending=True),
+        ],
+        ids=["append", "extend", "remove", "remove_one", "sort_inplace"],
+    )
+    def test_clone_copies_on_first_write(self, mutate):
+        """Test that either side copies the shared list before modifying it."""
+        original = Collection([1, 2, 3])
+        cloned = original.clone()
+        mutate(cloned)
+        assert original.all() == [1, 2, 3]
+
+        original = Collection([1, 2, 3])
+        cloned = original.clone()
+        mutate(original)
+        assert cloned.all() == [1, 2, 3]
+
+    def test_clone_of_clone(self):
+        """Test that chains of clones stay independent."""
+        original = Collection([1, 2])
+        first = original.clone()
+        second = first.clone()
+        first.append(3)
+        second.append(4)
+        assert original.all() == [1, 2]
+        assert first.all() == [1, 2, 3]
+        assert second.all() == [1, 2, 4]
+
+    def test_clone_keeps_index_separate(self):
+        """Test that an index on the original does not leak into the clone."""
+        original = Collection([1, 2]).index_by()
+        cloned = original.clone()
+        assert not cloned.has_index()
+        cloned.append(3)
+        assert 3 not in original
+        assert original.after(1) == 2
+
+    def test_clone_of_sorted_collection(self):
+        """Test that a SortedCollection and its clone copy on write."""
+        numbers = SortedCollection([3, 1])
+        cloned = numbers.clone()
+        numbers.insert(2)
+        cloned.append(0)
+        assert numbers.all() == [1, 2, 3]
+        assert cloned.all() == [1, 3, 0]
@@ -0,0 +1,117 @@
+"""Tests for the distinct and unique_by methods in TransformationMixin."""
+
+from dataclasses import dataclass
+
+import pytest
+
+from py_collections import Collection
+
+
+@dataclass
+class Event:
+    id: int
+    payload: dict
+
+
+class TestDistinct:
+    """Test cases for the distinct method."""
+
+    def test_without_arguments(self):
+        """Test that the first occurrence of each item is kept, in order."""
+        assert Collection([3, 1, 3, 2, 1, 3]).distinct().all() == [3, 1, 2]
+
+    def test_empty_collection(self):
+        """Test distinct on an empty collection."""
+        assert Collection([]).distinct().all() == []
+        assert Collection([]).distinct(approximate=True).all() == []
+
+    def test_keeps_first_of_equal_items(self):
+        """Test that equal items of different types keep the first one."""
+        result = Collection([1, 1.0, True, 2]).distinct().all()
+        assert result == [1, 2]
+        assert type(result[0]) is int
+
+    def test_unhashable_items(self):
+        """Test that dicts and lists are compared by structure."""
+        items = Collection([{"a": 1, "b": [2]}, [1], {"b": [2], "a": 1}, [1], 1])
+        assert items.distinct().all() == [{"a": 1, "b": [2]}, [1], 1]
+
+    def test_with_key_string(self):
+        """Test distinct by a key, including dot notation."""
+        rows = Collection(
+            [
+                {"id": 1, "user": {"email": "a@x"}},
+                {"id": 2, "user": {"email": "b@x"}},
+                {"id": 3, "user": {"email": "a@x"}},
+            ]
+        )
+        assert rows.distinct("user.email").pluck("id").all() == [1, 2]
+
+    def test_with_callback_and_attributes(self):
+        """Test distinct by a callback and by an object attribute."""
+        events = Collection([Event(1, {"x": 1}), Event(1, {"x": 2}), Event(2, {})])
+        assert [e.payload for e in events.distinct("id")] == [{"x": 1}, {}]
+        assert len(events.distinct(lambda e: e.payload)) == 3
+
+    def test_missing_key_raises(self):
+        """Test that a missing key raises KeyError."""
+        with pytest.raises(KeyError):
+            Collection([{"id": 1}, {}]).distinct("id")
+
+    def test_returns_new_collection(self):
+        """Test that the original collection is not modified."""
+        original = Collection([1, 1, 2])
+        result = original.distinct()
+        assert result is not original
+        assert original.all() == [1, 1, 2]
+
+    def test_approximate_removes_all_repeats(self):
+        """Test that approximate mode never keeps a repeated value."""
+        items = Collection([i % 1000 for i in range(5000)])
+        result = items.distinct(approximate=True, error_rate=0.001)
+        values = result.all()
+        assert len(values) == len(set(values))
+        assert values == sorted(values)
+
+    def test_approximate_drops_few_new_values(self):
+        """Test that approximate mode keeps nearly every distinct value."""
+        items = Collection([f"id-{i % 20_000}" for i in range(40_000)])
+        result = items.distinct(approximate=True, capacity=20_000, error_rate=0.01)
+        assert 19_500 <= len(result) <= 20_000
+
+    def test_approximate_with_unhashable_keys(self):
+        """Test that approximate mode compares unhashable values by structure."""
+        items = Collection([{"a": [1]}, {"a": [1]}, {"a": [2]}])
+        assert len(items.distinct("a", approximate=True)) == 2
+
+    @pytest.mark.parametrize(
+        ("capacity", "error_rate", "message"),
+        [
+            (0, 0.01, "Capacity must be a positive integer"),
+            (10, 0, "Error rate must be between 0 and 1"),
+            (10, 1.5, "Error rate must be between 0 and 1"),
+        ],
+    )
+    def test_approximate_invalid_parameters(self, capacity, error_rate, message):
+        """Test that invalid Bloom filter parameters raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            Collection([1]).distinct(
+                approximate=True, capacity=capacity, error_rate=error_rate
+            )
+
+
+class TestUniqueBy:
+    """Test cases for the unique_by method."""
+
+    def test_unique_by_key(self):
+        """Test that unique_by keeps the first item per key value."""
+        users = Collection(
+            [{"email": "a", "n": 1}, {"email": "b", "n": 2}, {"email": "a", "n": 3}]
+        )
+        assert users.unique_by("email").pluck("n").all() == [1, 2]
+
+    def test_unique_by_matches_distinct(self):
+        """Test that unique_by is distinct with a required key."""
+        items = Collection([{"k": i % 3} for i in range(10)])
+        assert items.unique_by(lambda d: d["k"]) == items.distinct(lambda d: d["k"])
+        assert items.unique_by("k", approximate=True) == items.distinct("k")
@@ -0,0 +1,94 @@
+"""Tests for the streaming JSON output methods."""
+
+import datetime as dt
+import io
+import json
+
+import pytest
+
+from py_collections import Collection
+
+
+class TestIterJson:
+    def test_chunks_join_to_to_json(self):
+        """Test that the joined chunks equal to_json() for any chunk size."""
+        collection = Collection(
+            [{"id": i, "name": f"user {i}", "tags": {"a"}} for i in range(7)]
+        )
+        for chunk_size in (1, 2, 3, 7, 100):
+            assert "".join(collection.iter_json(chunk_size)) == collection.to_json()
+
+    def test_empty_collection(self):
+        """Test that an empty collection produces an empty JSON array."""
+        assert "".join(Collection().iter_json()) == "[]" == Collection().to_json()
+
+    def test_uses_json_conversion_rules(self):
+        """Test that items are converted like to_dict(mode='json')."""
+        collection = Collection([{1: dt.date(2020, 1, 2)}, "é"])
+        text = "".join(collection.iter_json())
+        assert text == collection.to_json()
+        assert json.loads(text) == [{"1": "2020-01-02"}, "é"]
+
+    def test_number_of_chunks(self):
+        """Test that each chunk covers at most chunk_size items."""
+        chunks = list(Collection(list(range(5))).iter_json(chunk_size=2))
+        assert chunks == ["[0, 1", ", 2, 3", ", 4", "]"]
+
+    def test_is_lazy(self):
+        """Test that items are only converted as chunks are requested."""
+        converted = []
+
+        class Item:
+            def __init__(self, value):
+                self.value = value
+
+            def to_dict(self):
+                converted.append(self.value)
+                return {"value": self.value}
+
+        chunks = Collection([Item(i) for i in range(4)]).iter_json(chunk_size=2)
+        assert converted == []
+        next(chunks)
+        assert converted == [0, 1]
+
+    def test_invalid_chunk_size(self):
+        """Test that a non-positive chunk size raises immediately."""
+        with pytest.raises(ValueError, match="Chunk size must be a positive integer"):
+            Collection([1]).iter_json(chunk_size=0)
+
+
+class TestWriteJson:
+    def test_writes_same_text_as_to_json(self):
+        """Test that the written text equals to_json()."""
+        collection = Collection([{"a": [1, 2]}, None, 3.5])
+        fp = io.StringIO()
+        collection.write_json(fp, chunk_size=2)
+        assert fp.getvalue() == collection.to_json()
+
+    def test_writes_in_chunks(self):
+        """Test that write() is called once per chunk."""
+        writes = []
+
+        class Recorder:
+            def write(self, text):
+                writes.append(text)
+
+        Collection(list(range(4))).write_json(Recorder(), chunk_size=2)
+        assert writes == ["[0, 1", ", 2, 3", "]"]
+
+
+class TestJsonLines:
+    def test_iter_jsonl(self):
+        """Test that each item becomes one JSON line."""
+        lines = list(Collection([{"a": 1}, [1, 2], "x"]).iter_jsonl())
+        assert lines == ['{"a": 1}\n', "[1, 2]\n", '"x"\n']
+
+    def test_to_jsonl_roundtrip(self):
+        """Test that each line of to_jsonl() decodes to the converted item."""
+        collection = Collection([{"when": dt.datetime(2020, 1, 2, 3, 4)}, {"n": 1}])
+        decoded = [json.loads(line) for line in collection.to_jsonl().splitlines()]
+        assert decoded == collection.to_dict(mode="json")
+
+    def test_empty_collection(self):
+        """Test that an empty collection produces no lines."""
+        assert Collection().to_jsonl() == ""
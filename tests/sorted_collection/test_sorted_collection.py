@@ -0,0 +1,196 @@
+import copy
+import pickle
+import random
+
+import pytest
+
+from py_collections import Collection, SortedCollection
+
+EVENTS = [
+    {"id": 1, "ts": 30},
+    {"id": 2, "ts": 10},
+    {"id": 3, "ts": 20},
+    {"id": 4, "ts": 10},
+]
+
+
+def ids(collection):
+    return [event["id"] for event in collection]
+
+
+class TestSortedCollection:
+    """Test cases for SortedCollection."""
+
+    def test_init_sorts_items(self):
+        """Test that items are sorted on construction, ties in original order."""
+        events = SortedCollection(EVENTS, key="ts")
+        assert ids(events) == [2, 4, 3, 1]
+        assert ids(EVENTS) == [1, 2, 3, 4]
+        assert SortedCollection([3, 1, 2]).all() == [1, 2, 3]
+        assert SortedCollection().all() == []
+
+    def test_is_a_collection(self):
+        """Test that the Collection API is available and derived results are plain."""
+        numbers = SortedCollection([4, 1, 3, 2])
+        assert isinstance(numbers, Collection)
+        assert numbers.sum() == 10
+        assert numbers.first(lambda x: x > 2) == 3
+        assert numbers.map(lambda x: -x).all() == [-1, -2, -3, -4]
+        assert type(numbers.filter(lambda x: x % 2)) is Collection
+        assert numbers == Collection([1, 2, 3, 4])
+        assert str(numbers) == "SortedCollection([1, 2, 3, 4])"
+
+    def test_callable_and_dotted_keys(self):
+        """Test ordering by a callable and by a nested key."""
+        words = SortedCollection(["ccc", "a", "bb"], key=len)
+        assert words.all() == ["a", "bb", "ccc"]
+        rows = SortedCollection([{"m": {"v": 2}}, {"m": {"v": 1}}], key="m.v")
+        assert rows.pluck("m.v").all() == [1, 2]
+
+    def test_invalid_key(self):
+        """Test that missing keys and invalid key types raise."""
+        with pytest.raises(KeyError):
+            SortedCollection([{"ts": 1}, {"id": 2}], key="ts")
+        with pytest.raises(TypeError):
+            SortedCollection([1], key=5)
+
+    def test_insert(self):
+        """Test insertion at the sorted position, after equal keys."""
+        events = SortedCollection(EVENTS, key="ts")
+        events.insert({"id": 5, "ts": 10})
+        events.insert({"id": 6, "ts": 40})
+        events.insert({"id": 7, "ts": 0})
+        assert ids(events) == [7, 2, 4, 5, 3, 1, 6]
+        assert events._keys == [0, 10, 10, 10, 20, 30, 40]
+
+    def test_append_inserts_in_order(self):
+        """Test that append() keeps the collection sorted."""
+        numbers = SortedCollection([1, 5])
+        numbers.append(3)
+        assert numbers.all() == [1, 3, 5]
+
+    @pytest.mark.parametrize("batch_size", [3, 50])
+    def test_extend_merges(self, batch_size):
+        """Test that extend() merges small and large batches in key order."""
+        rng = random.Random(batch_size)
+        numbers = SortedCollection([rng.randrange(100) for _ in range(100)])
+        batch = [rng.randrange(100) for _ in range(batch_size)]
+        expected = sorted(numbers.all() + batch)
+        numbers.extend(batch)
+        assert numbers.all() == expected
+        assert numbers._keys == expected
+
+    def test_extend_keeps_existing_items_before_equal_new_ones(self):
+        """Test the order of equal keys after extend()."""
+        events = SortedCollection(EVENTS, key="ts")
+        events.extend(Collection([{"id": 5, "ts": 10}, {"id": 6, "ts": 5}]))
+        assert ids(events) == [6, 2, 4, 5, 3, 1]
+        events.extend([{"id": 7, "ts": 30}])
+        assert ids(events)[-1] == 7
+        events.extend([])
+        assert len(events) == 7
+
+    def test_first_ge_and_last_le(self):
+        """Test key-based lookups of the nearest item."""
+        events = SortedCollection(EVENTS, key="ts")
+        assert events.first_ge(10)["id"] == 2
+        assert events.first_ge(15)["id"] == 3
+        assert events.first_ge(31) is None
+        assert events.last_le(10)["id"] == 4
+        assert events.last_le(29)["id"] == 3
+        assert events.last_le(9) is None
+
+    def test_irange(self):
+        """Test iterating over an inclusive key range."""
+        events = SortedCollection(EVENTS, key="ts")
+        assert ids(events.irange(10, 20)) == [2, 4, 3]
+        assert ids(events.irange(lo=20)) == [3, 1]
+        assert ids(events.irange(hi=15)) == [2, 4]
+        assert ids(events.irange()) == [2, 4, 3, 1]
+        assert list(events.irange(21, 29)) == []
+
+    def test_after_and_before(self):
+        """Test navigation by element and by predicate."""
+        numbers = SortedCollection([5, 1, 3, 3, 9])
+        assert numbers.after(3) == 3
+        assert numbers.before(3) == 1
+        assert numbers.after(9) is None
+        assert numbers.after(4) is None
+        assert numbers.after(lambda x: x > 3) == 9
+        assert 5 in numbers
+        assert 4 not in numbers
+
+    def test_lookup_with_unrelated_target(self):
+        """Test that targets whose key cannot be computed fall back to a scan."""
+        events = SortedCollection(EVENTS, key="ts")
+        assert events.after("not an event") is None
+        assert "ts" not in events
+        assert events.after(EVENTS[2]) == EVENTS[0]
+
+    def test_remove_one(self):
+        """Test removing the first matching element or predicate match."""
+        events = SortedCollection(EVENTS, key="ts")
+        events.remove_one({"id": 4, "ts": 10})
+        assert ids(events) == [2, 3, 1]
+        events.remove_one(lambda event: event["ts"] > 15)
+        assert ids(events) == [2, 1]
+        events.remove_one({"id": 9, "ts": 10})
+        assert events._keys == [10, 30]
+
+    def test_remove(self):
+        """Test removing every match keeps the keys in step."""
+        numbers = SortedCollection([3, 1, 2, 3, 3])
+        numbers.remove(3)
+        assert numbers.all() == [1, 2]
+        numbers.remove(lambda x: x == 1)
+        assert numbers._keys == [2]
+
+    def test_sort_inplace_is_not_supported(self):
+        """Test that the fixed order cannot be changed in place."""
+        numbers = SortedCollection([2, 1])
+        with pytest.raises(TypeError, match="ordered by its key"):
+            numbers.sort_inplace(descending=True)
+        assert numbers.sort_by(descending=True).all() == [2, 1]
+
+    def test_index_stays_consistent(self):
+        """Test that an index is maintained through inserts and removals."""
+        numbers = SortedCollection([1, 4]).index_by()
+        numbers.insert(5)
+        numbers.insert(2)
+        assert numbers.after(2) == 4
+        assert numbers.lookup(5).all() == [5]
+        numbers.remove_one(4)
+        assert numbers.after(2) == 5
+
+    def test_from_iterable(self):
+        """Test that ingestion constructors produce sorted collections."""
+        numbers = SortedCollection.from_iterable(x % 5 for x in range(7))
+        assert isinstance(numbers, SortedCollection)
+        assert numbers.all() == [0, 0, 1, 1, 2, 3, 4]
+        numbers.insert(2)
+        assert numbers.all() == [0, 0, 1, 1, 2, 2, 3, 4]
+
+    def test_copy(self):
+        """Test that copies keep their order and key."""
+        events = SortedCollection(EVENTS, key="ts")
+        duplicate = copy.deepcopy(events)
+        duplicate.insert({"id": 5, "ts": 15})
+        assert ids(duplicate) == [2, 4, 5, 3, 1]
+        assert len(events) == 4
+
+    def test_pickle_round_trip(self):
+        """Test that pickling keeps the items, the key and later insertions."""
+        events = SortedCollection(EVENTS, key="ts").index_by("id")
+        restored = pickle.loads(pickle.dumps(events))
+        assert type(restored) is SortedCollection
+        assert ids(restored) == [2, 4, 3, 1]
+        restored.insert({"id": 5, "ts": 15})
+        assert ids(restored) == [2, 4, 5, 3, 1]
+        assert restored.first_ge(20) == {"id": 3, "ts": 20}
+        assert restored.lookup(5).all() == [{"id": 5, "ts": 15}]
+
+        numbers = pickle.loads(pickle.dumps(SortedCollection([3, 1, 2])))
+        numbers.insert(0)
+        assert numbers.all() == [0, 1, 2, 3]
+        words = pickle.loads(pickle.dumps(SortedCollection(["bb", "a"], key=len)))
+        assert words.last_le(1) == "a"